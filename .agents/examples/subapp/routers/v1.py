@@ -22,7 +22,7 @@ router = fastapi.APIRouter(tags=["Example - Items"])
 @router.post("/example/items", response_model=ItemRead, status_code=201)
 @cache(
     key_prefix="example:item",
-    pattern_to_invalidate_extra=["example:items:*"],
+    tags_to_invalidate=["example:items"],
 )
 async def write_item(
     request: Request,
@@ -39,6 +39,7 @@ async def write_item(
     key_prefix="example:items:items_per_page_{items_per_page}:filters_{filters}:sort_by_{sort_by}:page",
     resource_id_name="page",
     expiration=60,
+    tags=["example:items"],
 )
 async def read_items(
     request: Request,
@@ -73,7 +74,7 @@ async def read_item(
 @cache(
     key_prefix="example:item",
     resource_id_name="item_id",
-    pattern_to_invalidate_extra=["example:items:*"],
+    tags_to_invalidate=["example:items"],
 )
 async def patch_item(
     request: Request,
@@ -89,7 +90,7 @@ async def patch_item(
 @cache(
     key_prefix="example:item",
     resource_id_name="item_id",
-    pattern_to_invalidate_extra=["example:items:*"],
+    tags_to_invalidate=["example:items"],
 )
 async def erase_item(
     request: Request,
@@ -108,7 +109,7 @@ async def erase_item(
 @cache(
     key_prefix="example:item",
     resource_id_name="item_id",
-    pattern_to_invalidate_extra=["example:items:*"],
+    tags_to_invalidate=["example:items"],
 )
 async def erase_db_item(
     request: Request,
@@ -0,0 +1,90 @@
+"""
+Compare cache payload codecs on a realistic ``PaginatedListResponse[PostRead]`` page.
+
+Run from ``backend/``::
+
+    ENVIRONMENT=test python -m benchmarks.bench_cache_codecs
+
+Combinations whose optional package (orjson, msgpack, zstandard, lz4) is not installed
+are skipped.
+"""
+
+# Built-in Dependencies
+from datetime import UTC, datetime
+from statistics import median
+from uuid import uuid4
+import time
+
+# Third-Party Dependencies
+from fastapi.encoders import jsonable_encoder
+
+# Local Dependencies
+from src.apps.blog.posts.schemas import PostRead
+from src.core.common.schemas import PaginatedListResponse
+from src.core.utils.cache_codec import (
+    COMPRESSORS,
+    SERIALIZERS,
+    CacheCodec,
+    CacheEntry,
+    get_compressor,
+    get_serializer,
+)
+
+ITEMS_PER_PAGE = 10
+TEXT_LENGTH = 63_000
+ROUNDS = 50
+
+
+def _build_page() -> dict:
+    words = ("cache", "redis", "latency", "payload", "fastapi", "postgres", "worker")
+    text = " ".join(words[index % len(words)] for index in range(TEXT_LENGTH // 7))
+    posts = [
+        PostRead(
+            id=uuid4(),
+            title=f"Post {index}",
+            text=text[:TEXT_LENGTH],
+            media_url=None,
+            user_id=uuid4(),
+            created_at=datetime.now(UTC),
+        )
+        for index in range(ITEMS_PER_PAGE)
+    ]
+    page = PaginatedListResponse[PostRead](
+        data=posts, total_count=100, has_more=True, page=1, items_per_page=ITEMS_PER_PAGE
+    )
+    return jsonable_encoder(page)
+
+
+def _time(fn) -> float:
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return median(samples) * 1000
+
+
+def main() -> None:
+    payload = _build_page()
+    print(
+        f"{'serializer':<10} {'compressor':<10} {'bytes':>10} {'encode ms':>10} {'decode ms':>10}"
+    )
+    for serializer_name in SERIALIZERS:
+        for compressor_name in COMPRESSORS:
+            try:
+                codec = CacheCodec(
+                    get_serializer(serializer_name), get_compressor(compressor_name), 1024
+                )
+            except ImportError:
+                continue
+            raw = codec.encode(payload)
+            encode_ms = _time(lambda codec=codec: codec.encode(payload))
+            decode_ms = _time(lambda raw=raw: CacheEntry(raw).value)
+            print(
+                f"{serializer_name:<10} {compressor_name:<10} {len(raw):>10} "
+                f"{encode_ms:>10.2f} {decode_ms:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Measure login throughput and event-loop latency during a login storm.
+
+Each "login" is one ``bcrypt.checkpw`` against a stored hash (the part of
+``authenticate_user`` that burns CPU). A probe coroutine sleeps ``PROBE_INTERVAL``
+in a loop and records how late it wakes up, i.e. how long every other request on
+the worker would have stalled. Hashing inline on the loop is compared with
+``PasswordHasher`` pools of a few sizes.
+
+Run from ``backend/``::
+
+    ENVIRONMENT=test python -m benchmarks.bench_login_throughput
+"""
+
+# Built-in Dependencies
+from statistics import median, quantiles
+from typing import Awaitable, Callable, List
+import asyncio
+import time
+
+# Third-Party Dependencies
+import bcrypt
+
+# Local Dependencies
+from src.core.utils.password_hasher import PasswordHasher
+
+PASSWORD = b"Str1ngst!"
+LOGINS = 32
+PROBE_INTERVAL = 0.005
+WORKER_COUNTS = (1, 2, 4)
+
+
+async def _probe(lags: List[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - PROBE_INTERVAL)
+
+
+async def _storm(login: Callable[[], Awaitable[bool]]) -> tuple[float, List[float]]:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    await asyncio.sleep(PROBE_INTERVAL * 2)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(login() for _ in range(LOGINS)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    assert all(results)
+    return LOGINS / elapsed, lags
+
+
+def _report(label: str, logins_per_second: float, lags: List[float]) -> None:
+    lags_ms = [lag * 1000 for lag in lags] or [0.0]
+    p99 = quantiles(lags_ms, n=100, method="inclusive")[98] if len(lags_ms) > 1 else lags_ms[0]
+    print(
+        f"{label:<12} {logins_per_second:>10.1f} {median(lags_ms):>10.2f} "
+        f"{p99:>10.2f} {max(lags_ms):>10.2f}"
+    )
+
+
+async def main() -> None:
+    hashed = bcrypt.hashpw(PASSWORD, bcrypt.gensalt())
+
+    async def inline_login() -> bool:
+        return bcrypt.checkpw(PASSWORD, hashed)
+
+    print(f"{LOGINS} concurrent logins, bcrypt cost {hashed.split(b'$')[2].decode()}")
+    print(f"{'mode':<12} {'logins/s':>10} {'lag p50':>10} {'lag p99':>10} {'lag max':>10}")
+    _report("inline", *await _storm(inline_login))
+
+    for workers in WORKER_COUNTS:
+        hasher = PasswordHasher(max_workers=workers, max_queue=LOGINS)
+
+        async def pooled_login(hasher: PasswordHasher = hasher) -> bool:
+            return await hasher.run(bcrypt.checkpw, PASSWORD, hashed)
+
+        _report(f"pool x{workers}", *await _storm(pooled_login))
+        snapshot = hasher.snapshot()
+        hasher.shutdown()
+        print(f"{'':<12} max queued {snapshot['max_queued']}, rejected {snapshot['rejected']}")
+
+    print("lag columns: ms the event loop was late waking a 5 ms sleep during the storm")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
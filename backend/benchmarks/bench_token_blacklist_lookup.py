@@ -0,0 +1,110 @@
+"""
+Measure blacklist lookup latency against the size of ``system_token_blacklist``.
+
+For each size the table is filled with that many expired revocations plus ``LIVE``
+unexpired ones, then ``LOOKUPS`` existence checks are timed by ``jti`` (what
+``TokenBlacklistCache`` falls back to) and by ``token`` (the lookup before ``jti``
+existed), half hits and half misses. ``purge_expired_token_blacklist`` then runs and
+the lookups are timed again on the purged table.
+
+Writes to the configured database and purges *every* expired revocation in it; run it
+against a migrated development database, from ``backend/``::
+
+    python -m benchmarks.bench_token_blacklist_lookup
+"""
+
+# Built-in Dependencies
+from statistics import median, quantiles
+from typing import Awaitable, Callable, List
+import asyncio
+import random
+import time
+
+# Third-Party Dependencies
+from sqlmodel import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Local Dependencies
+from src.apps.system.auth.repositories import token_blacklist_repository
+from src.apps.system.auth.tasks import _purge_expired_token_blacklist
+from src.core.config import settings
+from src.core.db.session import local_session
+
+SIZES = (10_000, 100_000, 1_000_000)
+LIVE = 1_000
+LOOKUPS = 500
+
+_INSERT = text(
+    """
+    INSERT INTO system_token_blacklist (id, token, jti, expires_at, created_at, updated_at)
+    SELECT gen_random_uuid(), 'bench-token-' || :prefix || n, 'bench-' || :prefix || n,
+           LOCALTIMESTAMP + CAST(:offset AS interval), now(), now()
+    FROM generate_series(1, :rows) AS n
+    """
+)
+_CLEANUP = text("DELETE FROM system_token_blacklist WHERE jti LIKE 'bench-%'")
+
+
+async def _fill(db: AsyncSession, size: int) -> None:
+    await db.exec(_CLEANUP)  # type: ignore
+    await db.exec(_INSERT, params={"prefix": "x", "rows": size, "offset": "-1 day"})  # type: ignore
+    await db.exec(_INSERT, params={"prefix": "l", "rows": LIVE, "offset": "1 day"})  # type: ignore
+    await db.commit()
+    await db.exec(text("ANALYZE system_token_blacklist"))  # type: ignore
+    await db.commit()
+
+
+async def _time(lookup: Callable[[int], Awaitable[bool]]) -> List[float]:
+    latencies: List[float] = []
+    for i in range(LOOKUPS):
+        start = time.perf_counter()
+        await lookup(i)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def _lookups(db: AsyncSession) -> dict[str, List[float]]:
+    def _suffix(i: int) -> str:
+        # Even lookups hit a live revocation, odd ones miss.
+        return f"l{random.randint(1, LIVE)}" if i % 2 == 0 else f"miss{i}"
+
+    async def by_jti(i: int) -> bool:
+        return await token_blacklist_repository.exists(db, jti=f"bench-{_suffix(i)}")
+
+    async def by_token(i: int) -> bool:
+        return await token_blacklist_repository.exists(db, token=f"bench-token-{_suffix(i)}")
+
+    return {"jti": await _time(by_jti), "token": await _time(by_token)}
+
+
+def _report(label: str, latencies: List[float]) -> None:
+    p99 = quantiles(latencies, n=100, method="inclusive")[98]
+    print(f"{label:<26} {median(latencies):>10.3f} {p99:>10.3f} {max(latencies):>10.3f}")
+
+
+async def main() -> None:
+    print(f"{LOOKUPS} lookups per column, {LIVE} live revocations, half of lookups miss")
+    print(f"{'rows / column':<26} {'p50 ms':>10} {'p99 ms':>10} {'max ms':>10}")
+    async with local_session() as db:
+        try:
+            for size in SIZES:
+                await _fill(db, size)
+                for column, latencies in (await _lookups(db)).items():
+                    _report(f"{size + LIVE:>9} / {column}", latencies)
+
+                purge = await _purge_expired_token_blacklist(
+                    batch_size=settings.TOKEN_BLACKLIST_PURGE_BATCH_SIZE, max_batches=size
+                )
+                print(
+                    f"{'':<10} purged {purge['purged']} rows in {purge['batches']} batches, "
+                    f"{purge['seconds']:.3f}s"
+                )
+                for column, latencies in (await _lookups(db)).items():
+                    _report(f"{LIVE:>9} / {column}", latencies)
+        finally:
+            await db.exec(_CLEANUP)  # type: ignore
+            await db.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
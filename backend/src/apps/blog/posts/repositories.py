@@ -7,7 +7,7 @@ from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Local Dependencies
-from src.core.common.repository import RepositoryBase
+from src.core.common.repository import CountMode, RepositoryBase
 from src.apps.blog.posts.models import Post
 from src.apps.blog.posts.schemas import (
     PostCreateInternal,
@@ -61,6 +61,9 @@ class PostRepository(
         limit: int = 100,
         sort_by: List[Tuple[str, str]] | None = None,
         include_tags: bool = True,
+        cursor: str | None = None,
+        keyset: bool = False,
+        count: CountMode = "exact",
         **kwargs: Any,
     ) -> Dict[str, Any]:
         tag_id = kwargs.pop("tag_id", None)
@@ -72,28 +75,28 @@ class PostRepository(
                 limit=limit,
                 sort_by=sort_by,
                 schema_to_select=PostRead,
+                cursor=cursor,
+                keyset=keyset,
+                count=count,
                 **kwargs,
             )
         else:
             stmt = (
-                select(self._model)
+                self.select_columns(PostRead)
                 .join(PostTagAssoc, PostTagAssoc.post_id == self._model.id)
                 .where(PostTagAssoc.tag_id == tag_id)
             )
             stmt = self.apply_filtering(stmt, **kwargs)
-            stmt_without_pagination = stmt
-            stmt = self.apply_sorting(stmt, sort_by)
-            stmt = stmt.offset(offset).limit(limit)
-
-            rows = (await db.exec(stmt)).all()
-            data = [
-                {key: value for key, value in row.__dict__.items() if key != "_sa_instance_state"}
-                for row in rows
-            ]
-            total_count: int = await self.total_count(
-                db=db, stmt_without_pagination=stmt_without_pagination
+            result = await self.paginate(
+                db=db,
+                stmt=stmt,
+                offset=offset,
+                limit=limit,
+                sort_by=sort_by,
+                cursor=cursor,
+                keyset=keyset,
+                count=count,
             )
-            result = {"data": data, "total_count": total_count}
 
         if include_tags:
             await self._attach_tags(db, result["data"])
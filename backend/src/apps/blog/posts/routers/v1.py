@@ -11,9 +11,11 @@ import fastapi
 from src.apps.system.auth.deps import get_current_user, get_current_superuser
 from src.apps.blog.posts.deps import get_post_service, post_filters, post_sort_order
 from src.apps.blog.posts.services import PostService
+from src.apps.system.rate_limits.deps import concurrency_limiter
 from src.core.db.session import async_get_db
 from src.core.utils.cache import cache
 from src.apps.blog.posts.schemas import PostCreate, PostUpdate, PostRead
+from src.core.common.repository import CountMode
 from src.core.common.schemas import PaginatedListResponse
 
 router = fastapi.APIRouter(tags=["Blog - Posts"])
@@ -22,7 +24,7 @@ router = fastapi.APIRouter(tags=["Blog - Posts"])
 @router.post("/blog/posts/user/{user_id}", response_model=PostRead, status_code=201)
 @cache(
     key_prefix="blog:post",
-    pattern_to_invalidate_extra=["blog:posts:user:{user_id}:*"],
+    namespaces_to_invalidate=["blog:posts:user:{user_id}"],
 )
 async def write_post(
     request: Request,
@@ -37,14 +39,23 @@ async def write_post(
     )
 
 
-@router.get("/blog/posts/user/{user_id}", response_model=PaginatedListResponse[PostRead])
+@router.get(
+    "/blog/posts/user/{user_id}",
+    response_model=PaginatedListResponse[PostRead],
+    dependencies=[Depends(concurrency_limiter)],
+)
 @cache(
     key_prefix=(
         "blog:posts:user:{user_id}:items_per_page_{items_per_page}"
-        ":filters_{filters}:sort_by_{sort_by}:page"
+        ":filters_{filters}:sort_by_{sort_by}:cursor_{cursor}:count_{count}:page"
     ),
     resource_id_name="page",
     expiration=60,
+    tags=["blog:posts:user:{user_id}"],
+    namespace="blog:posts:user:{user_id}",
+    lock_timeout=2,
+    stale_ttl=30,
+    raw_response=True,
 )
 async def read_posts(
     request: Request,
@@ -55,6 +66,8 @@ async def read_posts(
     sort_by: Optional[List[Tuple[str, str]]] = Depends(post_sort_order),
     page: int = 1,
     items_per_page: int = 10,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
 ) -> dict:
     return await post_service.get_posts(
         db=db,
@@ -63,11 +76,19 @@ async def read_posts(
         items_per_page=items_per_page,
         filters=filters,
         sort_by=sort_by,
+        cursor=cursor,
+        count=count,
     )
 
 
 @router.get("/blog/posts/{post_id}/user/{user_id}", response_model=PostRead)
-@cache(key_prefix="blog:post", resource_id_name="post_id")
+@cache(
+    key_prefix="blog:post",
+    resource_id_name="post_id",
+    tags=["blog:post:{post_id}"],
+    local_ttl=5,
+    raw_response=True,
+)
 async def read_post(
     request: Request,
     user_id: UUID,
@@ -82,7 +103,8 @@ async def read_post(
 @cache(
     key_prefix="blog:post",
     resource_id_name="post_id",
-    pattern_to_invalidate_extra=["blog:posts:user:{user_id}:*"],
+    tags_to_invalidate=["blog:post:{post_id}"],
+    namespaces_to_invalidate=["blog:posts:user:{user_id}"],
 )
 async def patch_post(
     request: Request,
@@ -102,7 +124,8 @@ async def patch_post(
 @cache(
     key_prefix="blog:post",
     resource_id_name="post_id",
-    pattern_to_invalidate_extra=["blog:posts:user:{user_id}:*"],
+    tags_to_invalidate=["blog:post:{post_id}"],
+    namespaces_to_invalidate=["blog:posts:user:{user_id}"],
 )
 async def erase_post(
     request: Request,
@@ -124,7 +147,8 @@ async def erase_post(
 @cache(
     key_prefix="blog:post",
     resource_id_name="post_id",
-    pattern_to_invalidate_extra=["blog:posts:user:{user_id}:*"],
+    tags_to_invalidate=["blog:post:{post_id}"],
+    namespaces_to_invalidate=["blog:posts:user:{user_id}"],
 )
 async def erase_db_post(
     request: Request,
@@ -30,7 +30,8 @@ from src.core.exceptions.http_exceptions import (
     InternalErrorException,
     UnprocessableEntityException,
 )
-from src.core.utils.api_params import compute_offset, paginated_response
+from src.core.common.repository import CountMode
+from src.core.utils.api_params import compute_offset, cursor_paginated_response
 
 
 class PostService:
@@ -65,14 +66,13 @@ class PostService:
         self, db: AsyncSession, post_id: UUID, tag_ids: List[UUID], with_commit: bool
     ) -> None:
         await self.assoc_repo.db_delete(db=db, with_commit=False, post_id=post_id)
-        last_index = len(tag_ids) - 1
-        for index, tag_id in enumerate(tag_ids):
-            assoc = PostTagAssocCreateInternal(post_id=post_id, tag_id=tag_id)
-            await self.assoc_repo.create(
-                db=db,
-                object=assoc,
-                with_commit=with_commit and index == last_index,
-            )
+        await self.assoc_repo.create_many(
+            db=db,
+            objects=[
+                PostTagAssocCreateInternal(post_id=post_id, tag_id=tag_id) for tag_id in tag_ids
+            ],
+            with_commit=with_commit,
+        )
 
     async def create_post(
         self, db: AsyncSession, user_id: UUID, post: PostCreate, current_user: dict
@@ -114,6 +114,8 @@ class PostService:
         items_per_page: int = 10,
         filters: dict | None = None,
         sort_by: Optional[List[Tuple[str, str]]] = None,
+        cursor: Optional[str] = None,
+        count: CountMode = "exact",
     ) -> dict:
         db_user = await self.user_repo.get(
             db=db, schema_to_select=UserRead, id=user_id, is_deleted=False
@@ -126,11 +128,16 @@ class PostService:
             offset=compute_offset(page, items_per_page),
             limit=items_per_page,
             sort_by=sort_by,
+            cursor=cursor,
+            keyset=True,
+            count=count,
             user_id=db_user["id"],
             is_deleted=False,
             **(filters or {}),
         )
-        return paginated_response(data=posts_data, page=page, items_per_page=items_per_page)
+        return cursor_paginated_response(
+            data=posts_data, items_per_page=items_per_page, page=None if cursor else page
+        )
 
     async def get_post(self, db: AsyncSession, user_id: UUID, post_id: UUID) -> dict:
         db_user = await self.user_repo.get(
@@ -149,7 +149,7 @@ async def test_create_post_writes_row() -> None:
 
     assert result == created
     post_repo.create.assert_awaited_once()
-    assoc_repo.create.assert_awaited_once()
+    assoc_repo.create_many.assert_awaited_once()
     post_repo.get_single_with_main_relations.assert_awaited_once()
 
 
@@ -289,7 +289,7 @@ async def test_update_post_writes_values() -> None:
 
     assert result == {"message": "Post updated"}
     post_repo.update.assert_awaited_once()
-    assoc_repo.create.assert_not_awaited()
+    assoc_repo.create_many.assert_not_awaited()
 
 
 async def test_update_post_replaces_tags() -> None:
@@ -310,7 +310,7 @@ async def test_update_post_replaces_tags() -> None:
 
     assert result == {"message": "Post updated"}
     assoc_repo.db_delete.assert_awaited_once()
-    assoc_repo.create.assert_awaited_once()
+    assoc_repo.create_many.assert_awaited_once()
     post_repo.update.assert_awaited_once()
 
 
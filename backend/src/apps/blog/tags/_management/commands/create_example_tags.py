@@ -1,12 +1,10 @@
 # Built-in Dependencies
 import asyncio
 
-# Third-Party Dependencies
-from sqlmodel import select
-
 # Local Dependencies
 from src.core.db.session import AsyncSession, local_session
-from src.apps.blog.tags.models import Tag
+from src.apps.blog.tags.repositories import tag_repository
+from src.apps.blog.tags.schemas import TagCreateInternal
 
 SEED_TAG_NAMES: tuple[str, ...] = (
     "Python",
@@ -23,17 +21,12 @@ SEED_TAG_NAMES: tuple[str, ...] = (
 
 
 async def create_example_tags(session: AsyncSession) -> None:
-    result = await session.exec(select(Tag))
-    existing_names = {tag.name for tag in result.all()}
-    missing_names = [name for name in SEED_TAG_NAMES if name not in existing_names]
-
-    if not missing_names:
-        return
-
-    for name in missing_names:
-        session.add(Tag(name=name))
-
-    await session.commit()
+    await tag_repository.upsert_many(
+        db=session,
+        objects=[TagCreateInternal(name=name) for name in SEED_TAG_NAMES],
+        conflict_target=["name"],
+        do_nothing=True,
+    )
 
 
 async def main() -> None:
@@ -9,7 +9,7 @@ import fastapi
 
 # Local Dependencies
 from src.apps.system.auth.deps import get_current_user, get_current_superuser
-from src.apps.system.rate_limits.deps import rate_limiter
+from src.apps.system.rate_limits.deps import concurrency_limiter, rate_limiter
 from src.apps.blog.tags.deps import get_tag_service, tag_filters, tag_sort_order
 from src.apps.blog.tags.services import TagService
 from src.core.db.session import async_get_db
@@ -28,7 +28,7 @@ router = fastapi.APIRouter(tags=["Blog - Tags"])
 )
 @cache(
     key_prefix="blog:tag",
-    pattern_to_invalidate_extra=["blog:tags:*"],
+    tags_to_invalidate=["blog:tags"],
 )
 async def write_tag(
     request: Request,
@@ -43,12 +43,13 @@ async def write_tag(
 @router.get(
     "/blog/tags",
     response_model=PaginatedListResponse[TagRead],
-    dependencies=[Depends(rate_limiter)],
+    dependencies=[Depends(rate_limiter), Depends(concurrency_limiter)],
 )
 @cache(
     key_prefix="blog:tags:items_per_page_{items_per_page}:filters_{filters}:sort_by_{sort_by}:page",
     resource_id_name="page",
     expiration=60,
+    tags=["blog:tags"],
 )
 async def read_tags(
     request: Request,
@@ -90,7 +91,9 @@ async def read_tag(
 @cache(
     key_prefix="blog:tag",
     resource_id_name="tag_id",
-    pattern_to_invalidate_extra=["blog:tags:*", "blog:posts:*", "blog:post:*"],
+    tags_to_invalidate=["blog:tags"],
+    # A renamed tag shows up in any user's posts, so this rare write sweeps them all.
+    pattern_to_invalidate_extra=["blog:posts:*", "blog:post:*"],
 )
 async def patch_tag(
     request: Request,
@@ -110,7 +113,7 @@ async def patch_tag(
 @cache(
     key_prefix="blog:tag",
     resource_id_name="tag_id",
-    pattern_to_invalidate_extra=["blog:tags:*"],
+    tags_to_invalidate=["blog:tags"],
 )
 async def erase_tag(
     request: Request,
@@ -129,7 +132,7 @@ async def erase_tag(
 @cache(
     key_prefix="blog:tag",
     resource_id_name="tag_id",
-    pattern_to_invalidate_extra=["blog:tags:*"],
+    tags_to_invalidate=["blog:tags"],
 )
 async def erase_db_tag(
     request: Request,
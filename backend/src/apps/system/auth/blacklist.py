@@ -0,0 +1,181 @@
+# Built-in Dependencies
+from datetime import datetime
+import time
+
+# Third-Party Dependencies
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Local Dependencies
+from src.apps.system.auth.models import TokenBlacklist
+from src.apps.system.auth.repositories import token_blacklist_repository
+from src.apps.system.auth.schemas import TokenBlacklistCreate
+from src.core.config import settings
+from src.core.logger import logger_redis
+from src.core.utils import cache
+from src.core.utils.bloom import BloomFilter
+
+# One key per revoked token, expiring with the token.
+BLACKLIST_KEY = "system:auth:blacklist:{jti}"
+# jti -> token expiry (ms); what a worker rebuilds its filter from.
+BLACKLIST_INDEX_KEY = "system:auth:blacklist:index"
+# jti -> version; lets workers apply only the entries added since their last sync.
+BLACKLIST_LOG_KEY = "system:auth:blacklist:log"
+# Incremented on every revocation.
+BLACKLIST_VERSION_KEY = "system:auth:blacklist:version"
+BLACKLIST_LOG_LENGTH = 10_000
+
+# KEYS: entry, index, log, version. ARGV: jti, ttl (ms), expiry (ms), now (ms), log length.
+_ADD_SCRIPT = """
+local version = redis.call('INCR', KEYS[4])
+redis.call('SET', KEYS[1], '1', 'PX', ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', ARGV[4])
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[1])
+redis.call('ZADD', KEYS[3], version, ARGV[1])
+redis.call('ZREMRANGEBYRANK', KEYS[3], 0, -tonumber(ARGV[5]) - 1)
+return version
+"""
+
+
+class TokenBlacklistCache:
+    """
+    Revoked token lookups by ``jti``, answered in-process for tokens that were never
+    revoked.
+
+    Postgres keeps every revocation durably. Redis holds one key per revoked ``jti``
+    that expires with the token. Each worker keeps a Bloom filter of the revoked
+    ``jti`` values, so the common case (not revoked) needs no I/O. Only filter hits
+    ask Redis, which weeds out the false positives.
+
+    Workers read the shared version stamp at most every ``check_interval`` seconds and
+    apply the revocations logged since their last sync. A token revoked on another
+    worker can therefore be accepted here for up to ``check_interval`` seconds. If
+    Redis is unreachable or lost its data, lookups fall back to Redis and then
+    Postgres, and the Redis entries are restored from Postgres.
+    """
+
+    def __init__(self, check_interval: float, capacity: int, error_rate: float) -> None:
+        self.check_interval = check_interval
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._bloom = BloomFilter(capacity, error_rate)
+        # Last version applied to the filter; None means the filter cannot be trusted.
+        self._version: int | None = None
+        self._checked_at = float("-inf")
+
+    def reset(self) -> None:
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        self._version = None
+        self._checked_at = float("-inf")
+
+    async def _rebuild(self, version: int) -> None:
+        assert cache.client is not None
+        jtis = await cache.client.zrangebyscore(
+            BLACKLIST_INDEX_KEY, int(time.time() * 1000), "+inf"
+        )
+        bloom = BloomFilter(max(self.capacity, 2 * len(jtis)), self.error_rate)
+        # The cache pool returns bytes (``decode_responses=False``).
+        for jti in jtis:
+            bloom.add(jti.decode())
+        self._bloom = bloom
+        self._version = version
+
+    async def _restore(self, db: AsyncSession) -> None:
+        """Copy unexpired revocations from Postgres into a Redis that lost them."""
+        assert cache.client is not None
+        stmt = select(TokenBlacklist.jti, TokenBlacklist.expires_at).where(
+            TokenBlacklist.expires_at > datetime.now(),
+            TokenBlacklist.jti.is_not(None),  # type: ignore[union-attr]
+        )
+        rows = (await db.exec(stmt)).all()
+        for jti, expires_at in rows:
+            await self._add_to_redis(jti, expires_at.timestamp())
+        await cache.client.set(BLACKLIST_VERSION_KEY, 0, nx=True)
+        logger_redis.warning(f"Restored {len(rows)} revoked tokens from Postgres into Redis.")
+
+    async def _sync(self, db: AsyncSession) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        if cache.client is None:
+            self._version = None
+            return
+        try:
+            raw_version = await cache.client.get(BLACKLIST_VERSION_KEY)
+            if raw_version is None:
+                await self._restore(db)
+                raw_version = await cache.client.get(BLACKLIST_VERSION_KEY)
+            version = int(raw_version)
+
+            if (
+                self._version is None
+                or version < self._version
+                or version - self._version > BLACKLIST_LOG_LENGTH
+                or self._bloom.saturated
+            ):
+                await self._rebuild(version)
+            elif version > self._version:
+                entries = await cache.client.zrangebyscore(
+                    BLACKLIST_LOG_KEY, f"({self._version}", "+inf", withscores=True
+                )
+                for jti, entry_version in entries:
+                    self._bloom.add(jti.decode())
+                    version = max(version, int(entry_version))
+                self._version = version
+        except Exception as e:
+            logger_redis.warning(f"Could not sync the token blacklist filter: {e}")
+            self._version = None
+
+    async def _add_to_redis(self, jti: str, expires_at: float) -> None:
+        assert cache.client is not None
+        now = time.time()
+        await cache.client.eval(
+            _ADD_SCRIPT,
+            4,
+            BLACKLIST_KEY.format(jti=jti),
+            BLACKLIST_INDEX_KEY,
+            BLACKLIST_LOG_KEY,
+            BLACKLIST_VERSION_KEY,
+            jti,
+            max(int((expires_at - now) * 1000), 1),
+            int(expires_at * 1000),
+            int(now * 1000),
+            BLACKLIST_LOG_LENGTH,
+        )
+
+    async def is_blacklisted(self, db: AsyncSession, jti: str) -> bool:
+        await self._sync(db)
+        if self._version is not None and jti not in self._bloom:
+            return False
+        if cache.client is not None:
+            try:
+                return bool(await cache.client.exists(BLACKLIST_KEY.format(jti=jti)))
+            except Exception as e:
+                logger_redis.warning(f"Token blacklist lookup fell back to Postgres: {e}")
+        return await token_blacklist_repository.exists(db, jti=jti)
+
+    async def add(self, db: AsyncSession, token: str, jti: str, expires_at: float) -> None:
+        """Revoke ``jti`` until ``expires_at`` (epoch seconds)."""
+        await token_blacklist_repository.create(
+            db,
+            object=TokenBlacklistCreate(
+                token=token, jti=jti, expires_at=datetime.fromtimestamp(expires_at)
+            ),
+        )
+        self._bloom.add(jti)
+        if cache.client is None:
+            return
+        try:
+            await self._add_to_redis(jti, expires_at)
+        except Exception as e:
+            # Postgres has it and this worker's filter too; other workers only see it
+            # once Redis is restored from Postgres.
+            logger_redis.error(f"Could not add revoked token to Redis: {e}")
+
+
+token_blacklist = TokenBlacklistCache(
+    check_interval=settings.TOKEN_BLACKLIST_CHECK_INTERVAL,
+    capacity=settings.TOKEN_BLACKLIST_BLOOM_CAPACITY,
+    error_rate=settings.TOKEN_BLACKLIST_BLOOM_ERROR_RATE,
+)
@@ -1,13 +1,15 @@
 # Built-in Dependencies
-from typing import Annotated, Union, Any
+from typing import Annotated, Any, NamedTuple, Union
 
 # Third-Party Dependencies
 from fastapi import Depends, HTTPException, Request
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Local Dependencies
+from src.apps.system.auth.principal_cache import principal_cache
 from src.apps.system.auth.services import AuthService, auth_service
 from src.apps.system.users.repositories import user_repository
+from src.apps.system.users.schemas import UserPrincipal
 from src.core.db.session import async_get_db
 from src.core.exceptions.http_exceptions import UnauthorizedException, ForbiddenException
 from src.core.logger import logger_api
@@ -18,21 +20,27 @@ async def get_auth_service() -> AuthService:
     return auth_service
 
 
-async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
-) -> Union[dict[str, Any], None]:
-    """
-    Require a valid bearer token and return the authenticated user dict.
+class AuthContext(NamedTuple):
+    """The bearer token a request was authenticated with and the user it resolved to."""
 
-    Use when the handler needs the user but not a session that stamps
-    ``updated_by_user_id`` (for example ``GET /system/users/me/``). For
-    authenticated writes, use ``async_get_user_context_db`` instead of
-    injecting this alongside ``db``.
-    """
+    token: str
+    user: dict[str, Any] | None
+
+
+# Set on the request state by the first auth dependency that verifies the bearer token.
+AUTH_CONTEXT_STATE_KEY = "auth_context"
+
+
+async def _authenticate(token: str, db: AsyncSession) -> dict[str, Any] | None:
     token_data = await verify_token(token, db, expected_type="access")
     if token_data is None:
-        raise UnauthorizedException(detail="User not authenticated.")
+        return None
+
+    # Reuse the user resolved for this token by an earlier request
+    if token_data.jti is not None:
+        principal = await principal_cache.get(token_data.jti)
+        if principal is not None:
+            return principal
 
     # Check if the authentication token represents an email or username and retrieve the user information
     if "@" in token_data.username_or_email:
@@ -44,8 +52,48 @@ async def get_current_user(
             db=db, username=token_data.username_or_email, is_active=True, is_deleted=False
         )
 
+    if user is None:
+        return None
+    # Return the user information without the password hash
+    if token_data.jti is None:
+        return dict(UserPrincipal.model_validate(user))
+    return await principal_cache.set(token_data.jti, user, expires_at=token_data.exp)
+
+
+async def authenticate_request(
+    request: Request, token: str, db: AsyncSession
+) -> dict[str, Any] | None:
+    """
+    Return the user ``token`` authenticates, or None, verifying it once per request.
+
+    The token decode, blacklist check and user lookup run for the first auth
+    dependency of a request; ``get_current_user``, ``get_optional_user`` and
+    everything built on them (``get_current_superuser``, ``async_get_user_context_db``,
+    ``rate_limiter``) reuse the ``AuthContext`` stored on the request state.
+    """
+    state = request.scope.setdefault("state", {})
+    context: AuthContext | None = state.get(AUTH_CONTEXT_STATE_KEY)
+    if context is None or context.token != token:
+        context = AuthContext(token=token, user=await _authenticate(token, db))
+        state[AUTH_CONTEXT_STATE_KEY] = context
+    return context.user
+
+
+async def get_current_user(
+    request: Request,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db: Annotated[AsyncSession, Depends(async_get_db)],
+) -> Union[dict[str, Any], None]:
+    """
+    Require a valid bearer token and return the authenticated user dict.
+
+    Use when the handler needs the user but not a session that stamps
+    ``updated_by_user_id`` (for example ``GET /system/users/me/``). For
+    authenticated writes, use ``async_get_user_context_db`` instead of
+    injecting this alongside ``db``.
+    """
+    user = await authenticate_request(request, token, db)
     if user:
-        # Return the user information if available
         return user
 
     # Raise an exception if the user is not authenticated
@@ -67,19 +115,13 @@ async def get_optional_user(
         return None
 
     try:
-        # Parse the Authorization token and verify it to obtain token data
+        # Parse the Authorization token and verify it to obtain the user
         token_type, _, token_value = token.partition(" ")
         if token_type.lower() != "bearer" or not token_value:
             # Return None if the token is not a bearer token
             return None
 
-        token_data = await verify_token(token_value, db, expected_type="access")
-        if token_data is None:
-            # Return None if token verification fails
-            return None
-
-        # Retrieve the current user information based on the token data
-        return await get_current_user(token_value, db=db)
+        return await authenticate_request(request, token_value, db)
 
     except HTTPException as http_exc:
         if http_exc.status_code != 401:
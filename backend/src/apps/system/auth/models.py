@@ -15,7 +15,15 @@ class TokenBlacklistBase(Base):
         default=None,
         description="Token value for authentication",
     )
+    jti: str | None = Field(
+        index=True,
+        nullable=True,
+        default=None,
+        max_length=36,
+        description="Token ``jti`` claim; blacklist lookups use it",
+    )
     expires_at: datetime = Field(
+        index=True,
         nullable=False,
         default=None,
         description="Timestamp indicating the expiration date and time of the token",
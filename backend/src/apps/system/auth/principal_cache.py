@@ -0,0 +1,98 @@
+# Built-in Dependencies
+from typing import Any, Dict
+from uuid import UUID
+import time
+
+# Local Dependencies
+from src.apps.system.users.schemas import UserPrincipal
+from src.core.config import settings
+from src.core.logger import logger_redis
+from src.core.utils import cache
+from src.core.utils.cache import LocalCache
+
+PRINCIPAL_KEY = "system:auth:principal:{jti}"
+PRINCIPAL_USER_TAG = "system:auth:principal:user:{user_id}"
+
+
+class PrincipalCache:
+    """
+    Authenticated users by access token ``jti``, so repeated requests with the same
+    token skip the user query.
+
+    Each principal is kept in-process for ``local_ttl`` seconds, in its own LRU of
+    ``local_max_entries`` so token bursts and response caching do not evict each
+    other, and in Redis for ``ttl`` seconds, never past the token's own expiry. Both
+    copies are tagged with the user id; ``invalidate_user`` drops them on every worker
+    and must be called whenever a user row changes.
+
+    Principals never carry the password hash. Callers get a fresh dict and may
+    mutate it.
+    """
+
+    def __init__(self, ttl: int, local_ttl: int, local_max_entries: int) -> None:
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self.local = cache.register_local_cache(LocalCache(max_entries=local_max_entries))
+
+    @staticmethod
+    def _user_tags(user_id: Any) -> list[str]:
+        return [PRINCIPAL_USER_TAG.format(user_id=user_id)]
+
+    async def get(self, jti: str) -> Dict[str, Any] | None:
+        if self.ttl <= 0:
+            return None
+        key = PRINCIPAL_KEY.format(jti=jti)
+        local = self.local.get(key)
+        if isinstance(local, dict):
+            return dict(local)
+
+        try:
+            value = await cache.get_value(key)
+        except Exception as e:
+            logger_redis.warning(f"Principal cache lookup failed: {e}")
+            return None
+        if value is None:
+            return None
+
+        principal = dict(UserPrincipal.model_validate(value))
+        self.local.set(
+            key, principal, self.local_ttl, cache.format_tag_keys(self._user_tags(principal["id"]))
+        )
+        return dict(principal)
+
+    async def set(
+        self, jti: str, user: Dict[str, Any], expires_at: float | None = None
+    ) -> Dict[str, Any]:
+        """Cache ``user`` for token ``jti`` and return it as a principal."""
+        principal = dict(UserPrincipal.model_validate(user))
+        ttl = self.ttl
+        if expires_at is not None:
+            ttl = min(ttl, int(expires_at - time.time()))
+        if ttl <= 0:
+            return principal
+
+        key = PRINCIPAL_KEY.format(jti=jti)
+        tags = self._user_tags(principal["id"])
+        self.local.set(key, principal, min(self.local_ttl, ttl), cache.format_tag_keys(tags))
+        if cache.client is not None:
+            try:
+                value = UserPrincipal.model_validate(principal).model_dump(mode="json")
+                await cache.set_value(key, value, ttl, tags)
+            except Exception as e:
+                logger_redis.warning(f"Could not cache principal: {e}")
+        return dict(principal)
+
+    async def invalidate_user(self, user_id: UUID) -> None:
+        """Forget every cached principal of ``user_id``, on every worker."""
+        try:
+            await cache.invalidate_tags(self._user_tags(user_id))
+        except Exception as e:
+            # Stale principals expire on their own within ``ttl`` seconds.
+            logger_redis.error(f"Could not invalidate principals of user {user_id}: {e}")
+
+
+principal_cache = PrincipalCache(
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+    local_ttl=settings.PRINCIPAL_CACHE_LOCAL_TTL,
+    local_max_entries=settings.PRINCIPAL_CACHE_LOCAL_MAX_ENTRIES,
+)
@@ -1,3 +1,10 @@
+# Built-in Dependencies
+from datetime import datetime
+
+# Third-Party Dependencies
+from sqlmodel import delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 # Local Dependencies
 from src.apps.system.auth.schemas import (
     TokenBlacklistCreate,
@@ -6,14 +13,39 @@ from src.apps.system.auth.schemas import (
 from src.apps.system.auth.models import TokenBlacklist
 from src.core.common.repository import RepositoryBase
 
-# Define a Repository interface for the TokenBlacklist model
-TokenBlacklistRepository = RepositoryBase[
-    TokenBlacklist,
-    TokenBlacklistCreate,
-    TokenBlacklistUpdate,
-    TokenBlacklistUpdate,
-    None,
-]
+
+class TokenBlacklistRepository(
+    RepositoryBase[
+        TokenBlacklist,
+        TokenBlacklistCreate,
+        TokenBlacklistUpdate,
+        TokenBlacklistUpdate,
+        None,
+    ]
+):
+    async def purge_expired(self, db: AsyncSession, before: datetime, batch_size: int) -> int:
+        """
+        Delete up to ``batch_size`` tokens that expired before ``before`` and commit.
+
+        The batch is picked oldest first through the ``expires_at`` index and skips rows
+        locked by a concurrent purge, so each call is one short transaction.
+
+        Returns
+        -------
+        int
+            The number of rows deleted; fewer than ``batch_size`` means none are left.
+        """
+        expired = (
+            select(self._model.id)
+            .where(self._model.expires_at < before)
+            .order_by(self._model.expires_at)  # type: ignore[arg-type]
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.exec(delete(self._model).where(self._model.id.in_(expired)))  # type: ignore[attr-defined]
+        await db.commit()
+        return result.rowcount
+
 
 # Create an instance of the TokenBlacklistRepository with the TokenBlacklist model
 token_blacklist_repository = TokenBlacklistRepository(TokenBlacklist)
@@ -1,8 +1,9 @@
 # Built-in Dependencies
-from typing import Annotated, Dict
+from typing import Annotated, Any, Dict
 
 # Third-party Dependencies
 from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.responses import PlainTextResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import Response, Request, Depends
 import fastapi
@@ -13,7 +14,7 @@ from src.apps.system.rate_limits.deps import rate_limiter
 from src.core.db.session import async_get_db
 from src.core.security import oauth2_scheme
 from src.apps.system.auth.services import AuthService
-from src.apps.system.auth.deps import get_auth_service
+from src.apps.system.auth.deps import get_auth_service, get_current_superuser
 
 router = fastapi.APIRouter(tags=["System - Auth"])
 
@@ -61,3 +62,24 @@ async def logout(
     auth_service: AuthService = Depends(get_auth_service),
 ) -> Dict[str, str]:
     return await auth_service.logout(access_token=access_token, response=response, db=db)
+
+
+@router.get(
+    "/system/auth/metrics/password-hashing",
+    dependencies=[Depends(get_current_superuser)],
+)
+async def read_password_hashing_metrics(
+    auth_service: AuthService = Depends(get_auth_service),
+) -> Dict[str, Any]:
+    return auth_service.get_password_hashing_metrics()
+
+
+@router.get(
+    "/system/auth/metrics/password-hashing/prometheus",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(get_current_superuser)],
+)
+async def read_password_hashing_metrics_prometheus(
+    auth_service: AuthService = Depends(get_auth_service),
+) -> str:
+    return auth_service.get_password_hashing_metrics_text()
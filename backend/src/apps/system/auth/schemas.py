@@ -13,6 +13,8 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     username_or_email: str
+    jti: str | None = None
+    exp: float | None = None
 
 
 class TokenBlacklistCreate(TokenBlacklistBase):
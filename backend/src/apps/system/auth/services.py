@@ -1,5 +1,5 @@
 # Built-in Dependencies
-from typing import Dict
+from typing import Any, Dict
 from datetime import timedelta
 
 # Third-party Dependencies
@@ -17,6 +17,7 @@ from src.core.security import (
     create_refresh_token,
     verify_token,
     blacklist_token,
+    password_hasher,
 )
 
 
@@ -78,6 +79,12 @@ class AuthService:
         except InvalidTokenError:
             raise UnauthorizedException(detail="Invalid token.")
 
+    def get_password_hashing_metrics(self) -> Dict[str, Any]:
+        return password_hasher.snapshot()
+
+    def get_password_hashing_metrics_text(self) -> str:
+        return password_hasher.render_prometheus()
+
 
 # Module-level singleton
 auth_service = AuthService()
@@ -0,0 +1,61 @@
+# Built-in Dependencies
+from datetime import datetime
+from typing import Any
+import time
+
+# Local Dependencies
+from src._overrides.celery.async_task import async_task
+from src.apps.system.auth.repositories import token_blacklist_repository
+from src.core.db.session import local_session
+from src.core.logger import logger_worker
+from src.core.config import settings
+from src.worker import app
+
+# Upper bound on batches per run; a larger backlog is finished by the next runs.
+PURGE_MAX_BATCHES = 100
+
+
+async def _purge_expired_token_blacklist(batch_size: int, max_batches: int) -> dict:
+    started = time.perf_counter()
+    # Same clock as the stored ``expires_at`` (naive local time, see ``TokenBlacklistCache``).
+    before = datetime.now()
+    purged = 0
+    batches = 0
+
+    async with local_session() as session:
+        while batches < max_batches:
+            deleted = await token_blacklist_repository.purge_expired(
+                session, before=before, batch_size=batch_size
+            )
+            batches += 1
+            purged += deleted
+            if deleted < batch_size:
+                break
+
+    elapsed = time.perf_counter() - started
+    logger_worker.info(
+        f"[purge_expired_token_blacklist] Purged {purged} expired tokens "
+        f"in {batches} batches ({elapsed:.3f}s)."
+    )
+    return {"purged": purged, "batches": batches, "seconds": round(elapsed, 3)}
+
+
+@async_task(app, name="purge_expired_token_blacklist", bind=True, max_retries=1)
+async def purge_expired_token_blacklist(self: Any) -> dict:
+    """
+    Scheduled cleanup of revoked tokens that have expired.
+
+    An expired token fails signature validation on its own, so its blacklist row is
+    dead weight in every index of ``system_token_blacklist``. Rows are deleted in
+    batches of ``TOKEN_BLACKLIST_PURGE_BATCH_SIZE``, one transaction each, for at most
+    ``PURGE_MAX_BATCHES`` batches per run. Runs every ``TOKEN_BLACKLIST_PURGE_INTERVAL``
+    seconds via Celery Beat.
+
+    Returns
+    -------
+    dict
+        Rows purged, batches run and the seconds the purge took.
+    """
+    return await _purge_expired_token_blacklist(
+        batch_size=settings.TOKEN_BLACKLIST_PURGE_BATCH_SIZE, max_batches=PURGE_MAX_BATCHES
+    )
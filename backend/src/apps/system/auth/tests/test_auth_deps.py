@@ -0,0 +1,125 @@
+# Built-in Dependencies
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+# Third-Party Dependencies
+import pytest
+from fastapi import Depends, FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+# Local Dependencies
+from src.apps.system.auth import deps
+from src.apps.system.auth.deps import (
+    AUTH_CONTEXT_STATE_KEY,
+    async_get_user_context_db,
+    get_current_superuser,
+    get_current_user,
+    get_optional_user,
+)
+from src.apps.system.auth.schemas import TokenData
+from src.core.db.session import async_get_db
+from src.core.exceptions.http_exceptions import UnauthorizedException
+
+pytestmark = pytest.mark.unit
+
+
+def _request(authorization: str | None = None) -> Request:
+    headers = [] if authorization is None else [(b"authorization", authorization.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+def _patched(user: dict | None, token_data: TokenData | None = None):
+    if token_data is None and user is not None:
+        token_data = TokenData(username_or_email=user["username"], jti="jti-1")
+    return (
+        AsyncMock(return_value=token_data),
+        MagicMock(get=AsyncMock(return_value=None), set=AsyncMock(return_value=user)),
+        MagicMock(get=AsyncMock(return_value=user)),
+    )
+
+
+async def test_optional_and_current_user_verify_the_token_once() -> None:
+    user = {"id": uuid4(), "username": "userson", "is_superuser": False}
+    verify, principals, user_repo = _patched(user)
+    request = _request("Bearer token")
+
+    with (
+        patch.object(deps, "verify_token", verify),
+        patch.object(deps, "principal_cache", principals),
+        patch.object(deps, "user_repository", user_repo),
+    ):
+        optional = await get_optional_user(request, db=object())
+        current = await get_current_user(request, "token", db=object())
+
+    assert optional is current is user
+    verify.assert_awaited_once()
+    user_repo.get.assert_awaited_once()
+    assert request.state.auth_context.token == "token"
+
+
+async def test_failed_authentication_is_not_retried_within_a_request() -> None:
+    verify, principals, user_repo = _patched(None)
+    request = _request("Bearer token")
+
+    with (
+        patch.object(deps, "verify_token", verify),
+        patch.object(deps, "principal_cache", principals),
+        patch.object(deps, "user_repository", user_repo),
+    ):
+        assert await get_optional_user(request, db=object()) is None
+        with pytest.raises(UnauthorizedException):
+            await get_current_user(request, "token", db=object())
+
+    verify.assert_awaited_once()
+
+
+async def test_a_different_token_is_verified_again() -> None:
+    user = {"id": uuid4(), "username": "userson", "is_superuser": False}
+    verify, principals, user_repo = _patched(user)
+    request = _request()
+
+    with (
+        patch.object(deps, "verify_token", verify),
+        patch.object(deps, "principal_cache", principals),
+        patch.object(deps, "user_repository", user_repo),
+    ):
+        await get_current_user(request, "token-1", db=object())
+        await get_current_user(request, "token-2", db=object())
+
+    assert verify.await_count == 2
+    assert request.scope["state"][AUTH_CONTEXT_STATE_KEY].token == "token-2"
+
+
+async def test_route_dependencies_share_one_authentication() -> None:
+    user = {"id": uuid4(), "username": "admin", "is_superuser": True}
+    verify, principals, user_repo = _patched(user)
+    app = FastAPI()
+
+    @app.patch("/items", dependencies=[Depends(get_optional_user)])
+    async def patch_item(
+        superuser: dict = Depends(get_current_superuser),
+        db: object = Depends(async_get_user_context_db),
+    ) -> dict:
+        return {"same": getattr(db, "current_user") is superuser}
+
+    class _Session:
+        pass
+
+    async def _db():
+        yield _Session()
+
+    app.dependency_overrides[async_get_db] = _db
+
+    with (
+        patch.object(deps, "verify_token", verify),
+        patch.object(deps, "principal_cache", principals),
+        patch.object(deps, "user_repository", user_repo),
+    ):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.patch("/items", headers={"Authorization": "Bearer token"})
+
+    assert response.status_code == 200
+    assert response.json() == {"same": True}
+    verify.assert_awaited_once()
+    user_repo.get.assert_awaited_once()
@@ -0,0 +1,164 @@
+# Built-in Dependencies
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+import time
+
+# Third-Party Dependencies
+import pytest
+
+# Local Dependencies
+from src.apps.system.auth.blacklist import (
+    BLACKLIST_KEY,
+    BLACKLIST_LOG_KEY,
+    TokenBlacklistCache,
+)
+from src.core.utils import cache as cache_module
+from src.core.utils.bloom import BloomFilter
+
+pytestmark = pytest.mark.unit
+
+MODULE = "src.apps.system.auth.blacklist"
+
+
+def _client(version: str | None = "3", index: list | None = None, log: list | None = None):
+    """Fake cache client; like the real pool (``decode_responses=False``) it returns bytes."""
+    client = MagicMock()
+    client.get = AsyncMock(return_value=None if version is None else version.encode())
+    client.exists = AsyncMock(return_value=1)
+    client.eval = AsyncMock(return_value=1)
+    client.set = AsyncMock()
+
+    async def _zrangebyscore(key, _min, _max, withscores=False):
+        if key == BLACKLIST_LOG_KEY:
+            return [(jti.encode(), score) for jti, score in log or []]
+        return [jti.encode() for jti in index or []]
+
+    client.zrangebyscore = AsyncMock(side_effect=_zrangebyscore)
+    return client
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives() -> None:
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for index in range(1000):
+        bloom.add(f"jti-{index}")
+
+    assert all(f"jti-{index}" in bloom for index in range(1000))
+    false_positives = sum(f"other-{index}" in bloom for index in range(10000))
+    assert false_positives < 300
+    assert bloom.saturated is False
+    bloom.add("one-more")
+    assert bloom.saturated is True
+
+
+def test_bloom_filter_treats_bytes_as_their_text_and_rejects_other_types() -> None:
+    bloom = BloomFilter(capacity=10, error_rate=0.01)
+    bloom.add(b"jti-1")
+
+    assert "jti-1" in bloom
+    assert b"jti-1" in bloom
+    with pytest.raises(TypeError):
+        _ = 1 in bloom
+
+
+async def test_rebuild_loads_revoked_jtis_from_the_bytes_index() -> None:
+    blacklist = TokenBlacklistCache(check_interval=60, capacity=100, error_rate=0.01)
+    client = _client(version="3", index=["revoked-1", "revoked-2"])
+
+    with patch.object(cache_module, "client", client):
+        assert await blacklist.is_blacklisted(MagicMock(), "fresh") is False
+
+    assert blacklist._version == 3
+    assert "revoked-1" in blacklist._bloom and "revoked-2" in blacklist._bloom
+    assert len(blacklist._bloom) == 2
+    client.exists.assert_not_awaited()
+
+
+async def test_is_blacklisted_answers_misses_without_redis() -> None:
+    blacklist = TokenBlacklistCache(check_interval=60, capacity=100, error_rate=0.01)
+    client = _client(index=["revoked"])
+
+    with patch.object(cache_module, "client", client):
+        assert await blacklist.is_blacklisted(MagicMock(), "fresh") is False
+        assert await blacklist.is_blacklisted(MagicMock(), "fresh") is False
+
+    client.get.assert_awaited_once()
+    client.exists.assert_not_awaited()
+
+
+async def test_is_blacklisted_confirms_filter_hits_in_redis() -> None:
+    blacklist = TokenBlacklistCache(check_interval=60, capacity=100, error_rate=0.01)
+    client = _client(index=["revoked"])
+
+    with patch.object(cache_module, "client", client):
+        assert await blacklist.is_blacklisted(MagicMock(), "revoked") is True
+
+    client.exists.assert_awaited_once_with(BLACKLIST_KEY.format(jti="revoked"))
+
+
+async def test_sync_applies_only_new_log_entries() -> None:
+    blacklist = TokenBlacklistCache(check_interval=0, capacity=100, error_rate=0.01)
+    client = _client(version="3")
+
+    with patch.object(cache_module, "client", client):
+        await blacklist.is_blacklisted(MagicMock(), "x")
+        client.get.return_value = b"5"
+        client.zrangebyscore.side_effect = None
+        client.zrangebyscore.return_value = [(b"revoked-4", 4.0), (b"revoked-5", 5.0)]
+        assert await blacklist.is_blacklisted(MagicMock(), "revoked-5") is True
+
+    assert client.zrangebyscore.await_args.args[:3] == (BLACKLIST_LOG_KEY, "(3", "+inf")
+
+
+async def test_is_blacklisted_falls_back_to_postgres_when_redis_fails() -> None:
+    blacklist = TokenBlacklistCache(check_interval=0, capacity=100, error_rate=0.01)
+    client = _client()
+    client.get.side_effect = ConnectionError("down")
+    client.exists.side_effect = ConnectionError("down")
+    repo = MagicMock()
+    repo.exists = AsyncMock(return_value=True)
+
+    with (
+        patch.object(cache_module, "client", client),
+        patch(f"{MODULE}.token_blacklist_repository", repo),
+    ):
+        assert await blacklist.is_blacklisted(MagicMock(), "revoked") is True
+
+    repo.exists.assert_awaited_once()
+    assert repo.exists.await_args.kwargs == {"jti": "revoked"}
+
+
+async def test_sync_restores_redis_from_postgres_when_version_is_missing() -> None:
+    blacklist = TokenBlacklistCache(check_interval=0, capacity=100, error_rate=0.01)
+    client = _client(version=None, index=["revoked"])
+    client.get.side_effect = [None, b"1"]
+    db = MagicMock()
+    result = MagicMock()
+    result.all.return_value = [("revoked", datetime.now() + timedelta(minutes=5))]
+    db.exec = AsyncMock(return_value=result)
+
+    with patch.object(cache_module, "client", client):
+        assert await blacklist.is_blacklisted(db, "revoked") is True
+
+    client.eval.assert_awaited_once()
+    assert client.eval.await_args.args[2] == BLACKLIST_KEY.format(jti="revoked")
+
+
+async def test_add_writes_postgres_redis_and_local_filter() -> None:
+    blacklist = TokenBlacklistCache(check_interval=60, capacity=100, error_rate=0.01)
+    client = _client(index=[])
+    repo = MagicMock()
+    repo.create = AsyncMock()
+    expires_at = time.time() + 600
+
+    with (
+        patch.object(cache_module, "client", client),
+        patch(f"{MODULE}.token_blacklist_repository", repo),
+    ):
+        await blacklist.is_blacklisted(MagicMock(), "warm-up")
+        await blacklist.add(MagicMock(), token="tok", jti="revoked", expires_at=expires_at)
+        assert await blacklist.is_blacklisted(MagicMock(), "revoked") is True
+
+    repo.create.assert_awaited_once()
+    assert repo.create.await_args.kwargs["object"].jti == "revoked"
+    ttl_ms = client.eval.await_args.args[7]
+    assert 590_000 < ttl_ms <= 600_000
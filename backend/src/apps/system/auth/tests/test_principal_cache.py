@@ -0,0 +1,185 @@
+# Built-in Dependencies
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+import json
+import time
+
+# Third-Party Dependencies
+import pytest
+from fastapi import Request
+
+# Local Dependencies
+from src.apps.system.auth import deps
+from src.apps.system.auth.principal_cache import PrincipalCache
+from src.apps.system.auth.schemas import TokenData
+from src.core.utils import cache
+from src.core.utils.cache import LocalCache
+
+pytestmark = pytest.mark.unit
+
+
+def _user(**overrides) -> dict:
+    user = {
+        "id": uuid4(),
+        "name": "User Userson",
+        "username": "userson",
+        "email": "user@tester.com",
+        "profile_image_url": "https://www.profileimageurl.com",
+        "tier_id": None,
+        "is_active": True,
+        "is_superuser": False,
+        "hashed_password": "$2b$12$hash",
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": datetime.now(timezone.utc),
+        "deleted_at": None,
+        "is_deleted": False,
+    }
+    user.update(overrides)
+    return user
+
+
+def _request() -> Request:
+    return Request({"type": "http", "headers": []})
+
+
+@pytest.fixture(autouse=True)
+def registered() -> list[LocalCache]:
+    with (
+        patch.object(cache, "_registered_local_caches", []) as caches,
+        patch.object(cache, "local_cache", LocalCache(max_entries=16)),
+    ):
+        yield caches
+
+
+def _principals(ttl: int = 60) -> PrincipalCache:
+    return PrincipalCache(ttl=ttl, local_ttl=5, local_max_entries=16)
+
+
+async def test_set_returns_principal_without_password_hash() -> None:
+    principals = _principals()
+    user = _user()
+
+    with patch.object(cache, "client", None):
+        principal = await principals.set("jti-1", user, expires_at=time.time() + 900)
+        cached = await principals.get("jti-1")
+
+    assert "hashed_password" not in principal
+    assert cached == principal
+    assert cached is not principal
+    assert cached["id"] == user["id"]
+
+
+async def test_get_restores_types_from_redis() -> None:
+    principals = _principals()
+    user = _user()
+    set_value = AsyncMock()
+
+    with (
+        patch.object(cache, "client", MagicMock()),
+        patch.object(cache, "set_value", set_value),
+    ):
+        await principals.set("jti-1", user, expires_at=time.time() + 30)
+
+    key, stored, ttl, tags = set_value.await_args.args
+    assert key == "system:auth:principal:jti-1"
+    assert stored["id"] == str(user["id"])
+    assert 0 < ttl <= 30
+    assert tags == [f"system:auth:principal:user:{user['id']}"]
+
+    principals.local.clear()
+    with patch.object(cache, "get_value", AsyncMock(return_value=stored)):
+        principal = await principals.get("jti-1")
+
+    assert isinstance(principal["id"], UUID)
+    assert principal["id"] == user["id"]
+    assert principal["created_at"] == user["created_at"]
+    assert len(principals.local) == 1
+
+
+async def test_invalidate_user_evicts_cached_principals() -> None:
+    principals = _principals()
+    user = _user()
+
+    with patch.object(cache, "client", None):
+        await principals.set("jti-1", user)
+        await principals.set("jti-2", user)
+        await principals.set("jti-3", _user())
+        await principals.invalidate_user(user["id"])
+
+        assert await principals.get("jti-1") is None
+        assert await principals.get("jti-2") is None
+        assert await principals.get("jti-3") is not None
+
+
+@pytest.mark.parametrize(("ttl", "expires_in"), [(0, 900), (60, -1)])
+async def test_set_skips_disabled_cache_and_expired_tokens(ttl: int, expires_in: float) -> None:
+    principals = _principals(ttl=ttl)
+
+    with patch.object(cache, "client", None):
+        principal = await principals.set("jti-1", _user(), expires_at=time.time() + expires_in)
+
+    assert "hashed_password" not in principal
+    assert len(principals.local) == 0
+
+
+async def test_principals_have_their_own_local_cache(registered: list[LocalCache]) -> None:
+    principals = _principals()
+    user = _user()
+
+    with patch.object(cache, "client", None):
+        await principals.set("jti-1", user)
+        # Response caching filling its L1 does not evict principals.
+        for index in range(cache.local_cache.max_entries * 2):
+            cache.local_cache.set(f"response-{index}", {}, 60)
+
+        assert await principals.get("jti-1") is not None
+
+    assert registered == [principals.local]
+    assert cache.local_cache.get("system:auth:principal:jti-1") is cache._MISS
+
+
+def test_invalidation_messages_evict_registered_local_caches() -> None:
+    principals = _principals()
+    tag_keys = cache.format_tag_keys([f"system:auth:principal:user:{uuid4()}"])
+    principals.local.set("system:auth:principal:jti-1", {}, 60, tag_keys)
+
+    cache._apply_invalidation_message(json.dumps({"tags": tag_keys}))
+
+    assert len(principals.local) == 0
+
+
+async def test_get_current_user_resolves_cached_principal_without_db() -> None:
+    principal = {"id": uuid4(), "username": "userson", "is_superuser": False}
+    token_data = TokenData(username_or_email="userson", jti="jti-1", exp=time.time() + 900)
+    principals = MagicMock(get=AsyncMock(return_value=principal))
+    user_repo = MagicMock(get=AsyncMock())
+
+    with (
+        patch.object(deps, "verify_token", AsyncMock(return_value=token_data)),
+        patch.object(deps, "principal_cache", principals),
+        patch.object(deps, "user_repository", user_repo),
+    ):
+        result = await deps.get_current_user(_request(), "token", db=object())
+
+    assert result is principal
+    principals.get.assert_awaited_once_with("jti-1")
+    user_repo.get.assert_not_awaited()
+
+
+async def test_get_current_user_caches_user_on_miss() -> None:
+    user = _user()
+    token_data = TokenData(username_or_email="userson", jti="jti-1", exp=time.time() + 900)
+    principals = MagicMock(
+        get=AsyncMock(return_value=None), set=AsyncMock(return_value={"id": user["id"]})
+    )
+    user_repo = MagicMock(get=AsyncMock(return_value=user))
+
+    with (
+        patch.object(deps, "verify_token", AsyncMock(return_value=token_data)),
+        patch.object(deps, "principal_cache", principals),
+        patch.object(deps, "user_repository", user_repo),
+    ):
+        await deps.get_current_user(_request(), "token", db=object())
+
+    principals.set.assert_awaited_once_with("jti-1", user, expires_at=token_data.exp)
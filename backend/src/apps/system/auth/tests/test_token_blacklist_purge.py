@@ -0,0 +1,66 @@
+# Built-in Dependencies
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party Dependencies
+import pytest
+from sqlalchemy.dialects import postgresql
+
+# Local Dependencies
+from src.apps.system.auth.repositories import token_blacklist_repository
+from src.apps.system.auth.tasks import _purge_expired_token_blacklist
+
+pytestmark = pytest.mark.unit
+
+_TASKS = "src.apps.system.auth.tasks"
+
+
+def _session_cm(session: AsyncMock) -> AsyncMock:
+    cm = AsyncMock()
+    cm.__aenter__.return_value = session
+    cm.__aexit__.return_value = False
+    return cm
+
+
+@pytest.mark.parametrize(
+    ("deleted", "max_batches", "purged", "batches"),
+    [
+        ([3], 10, 3, 1),
+        ([5, 5, 2], 10, 12, 3),
+        ([5, 5, 5], 2, 10, 2),
+    ],
+)
+async def test_purge_runs_batches_until_a_short_one_or_the_cap(
+    deleted: list[int], max_batches: int, purged: int, batches: int
+) -> None:
+    purge = AsyncMock(side_effect=deleted)
+
+    with (
+        patch(f"{_TASKS}.local_session", return_value=_session_cm(AsyncMock())),
+        patch.object(token_blacklist_repository, "purge_expired", purge),
+    ):
+        result = await _purge_expired_token_blacklist(batch_size=5, max_batches=max_batches)
+
+    assert result["purged"] == purged
+    assert result["batches"] == batches
+    assert result["seconds"] >= 0
+    assert purge.await_count == batches
+    # Every batch uses the cutoff taken when the run started.
+    assert len({call.kwargs["before"] for call in purge.await_args_list}) == 1
+
+
+async def test_purge_expired_deletes_one_locked_batch_and_commits() -> None:
+    session = AsyncMock()
+    session.exec = AsyncMock(return_value=MagicMock(rowcount=4))
+
+    deleted = await token_blacklist_repository.purge_expired(
+        session, before=datetime(2026, 1, 1), batch_size=4
+    )
+
+    assert deleted == 4
+    session.commit.assert_awaited_once()
+    sql = str(session.exec.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("DELETE FROM system_token_blacklist")
+    assert "expires_at <" in sql
+    assert "LIMIT" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
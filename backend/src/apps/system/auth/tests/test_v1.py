@@ -84,6 +84,18 @@ async def test_auth_logout(client: AsyncClient, settings) -> None:
     assert "max-age=0" in set_cookie
 
 
+async def test_auth_logout_revokes_access_token(client: AsyncClient, settings) -> None:
+    login = await _login(client, settings)
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    assert (await client.get("/api/v1/system/users/me/", headers=headers)).status_code == 200
+
+    response = await client.post("/api/v1/system/auth/logout", headers=headers)
+    assert response.status_code == 200
+
+    response = await client.get("/api/v1/system/users/me/", headers=headers)
+    assert response.status_code == 401
+
+
 async def test_auth_logout_unauthorized(client: AsyncClient) -> None:
     response = await client.post("/api/v1/system/auth/logout")
     assert response.status_code == 401
@@ -104,3 +116,27 @@ async def test_auth_login_rate_limiter_blocks_after_default_limit(
         )
     finally:
         await _clear_login_rate_limit_keys()
+
+
+async def test_password_hashing_metrics_count_logins(
+    client: AsyncClient, admin_headers: dict[str, str]
+) -> None:
+    response = await client.get(
+        "/api/v1/system/auth/metrics/password-hashing", headers=admin_headers
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["completed"] >= 1
+    assert {"queued", "running", "rejected", "wait_seconds"} <= body.keys()
+
+
+async def test_password_hashing_metrics_prometheus_text(
+    client: AsyncClient, admin_headers: dict[str, str]
+) -> None:
+    response = await client.get(
+        "/api/v1/system/auth/metrics/password-hashing/prometheus", headers=admin_headers
+    )
+
+    assert response.status_code == 200
+    assert "password_hash_queued" in response.text
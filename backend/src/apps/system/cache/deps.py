@@ -0,0 +1,6 @@
+# Local Dependencies
+from src.apps.system.cache.services import CacheService, cache_service
+
+
+async def get_cache_service() -> CacheService:
+    return cache_service
@@ -0,0 +1,51 @@
+# Built-in Dependencies
+from typing import Any, Dict
+
+# Third-Party Dependencies
+from fastapi import Depends, Query, Request
+from fastapi.responses import PlainTextResponse
+import fastapi
+
+# Local Dependencies
+from src.apps.system.auth.deps import get_current_superuser
+from src.apps.system.cache.deps import get_cache_service
+from src.apps.system.cache.schemas import CacheUsageRead
+from src.apps.system.cache.services import MAX_SCANNED_KEYS, CacheService
+
+router = fastapi.APIRouter(tags=["System - Cache"])
+
+
+@router.get("/system/cache/metrics", dependencies=[Depends(get_current_superuser)])
+async def read_cache_metrics(
+    request: Request,
+    cache_service: CacheService = Depends(get_cache_service),
+) -> Dict[str, Any]:
+    return cache_service.get_metrics()
+
+
+@router.get(
+    "/system/cache/metrics/prometheus",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(get_current_superuser)],
+)
+async def read_cache_metrics_prometheus(
+    request: Request,
+    cache_service: CacheService = Depends(get_cache_service),
+) -> str:
+    return cache_service.get_metrics_text()
+
+
+@router.get(
+    "/system/cache/prefixes",
+    response_model=CacheUsageRead,
+    dependencies=[Depends(get_current_superuser)],
+)
+async def read_cache_prefixes(
+    request: Request,
+    sample_size: int = Query(100, ge=1, le=1000, description="Keys sampled per prefix"),
+    max_keys: int = Query(
+        MAX_SCANNED_KEYS, ge=1, le=10_000_000, description="Stop scanning after this many keys"
+    ),
+    cache_service: CacheService = Depends(get_cache_service),
+) -> CacheUsageRead:
+    return await cache_service.get_usage(sample_size=sample_size, max_keys=max_keys)
@@ -0,0 +1,28 @@
+# Built-in Dependencies
+from typing import List
+
+# Third-Party Dependencies
+from pydantic import BaseModel, ConfigDict
+
+
+class CachePrefixUsage(BaseModel):
+    """Keys and estimated Redis memory for one cache key prefix."""
+
+    prefix: str
+    pattern: str
+    keys: int
+    sampled_keys: int
+    memory_bytes: int
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class CacheUsageRead(BaseModel):
+    """Result of one SCAN pass over the cache keyspace, grouped by prefix."""
+
+    scanned_keys: int
+    unmatched_keys: int
+    truncated: bool
+    prefixes: List[CachePrefixUsage]
+
+    model_config = ConfigDict(extra="forbid")
@@ -0,0 +1,87 @@
+# Built-in Dependencies
+from typing import Any, Dict, List, Tuple
+import fnmatch
+
+# Local Dependencies
+from src.apps.system.cache.schemas import CachePrefixUsage, CacheUsageRead
+from src.core.exceptions.http_exceptions import ServiceUnavailableException
+from src.core.utils.cache_metrics import INTERNAL_PREFIXES, cache_metrics, prefix_scan_pattern
+from src.core.utils import cache
+
+SCAN_COUNT = 1000
+MAX_SCANNED_KEYS = 100_000
+
+
+class CacheService:
+    def get_metrics(self) -> Dict[str, Any]:
+        return cache_metrics.snapshot()
+
+    def get_metrics_text(self) -> str:
+        return cache_metrics.render_prometheus()
+
+    async def get_usage(self, sample_size: int, max_keys: int = MAX_SCANNED_KEYS) -> CacheUsageRead:
+        """
+        Count keys per prefix in one SCAN pass and estimate their memory from
+        ``MEMORY USAGE`` on up to ``sample_size`` keys per prefix.
+
+        The pass stops after ``max_keys`` keys, so a large keyspace costs a bounded
+        number of round trips; ``truncated`` then marks the counts as partial.
+        """
+        if cache.client is None:
+            raise ServiceUnavailableException(detail="Redis cache client is not initialized.")
+
+        patterns = self._patterns()
+        counts = {prefix: 0 for prefix, _ in patterns}
+        samples: Dict[str, List[bytes]] = {prefix: [] for prefix, _ in patterns}
+        scanned = unmatched = 0
+        truncated = False
+        async for key in cache.client.scan_iter(count=SCAN_COUNT):
+            if scanned >= max_keys:
+                truncated = True
+                break
+            scanned += 1
+            name = key.decode(errors="replace") if isinstance(key, bytes) else key
+            for prefix, pattern in patterns:
+                if fnmatch.fnmatchcase(name, pattern):
+                    counts[prefix] += 1
+                    if len(samples[prefix]) < sample_size:
+                        samples[prefix].append(key)
+                    break
+            else:
+                unmatched += 1
+
+        pipe = cache.client.pipeline(transaction=False)
+        for prefix, _ in patterns:
+            for key in samples[prefix]:
+                pipe.memory_usage(key)
+        sizes = iter(await pipe.execute())
+
+        usage = []
+        for prefix, pattern in patterns:
+            sampled = [next(sizes) or 0 for _ in samples[prefix]]
+            estimate = round(sum(sampled) / len(sampled) * counts[prefix]) if sampled else 0
+            usage.append(
+                CachePrefixUsage(
+                    prefix=prefix,
+                    pattern=pattern,
+                    keys=counts[prefix],
+                    sampled_keys=len(sampled),
+                    memory_bytes=estimate,
+                )
+            )
+        usage.sort(key=lambda item: item.memory_bytes, reverse=True)
+        return CacheUsageRead(
+            scanned_keys=scanned, unmatched_keys=unmatched, truncated=truncated, prefixes=usage
+        )
+
+    def _patterns(self) -> List[Tuple[str, str]]:
+        # Internal keys first, then the most specific templates, so each key counts once.
+        registered = sorted(
+            ((prefix, prefix_scan_pattern(prefix)) for prefix in cache_metrics.prefixes()),
+            key=lambda item: len(item[1].replace("*", "")),
+            reverse=True,
+        )
+        return [(prefix, f"{prefix}:*") for prefix in INTERNAL_PREFIXES] + registered
+
+
+cache_service = CacheService()
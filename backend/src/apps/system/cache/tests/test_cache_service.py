@@ -0,0 +1,82 @@
+# Built-in Dependencies
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party Dependencies
+import pytest
+
+# Local Dependencies
+from src.apps.system.cache.services import CacheService
+from src.core.exceptions.http_exceptions import ServiceUnavailableException
+from src.core.utils.cache_metrics import CacheMetrics
+
+pytestmark = pytest.mark.unit
+
+
+def _client(keys: list[bytes], sizes: list[int]) -> MagicMock:
+    async def scan_iter(count: int):
+        for key in keys:
+            yield key
+
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=sizes)
+    client = MagicMock()
+    client.scan_iter = scan_iter
+    client.pipeline.return_value = pipe
+    return client
+
+
+async def test_get_usage_groups_keys_by_prefix_and_estimates_memory() -> None:
+    metrics = CacheMetrics()
+    metrics.register("blog:post")
+    metrics.register("blog:posts:user:{user_id}:page")
+    keys = [
+        b"blog:post:1",
+        b"blog:post:2",
+        b"blog:post:3",
+        b"blog:posts:user:u1:page:g2:1",
+        b"tag:blog:post",
+        b"other",
+    ]
+    client = _client(keys, sizes=[20, 50, 100, 300])
+
+    with (
+        patch("src.apps.system.cache.services.cache") as cache_module,
+        patch("src.apps.system.cache.services.cache_metrics", metrics),
+    ):
+        cache_module.client = client
+        usage = await CacheService().get_usage(sample_size=2)
+
+    by_prefix = {item.prefix: item for item in usage.prefixes}
+    assert usage.scanned_keys == 6
+    assert usage.unmatched_keys == 1
+    assert usage.truncated is False
+    assert by_prefix["blog:post"].keys == 3
+    assert by_prefix["blog:post"].sampled_keys == 2
+    assert by_prefix["blog:post"].memory_bytes == 600
+    assert by_prefix["blog:posts:user:{user_id}:page"].keys == 1
+    assert by_prefix["tag"].keys == 1
+    assert usage.prefixes[0].prefix == "blog:post"
+
+
+async def test_get_usage_stops_after_max_keys() -> None:
+    metrics = CacheMetrics()
+    metrics.register("blog:post")
+    client = _client([f"blog:post:{i}".encode() for i in range(10)], sizes=[10])
+
+    with (
+        patch("src.apps.system.cache.services.cache") as cache_module,
+        patch("src.apps.system.cache.services.cache_metrics", metrics),
+    ):
+        cache_module.client = client
+        usage = await CacheService().get_usage(sample_size=1, max_keys=4)
+
+    assert usage.scanned_keys == 4
+    assert usage.truncated is True
+    assert {item.prefix: item.keys for item in usage.prefixes}["blog:post"] == 4
+
+
+async def test_get_usage_requires_redis_client() -> None:
+    with patch("src.apps.system.cache.services.cache") as cache_module:
+        cache_module.client = None
+        with pytest.raises(ServiceUnavailableException):
+            await CacheService().get_usage(sample_size=10)
@@ -0,0 +1,54 @@
+# Third-Party Dependencies
+import pytest
+from httpx import AsyncClient
+
+# Local Dependencies
+from tests.helper import _create_regular_user
+
+pytestmark = pytest.mark.integration
+
+
+async def test_cache_metrics_requires_superuser(
+    client: AsyncClient, admin_headers: dict[str, str]
+) -> None:
+    _user_id, user_headers = await _create_regular_user(client, admin_headers)
+
+    response = await client.get("/api/v1/system/cache/metrics", headers=user_headers)
+
+    assert response.status_code == 403
+
+
+async def test_cache_metrics_counts_cached_reads(
+    client: AsyncClient, admin_headers: dict[str, str]
+) -> None:
+    response = await client.get("/api/v1/blog/tags", headers=admin_headers)
+    assert response.status_code == 200
+
+    response = await client.get("/api/v1/system/cache/metrics", headers=admin_headers)
+
+    assert response.status_code == 200
+    assert any(stats["hits"] + stats["misses"] > 0 for stats in response.json().values())
+
+
+async def test_cache_metrics_prometheus_text(
+    client: AsyncClient, admin_headers: dict[str, str]
+) -> None:
+    response = await client.get("/api/v1/system/cache/metrics/prometheus", headers=admin_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE cache_hits_total counter" in response.text
+
+
+async def test_cache_prefixes_lists_registered_prefixes(
+    client: AsyncClient, admin_headers: dict[str, str]
+) -> None:
+    response = await client.get(
+        "/api/v1/system/cache/prefixes", params={"sample_size": 5}, headers=admin_headers
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert {"tag", "gen", "lock", "blog:post"} <= {item["prefix"] for item in body["prefixes"]}
+    assert body["scanned_keys"] >= 0
+    assert body["truncated"] is False
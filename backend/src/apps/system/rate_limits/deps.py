@@ -1,5 +1,5 @@
 # Built-in Dependencies
-from typing import Annotated, Optional, List, Tuple
+from typing import Annotated, AsyncGenerator, Optional, List, Tuple
 
 # Third-Party Dependencies
 from fastapi import Depends, Query, Request
@@ -7,19 +7,21 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Local Dependencies
 from src.apps.system.auth.deps import get_optional_user
-from src.apps.system.rate_limits.repositories import rate_limit_repository
-from src.apps.system.rate_limits.schemas import RateLimitRead
 from src.apps.system.rate_limits.services import RateLimitService, rate_limit_service
-from src.apps.system.tiers.repositories import tier_repository
+from src.apps.system.rate_limits.rule_cache import CompiledTier, tier_rule_cache
 from src.core.config import settings
 from src.core.db.session import async_get_db
 from src.core.exceptions.http_exceptions import RateLimitException
+from src.core.middlewares.rate_limit_middleware import CHECKED_STATE_KEY, RESULT_STATE_KEY
 from src.core.logger import logger_api
 from src.core.utils.api_params import parse_sort_order
 from src.core.utils.rate_limit import (
+    acquire_concurrency_lease,
+    release_concurrency_lease,
     caller_identifier,
-    is_rate_limited,
-    match_longest_prefix,
+    check_rate_limit,
+    rate_limit_headers,
+    request_cost,
     request_route_template,
     sanitize_path,
 )
@@ -27,12 +29,24 @@ from src.core.utils.rate_limit import (
 # Default rate limit settings from configuration
 DEFAULT_LIMIT = settings.DEFAULT_RATE_LIMIT_LIMIT
 DEFAULT_PERIOD = settings.DEFAULT_RATE_LIMIT_PERIOD
+DEFAULT_MAX_CONCURRENCY = settings.DEFAULT_RATE_LIMIT_MAX_CONCURRENCY
 
 
 async def get_rate_limit_service() -> RateLimitService:
     return rate_limit_service
 
 
+async def _caller_rule(
+    request: Request, db: AsyncSession, user: dict | None, route_template: str
+) -> Tuple[str | None, CompiledTier | None, dict | None]:
+    """The caller's Redis identity, their compiled tier and the rule matching the route."""
+    if not user:
+        return caller_identifier(request, settings.TRUST_PROXY_HEADERS), None, None
+    tier = await tier_rule_cache.get_tier(db=db, tier_id=user["tier_id"])
+    matched = tier.rules.match(route_template) if tier else None
+    return str(user["id"]), tier, matched
+
+
 async def rate_limiter(
     request: Request,
     db: Annotated[AsyncSession, Depends(async_get_db)],
@@ -56,54 +70,116 @@ async def rate_limiter(
 
     Authenticated callers are keyed by user id. Unauthenticated callers use the
     client IP, or the first ``X-Forwarded-For`` / ``X-Real-IP`` hop when
-    ``TRUST_PROXY_HEADERS`` is enabled.
+    ``TRUST_PROXY_HEADERS`` is enabled. Anonymous requests already counted by
+    ``RateLimitMiddleware`` are not counted again.
 
     Configured rules for the user's tier are matched with longest-prefix against
     the sanitized **route template** (path parameters stay as ``{param}``). If no
-    rule matches, the default limit and period from settings apply.
-
-    Limits are stored in Redis using a fixed-window key. When the request count
-    exceeds the configured limit, a `RateLimitException` is raised (HTTP 429).
+    rule matches, the default limit and period from settings apply. Rules come from
+    ``tier_rule_cache``, so the database is only read when a tier's rules change.
+
+    Counters are kept in Redis using ``RATE_LIMIT_ALGORITHM``. A request consumes the
+    matched rule's ``cost`` (see ``request_cost``), so a rule can charge a large page
+    or upload more than a small read. When the request count exceeds the configured
+    limit, a `RateLimitException` is raised (HTTP 429) with ``Retry-After``; every
+    limited response carries ``X-RateLimit-*`` headers.
+
+    The caller comes from ``get_optional_user``, which shares the request's auth
+    context with ``get_current_user``: the bearer token is verified once per request
+    however many of these dependencies a route uses.
     """
+    if not user and request.scope.get("state", {}).get(CHECKED_STATE_KEY):
+        # Already counted by RateLimitMiddleware before routing.
+        return
+
     route_template = sanitize_path(request_route_template(request))
     redis_path = route_template
     limit, period = DEFAULT_LIMIT, DEFAULT_PERIOD
-
-    if user:
-        user_id = str(user["id"])
-        tier = await tier_repository.get(db=db, id=user["tier_id"])
-        if tier:
-            rules = await rate_limit_repository.get_all(
-                db=db, schema_to_select=RateLimitRead, tier_id=tier["id"]
-            )
-            matched = match_longest_prefix(route_template, list(rules))
-            if matched:
-                limit, period = matched["limit"], matched["period"]
-                redis_path = matched["path"]
-            else:
-                logger_api.warning(
-                    f"User {user_id} with tier '{tier['name']}' has no specific rate limit "
-                    f"for path '{route_template}'. Applying default rate limit."
-                )
-        else:
-            logger_api.warning(f"User {user_id} has no assigned tier. Applying default rate limit.")
-    else:
-        user_id = caller_identifier(request, settings.TRUST_PROXY_HEADERS)
-        if user_id is None:
-            logger_api.warning(
-                "Rate limiter skipped: could not identify an unauthenticated caller."
-            )
-            return
-
-    is_limited = await is_rate_limited(
+    local_batch = settings.DEFAULT_RATE_LIMIT_LOCAL_BATCH
+
+    user_id, tier, matched = await _caller_rule(request, db, user, route_template)
+    if user_id is None:
+        logger_api.warning("Rate limiter skipped: could not identify an unauthenticated caller.")
+        return
+    if matched:
+        limit, period = matched["limit"], matched["period"]
+        local_batch = matched.get("local_batch", 0)
+        redis_path = matched["path"]
+    elif tier:
+        logger_api.warning(
+            f"User {user_id} with tier '{tier.name}' has no specific rate limit "
+            f"for path '{route_template}'. Applying default rate limit."
+        )
+    elif user:
+        logger_api.warning(f"User {user_id} has no assigned tier. Applying default rate limit.")
+
+    result = await check_rate_limit(
         app=request.app,
         user_id=user_id,
         path=redis_path,
         limit=limit,
         period=period,
+        algorithm=settings.RATE_LIMIT_ALGORITHM,
+        local_batch=local_batch,
+        cost=request_cost(request, matched),
+    )
+    if result is None:
+        return
+    # RateLimitMiddleware copies these onto the response as X-RateLimit-* headers.
+    request.scope.setdefault("state", {})[RESULT_STATE_KEY] = result
+    if not result.allowed:
+        raise RateLimitException(detail="Rate limit exceeded.", headers=rate_limit_headers(result))
+
+
+async def concurrency_limiter(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(async_get_db)],
+    user: dict | None = Depends(get_optional_user),
+) -> AsyncGenerator[None, None]:
+    """
+    Cap the caller's simultaneous in-flight requests on an expensive route.
+
+    Add it next to ``rate_limiter`` on routes that can hold a database connection for
+    long (large list pages, exports):
+
+    ```python
+    @router.get(
+        "/blog/tags",
+        dependencies=[Depends(rate_limiter), Depends(concurrency_limiter)],
+    )
+    ```
+
+    The cap is the matched tier rule's ``max_concurrency`` (the rule path is the key,
+    as for ``rate_limiter``), else ``DEFAULT_RATE_LIMIT_MAX_CONCURRENCY``; ``0`` means
+    no cap. A slot is held until the request finishes; when none is free a
+    `RateLimitException` is raised (HTTP 429).
+    """
+    route_template = sanitize_path(request_route_template(request))
+    user_id, _tier, matched = await _caller_rule(request, db, user, route_template)
+    max_concurrency = DEFAULT_MAX_CONCURRENCY
+    redis_path = route_template
+    if matched:
+        max_concurrency = matched.get("max_concurrency", 0)
+        redis_path = matched["path"]
+
+    if user_id is None or max_concurrency <= 0:
+        yield
+        return
+
+    lease = await acquire_concurrency_lease(
+        user_id=user_id,
+        path=redis_path,
+        max_concurrency=max_concurrency,
+        lease_ttl=settings.RATE_LIMIT_LEASE_TTL,
     )
-    if is_limited:
-        raise RateLimitException(detail="Rate limit exceeded.")
+    if lease is None:
+        raise RateLimitException(
+            detail="Too many concurrent requests.", headers={"Retry-After": "1"}
+        )
+    try:
+        yield
+    finally:
+        await release_concurrency_lease(lease)
 
 
 def rate_limit_filters(
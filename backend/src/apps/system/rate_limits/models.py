@@ -2,11 +2,12 @@
 from uuid import UUID
 
 # Third-Party Dependencies
-from sqlmodel import Field
+from sqlmodel import AutoString, Field, text
 from sqlalchemy import UniqueConstraint
 
 # Local Dependencies
 from src.core.common.models import TimestampMixin, UUIDMixin, Base
+from src.core.common.enums import RateLimitCostBasis
 
 
 class RateLimitNameBase(Base):
@@ -37,6 +38,43 @@ class RateLimitConfigBase(Base):
         description="Time period (in seconds) during which the limit applies",
         schema_extra={"examples": [60]},
     )
+    cost: int = Field(
+        default=1,
+        ge=1,
+        sa_column_kwargs={"server_default": text("1")},
+        description=(
+            "Units one request consumes from the limit; multiplied by items_per_page or "
+            "the body size in KiB depending on cost_basis"
+        ),
+        schema_extra={"examples": [1]},
+    )
+    cost_basis: RateLimitCostBasis = Field(
+        default=RateLimitCostBasis.fixed,
+        sa_type=AutoString(length=20),
+        sa_column_kwargs={"server_default": RateLimitCostBasis.fixed.value},
+        description="fixed, items_per_page or body_kib",
+        schema_extra={"examples": ["fixed"]},
+    )
+    local_batch: int = Field(
+        default=0,
+        ge=0,
+        sa_column_kwargs={"server_default": text("0")},
+        description=(
+            "Requests each worker may admit from memory between Redis syncs (0 = exact). "
+            "The limit can be exceeded by at most this many requests per worker"
+        ),
+        schema_extra={"examples": [0]},
+    )
+    max_concurrency: int = Field(
+        default=0,
+        ge=0,
+        sa_column_kwargs={"server_default": text("0")},
+        description=(
+            "Simultaneous in-flight requests allowed on routes using concurrency_limiter "
+            "(0 = no cap)"
+        ),
+        schema_extra={"examples": [0]},
+    )
 
 
 class RateLimitRelationshipBase(Base):
@@ -8,7 +8,7 @@ from fastapi import Request, Depends
 import fastapi
 
 # Local Dependencies
-from src.apps.system.auth.deps import get_current_superuser
+from src.apps.system.auth.deps import get_current_superuser, get_current_user
 from src.apps.system.rate_limits.deps import (
     get_rate_limit_service,
     rate_limit_filters,
@@ -16,7 +16,12 @@ from src.apps.system.rate_limits.deps import (
 )
 from src.core.db.session import async_get_db
 from src.apps.system.rate_limits.services import RateLimitService
-from src.apps.system.rate_limits.schemas import RateLimitCreate, RateLimitUpdate, RateLimitRead
+from src.apps.system.rate_limits.schemas import (
+    RateLimitCreate,
+    RateLimitUpdate,
+    RateLimitUsage,
+    RateLimitRead,
+)
 from src.core.common.schemas import PaginatedListResponse
 
 router = fastapi.APIRouter(tags=["System - Rate Limits"])
@@ -64,6 +69,16 @@ async def read_rate_limits(
     )
 
 
+@router.get("/system/rate-limits/usage/me", response_model=List[RateLimitUsage])
+async def read_my_rate_limit_usage(
+    request: Request,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(async_get_db)],
+    rate_limit_service: RateLimitService = Depends(get_rate_limit_service),
+) -> List[RateLimitUsage]:
+    return await rate_limit_service.get_usage(db=db, user=current_user)
+
+
 @router.get(
     "/system/rate-limits/{rate_limit_id}/tier/{tier_id}",
     dependencies=[Depends(get_current_superuser)],
@@ -0,0 +1,94 @@
+# Built-in Dependencies
+from typing import Dict, NamedTuple
+from uuid import UUID
+import time
+
+# Third-Party Dependencies
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Local Dependencies
+from src.apps.system.rate_limits.repositories import rate_limit_repository
+from src.apps.system.rate_limits.schemas import RateLimitRead
+from src.apps.system.tiers.repositories import tier_repository
+from src.core.utils.rate_limit import RuleTrie
+from src.core.logger import logger_redis
+from src.core.config import settings
+from src.core.utils import rate_limit
+
+# Bumped on every tier or rate limit write; workers drop their compiled rules when it changes.
+RULES_VERSION_KEY = "ratelimit:rules:version"
+
+
+class CompiledTier(NamedTuple):
+    name: str
+    rules: RuleTrie
+
+
+class TierRuleCache:
+    """
+    Per-process compiled rate limit rules, keyed by tier id.
+
+    A tier is loaded from Postgres the first time a request needs it; after that the
+    limiter only reads memory. Writes go through ``invalidate``, which bumps the shared
+    version stamp in the rate limit Redis. Other workers notice within
+    ``check_interval`` seconds and reload lazily.
+    """
+
+    def __init__(self, check_interval: float) -> None:
+        self.check_interval = check_interval
+        self._tiers: Dict[str, CompiledTier | None] = {}
+        self._version: str | None = None
+        self._checked_at = float("-inf")
+        # Incremented on every clear so a load that raced an invalidation is not stored.
+        self._epoch = 0
+
+    def clear(self) -> None:
+        self._tiers.clear()
+        self._epoch += 1
+
+    async def _sync_version(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval or rate_limit.client is None:
+            return
+        self._checked_at = now
+        try:
+            version = await rate_limit.client.get(RULES_VERSION_KEY)
+        except Exception as e:
+            # Keep serving the compiled rules; they are at most one write behind.
+            logger_redis.warning(f"Could not read rate limit rules version: {e}")
+            return
+        if version != self._version:
+            self._version = version
+            self.clear()
+
+    async def get_tier(self, db: AsyncSession, tier_id: UUID | str) -> CompiledTier | None:
+        """Compiled rules for ``tier_id``, or ``None`` if the tier does not exist."""
+        await self._sync_version()
+        key = str(tier_id)
+        if key in self._tiers:
+            return self._tiers[key]
+
+        epoch = self._epoch
+        compiled: CompiledTier | None = None
+        tier = await tier_repository.get(db=db, id=tier_id)
+        if tier:
+            rules = await rate_limit_repository.get_all(
+                db=db, schema_to_select=RateLimitRead, tier_id=tier["id"]
+            )
+            compiled = CompiledTier(name=tier["name"], rules=RuleTrie(list(rules)))
+        if epoch == self._epoch:
+            self._tiers[key] = compiled
+        return compiled
+
+    async def invalidate(self) -> None:
+        """Drop this worker's rules now and tell the others through the version stamp."""
+        self.clear()
+        if rate_limit.client is None:
+            return
+        try:
+            self._version = str(await rate_limit.client.incr(RULES_VERSION_KEY))
+        except Exception as e:
+            logger_redis.error(f"Could not bump rate limit rules version: {e}")
+
+
+tier_rule_cache = TierRuleCache(check_interval=settings.RATE_LIMIT_RULES_CHECK_INTERVAL)
@@ -3,6 +3,7 @@ from datetime import datetime
 
 # Third-Party Dependencies
 from pydantic import ConfigDict, field_validator
+from sqlmodel import Field
 
 # Local Dependencies
 from src.core.common.models import Base, UUIDMixin, TimestampMixin
@@ -48,3 +49,15 @@ class RateLimitUpdateInternal(RateLimitUpdate):
 
 class RateLimitDelete(Base):
     pass
+
+
+class RateLimitUsage(Base):
+    """Quota left under one rule, as the next request would see it."""
+
+    name: str
+    path: str
+    limit: int
+    period: int
+    remaining: int
+    reset_after: float = Field(description="Seconds until the quota is fully restored")
+    retry_after: float = Field(description="Seconds until a request is allowed (0 = now)")
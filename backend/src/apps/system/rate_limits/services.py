@@ -9,8 +9,10 @@ from fastapi import FastAPI
 
 # Local Dependencies
 from src.apps.system.rate_limits.repositories import RateLimitRepository, rate_limit_repository
+from src.apps.system.rate_limits.rule_cache import tier_rule_cache
 from src.apps.system.tiers.repositories import TierRepository, tier_repository
-from src.core.utils.rate_limit import is_valid_path
+from src.core.utils.rate_limit import get_rate_limit_usage, is_valid_path
+from src.core.config import settings
 from src.core.exceptions.http_exceptions import (
     UnprocessableEntityException,
     DuplicateValueException,
@@ -22,6 +24,7 @@ from src.apps.system.rate_limits.schemas import (
     RateLimitCreateInternal,
     RateLimitCreate,
     RateLimitUpdate,
+    RateLimitUsage,
     RateLimitRead,
 )
 from src.core.utils.api_params import compute_offset, paginated_response
@@ -58,7 +61,9 @@ class RateLimitService:
             raise DuplicateValueException(detail="Rate Limit Name not available")
 
         rate_limit_internal = RateLimitCreateInternal(**rate_limit_internal_dict)
-        return await self.rate_limit_repo.create(db=db, object=rate_limit_internal)
+        db_rate_limit = await self.rate_limit_repo.create(db=db, object=rate_limit_internal)
+        await tier_rule_cache.invalidate()
+        return db_rate_limit
 
     async def get_rate_limits(
         self,
@@ -97,6 +102,31 @@ class RateLimitService:
 
         return db_rate_limit
 
+    async def get_usage(self, db: AsyncSession, user: dict) -> List[RateLimitUsage]:
+        """The user's remaining quota under every rule of their tier (one Redis MGET)."""
+        if user.get("tier_id") is None:
+            return []
+        rules = list(
+            await self.rate_limit_repo.get_all(
+                db=db, schema_to_select=RateLimitRead, tier_id=user["tier_id"]
+            )
+        )
+        usage = await get_rate_limit_usage(
+            user_id=str(user["id"]), rules=rules, algorithm=settings.RATE_LIMIT_ALGORITHM
+        )
+        return [
+            RateLimitUsage(
+                name=rule["name"],
+                path=rule["path"],
+                limit=result.limit,
+                period=rule["period"],
+                remaining=result.remaining,
+                reset_after=result.reset_after,
+                retry_after=result.retry_after,
+            )
+            for rule, result in zip(rules, usage, strict=True)
+        ]
+
     async def update_rate_limit(
         self,
         db: AsyncSession,
@@ -136,6 +166,7 @@ class RateLimitService:
                 raise DuplicateValueException(detail="There is already a rate limit with this name")
 
         await self.rate_limit_repo.update(db=db, object=values, id=rate_limit_id)
+        await tier_rule_cache.invalidate()
         return {"message": "Rate Limit updated"}
 
     async def db_delete_rate_limit(
@@ -160,6 +191,7 @@ class RateLimitService:
                 detail="An unexpected error occurred. Please try again later or contact support if the problem persists."
             )
 
+        await tier_rule_cache.invalidate()
         return {"message": "Rate Limit deleted from the database"}
 
 
@@ -10,6 +10,7 @@ from sqlalchemy.exc import IntegrityError
 # Local Dependencies
 from src.apps.system.rate_limits.schemas import RateLimitCreate, RateLimitUpdate
 from src.apps.system.rate_limits.services import RateLimitService
+from src.core.utils.rate_limit import RateLimitResult
 from src.core.exceptions.http_exceptions import (
     DuplicateValueException,
     ForbiddenException,
@@ -394,3 +395,34 @@ async def test_db_delete_rate_limit_hard_deletes() -> None:
 
     assert result == {"message": "Rate Limit deleted from the database"}
     rate_limit_repo.db_delete.assert_awaited_once()
+
+
+async def test_get_usage_reads_every_tier_rule() -> None:
+    tier_id, user_id = uuid4(), uuid4()
+    service, rate_limit_repo, _ = _service()
+    rate_limit_repo.get_all.return_value = [
+        {"name": "tasks", "path": "api_v1_system_tasks", "limit": 5, "period": 60},
+        {"name": "users", "path": "api_v1_system_users", "limit": 10, "period": 3600},
+    ]
+    usage = [RateLimitResult(True, 5, 3, 12.0, 0.0), RateLimitResult(False, 10, 0, 99.5, 99.5)]
+
+    with patch(
+        "src.apps.system.rate_limits.services.get_rate_limit_usage",
+        new_callable=AsyncMock,
+        return_value=usage,
+    ) as get_usage:
+        result = await service.get_usage(db=object(), user={"id": user_id, "tier_id": tier_id})
+
+    assert [(item.name, item.remaining, item.retry_after) for item in result] == [
+        ("tasks", 3, 0.0),
+        ("users", 0, 99.5),
+    ]
+    assert get_usage.await_args.kwargs["user_id"] == str(user_id)
+    rate_limit_repo.get_all.assert_awaited_once()
+
+
+async def test_get_usage_is_empty_without_tier() -> None:
+    service, rate_limit_repo, _ = _service()
+
+    assert await service.get_usage(db=object(), user={"id": uuid4(), "tier_id": None}) == []
+    rate_limit_repo.get_all.assert_not_awaited()
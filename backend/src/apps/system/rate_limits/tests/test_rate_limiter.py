@@ -8,7 +8,10 @@ import pytest
 from fastapi import FastAPI
 
 # Local Dependencies
-from src.apps.system.rate_limits.deps import rate_limiter
+from src.apps.system.rate_limits.deps import concurrency_limiter, rate_limiter
+from src.apps.system.rate_limits.rule_cache import CompiledTier, TierRuleCache
+from src.core.middlewares.rate_limit_middleware import CHECKED_STATE_KEY, RESULT_STATE_KEY
+from src.core.utils.rate_limit import RateLimitResult, RuleTrie
 from src.core.exceptions.http_exceptions import RateLimitException
 
 pytestmark = pytest.mark.unit
@@ -24,12 +27,13 @@ async def test_rate_limiter_matches_longest_prefix_for_redis_key() -> None:
     parent_rule = {"path": "api_v1_system_tasks", "limit": 3, "period": 60}
 
     with (
-        patch("src.apps.system.rate_limits.deps.tier_repository") as tier_repo,
-        patch("src.apps.system.rate_limits.deps.rate_limit_repository") as rl_repo,
+        patch("src.apps.system.rate_limits.deps.tier_rule_cache", TierRuleCache(0)),
+        patch("src.apps.system.rate_limits.rule_cache.tier_repository") as tier_repo,
+        patch("src.apps.system.rate_limits.rule_cache.rate_limit_repository") as rl_repo,
         patch(
-            "src.apps.system.rate_limits.deps.is_rate_limited",
+            "src.apps.system.rate_limits.deps.check_rate_limit",
             new_callable=AsyncMock,
-            return_value=False,
+            return_value=RateLimitResult(True, 3, 2, 60.0, 0.0),
         ) as limited,
     ):
         tier_repo.get = AsyncMock(return_value={"id": user["tier_id"], "name": "free"})
@@ -41,6 +45,38 @@ async def test_rate_limiter_matches_longest_prefix_for_redis_key() -> None:
     assert limited.await_args.kwargs["limit"] == 3
 
 
+async def test_rate_limiter_charges_the_rule_cost() -> None:
+    request = MagicMock()
+    request.scope = {"route": SimpleNamespace(path="/api/v1/blog/posts")}
+    request.url.path = "/api/v1/blog/posts"
+    request.query_params = {"items_per_page": "40"}
+    request.app = FastAPI()
+    user = {"id": uuid4(), "tier_id": uuid4()}
+    rule = {
+        "path": "api_v1_blog_posts",
+        "limit": 1000,
+        "period": 60,
+        "cost": 2,
+        "cost_basis": "items_per_page",
+    }
+
+    with (
+        patch("src.apps.system.rate_limits.deps.tier_rule_cache", TierRuleCache(0)),
+        patch("src.apps.system.rate_limits.rule_cache.tier_repository") as tier_repo,
+        patch("src.apps.system.rate_limits.rule_cache.rate_limit_repository") as rl_repo,
+        patch(
+            "src.apps.system.rate_limits.deps.check_rate_limit",
+            new_callable=AsyncMock,
+            return_value=RateLimitResult(True, 1000, 920, 60.0, 0.0),
+        ) as limited,
+    ):
+        tier_repo.get = AsyncMock(return_value={"id": user["tier_id"], "name": "free"})
+        rl_repo.get_all = AsyncMock(return_value=[rule])
+        await rate_limiter(request=request, db=MagicMock(), user=user)
+
+    assert limited.await_args.kwargs["cost"] == 80
+
+
 async def test_rate_limiter_skips_anonymous_without_identifier() -> None:
     request = MagicMock()
     request.scope = {"route": SimpleNamespace(path="/api/v1/system/tasks/queue-health")}
@@ -49,7 +85,7 @@ async def test_rate_limiter_skips_anonymous_without_identifier() -> None:
     with (
         patch("src.apps.system.rate_limits.deps.caller_identifier", return_value=None),
         patch(
-            "src.apps.system.rate_limits.deps.is_rate_limited", new_callable=AsyncMock
+            "src.apps.system.rate_limits.deps.check_rate_limit", new_callable=AsyncMock
         ) as limited,
     ):
         await rate_limiter(request=request, db=MagicMock(), user=None)
@@ -65,15 +101,106 @@ async def test_rate_limiter_raises_when_limited() -> None:
     user = {"id": uuid4(), "tier_id": uuid4()}
 
     with (
-        patch("src.apps.system.rate_limits.deps.tier_repository") as tier_repo,
-        patch("src.apps.system.rate_limits.deps.rate_limit_repository") as rl_repo,
+        patch("src.apps.system.rate_limits.deps.tier_rule_cache", TierRuleCache(0)),
+        patch("src.apps.system.rate_limits.rule_cache.tier_repository") as tier_repo,
+        patch("src.apps.system.rate_limits.rule_cache.rate_limit_repository") as rl_repo,
         patch(
-            "src.apps.system.rate_limits.deps.is_rate_limited",
+            "src.apps.system.rate_limits.deps.check_rate_limit",
             new_callable=AsyncMock,
-            return_value=True,
+            return_value=RateLimitResult(False, 10, 0, 42.5, 42.5),
         ),
     ):
         tier_repo.get = AsyncMock(return_value=None)
         rl_repo.get_all = AsyncMock(return_value=[])
-        with pytest.raises(RateLimitException):
+        with pytest.raises(RateLimitException) as exc_info:
             await rate_limiter(request=request, db=MagicMock(), user=user)
+
+    assert exc_info.value.headers["Retry-After"] == "43"
+    assert exc_info.value.headers["X-RateLimit-Remaining"] == "0"
+    assert request.scope["state"][RESULT_STATE_KEY].allowed is False
+
+
+async def test_rate_limiter_skips_anonymous_counted_by_middleware() -> None:
+    request = MagicMock()
+    request.scope = {
+        "route": SimpleNamespace(path="/api/v1/system/tasks/queue-health"),
+        "state": {CHECKED_STATE_KEY: True},
+    }
+    request.url.path = "/api/v1/system/tasks/queue-health"
+
+    with patch(
+        "src.apps.system.rate_limits.deps.check_rate_limit", new_callable=AsyncMock
+    ) as limited:
+        await rate_limiter(request=request, db=MagicMock(), user=None)
+
+    limited.assert_not_awaited()
+
+
+def _tasks_request() -> MagicMock:
+    request = MagicMock()
+    request.scope = {"route": SimpleNamespace(path="/api/v1/system/tasks/processed")}
+    request.url.path = "/api/v1/system/tasks/processed"
+    return request
+
+
+async def test_concurrency_limiter_holds_lease_for_the_request() -> None:
+    user = {"id": uuid4(), "tier_id": uuid4()}
+    rule = {"path": "api_v1_system_tasks", "limit": 3, "period": 60, "max_concurrency": 2}
+    lease = MagicMock()
+    tier_cache = MagicMock()
+    tier_cache.get_tier = AsyncMock(return_value=CompiledTier("free", RuleTrie([rule])))
+
+    with (
+        patch("src.apps.system.rate_limits.deps.tier_rule_cache", tier_cache),
+        patch(
+            "src.apps.system.rate_limits.deps.acquire_concurrency_lease",
+            new_callable=AsyncMock,
+            return_value=lease,
+        ) as acquire,
+        patch(
+            "src.apps.system.rate_limits.deps.release_concurrency_lease", new_callable=AsyncMock
+        ) as release,
+    ):
+        limiter = concurrency_limiter(request=_tasks_request(), db=MagicMock(), user=user)
+        await limiter.__anext__()
+        release.assert_not_awaited()
+        with pytest.raises(StopAsyncIteration):
+            await limiter.__anext__()
+
+    assert acquire.await_args.kwargs["path"] == "api_v1_system_tasks"
+    assert acquire.await_args.kwargs["max_concurrency"] == 2
+    release.assert_awaited_once_with(lease)
+
+
+async def test_concurrency_limiter_raises_when_no_slot_is_free() -> None:
+    user = {"id": uuid4(), "tier_id": uuid4()}
+    rule = {"path": "api_v1_system_tasks", "limit": 3, "period": 60, "max_concurrency": 1}
+    tier_cache = MagicMock()
+    tier_cache.get_tier = AsyncMock(return_value=CompiledTier("free", RuleTrie([rule])))
+
+    with (
+        patch("src.apps.system.rate_limits.deps.tier_rule_cache", tier_cache),
+        patch(
+            "src.apps.system.rate_limits.deps.acquire_concurrency_lease",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+    ):
+        limiter = concurrency_limiter(request=_tasks_request(), db=MagicMock(), user=user)
+        with pytest.raises(RateLimitException) as exc_info:
+            await limiter.__anext__()
+
+    assert exc_info.value.headers["Retry-After"] == "1"
+
+
+async def test_concurrency_limiter_is_a_no_op_without_a_cap() -> None:
+    with (
+        patch("src.apps.system.rate_limits.deps.caller_identifier", return_value="1.2.3.4"),
+        patch(
+            "src.apps.system.rate_limits.deps.acquire_concurrency_lease", new_callable=AsyncMock
+        ) as acquire,
+    ):
+        limiter = concurrency_limiter(request=_tasks_request(), db=MagicMock(), user=None)
+        await limiter.__anext__()
+
+    acquire.assert_not_awaited()
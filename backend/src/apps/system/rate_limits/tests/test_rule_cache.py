@@ -0,0 +1,155 @@
+# Built-in Dependencies
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+# Third-Party Dependencies
+import pytest
+
+# Local Dependencies
+from src.apps.system.rate_limits.rule_cache import RULES_VERSION_KEY, TierRuleCache
+from src.core.utils import rate_limit as rate_limit_module
+
+pytestmark = pytest.mark.unit
+
+MODULE = "src.apps.system.rate_limits.rule_cache"
+
+
+def _repos(tier_id, rules):
+    tier_repo = MagicMock()
+    tier_repo.get = AsyncMock(return_value={"id": tier_id, "name": "free"})
+    rl_repo = MagicMock()
+    rl_repo.get_all = AsyncMock(return_value=rules)
+    return tier_repo, rl_repo
+
+
+async def test_get_tier_compiles_rules_once() -> None:
+    tier_id = uuid4()
+    tier_repo, rl_repo = _repos(tier_id, [{"path": "api_v1_system_tasks", "limit": 3}])
+    rule_cache = TierRuleCache(check_interval=0)
+
+    with (
+        patch(f"{MODULE}.tier_repository", tier_repo),
+        patch(f"{MODULE}.rate_limit_repository", rl_repo),
+        patch.object(rate_limit_module, "client", None),
+    ):
+        first = await rule_cache.get_tier(db=MagicMock(), tier_id=tier_id)
+        second = await rule_cache.get_tier(db=MagicMock(), tier_id=str(tier_id))
+
+    assert first is second
+    assert first is not None and first.name == "free"
+    assert first.rules.match("api_v1_system_tasks_{task_id}")["limit"] == 3
+    tier_repo.get.assert_awaited_once()
+    rl_repo.get_all.assert_awaited_once()
+
+
+async def test_get_tier_caches_missing_tier() -> None:
+    tier_repo, rl_repo = _repos(None, [])
+    tier_repo.get = AsyncMock(return_value=None)
+    rule_cache = TierRuleCache(check_interval=0)
+
+    with (
+        patch(f"{MODULE}.tier_repository", tier_repo),
+        patch(f"{MODULE}.rate_limit_repository", rl_repo),
+        patch.object(rate_limit_module, "client", None),
+    ):
+        assert await rule_cache.get_tier(db=MagicMock(), tier_id=uuid4()) is None
+
+    rl_repo.get_all.assert_not_awaited()
+
+
+async def test_get_tier_reloads_after_version_change() -> None:
+    tier_id = uuid4()
+    tier_repo, rl_repo = _repos(tier_id, [])
+    redis_client = MagicMock()
+    redis_client.get = AsyncMock(side_effect=["1", "1", "2"])
+    rule_cache = TierRuleCache(check_interval=0)
+
+    with (
+        patch(f"{MODULE}.tier_repository", tier_repo),
+        patch(f"{MODULE}.rate_limit_repository", rl_repo),
+        patch.object(rate_limit_module, "client", redis_client),
+    ):
+        for _ in range(3):
+            await rule_cache.get_tier(db=MagicMock(), tier_id=tier_id)
+
+    assert tier_repo.get.await_count == 2
+    redis_client.get.assert_awaited_with(RULES_VERSION_KEY)
+
+
+async def test_get_tier_checks_version_at_most_once_per_interval() -> None:
+    tier_id = uuid4()
+    tier_repo, rl_repo = _repos(tier_id, [])
+    redis_client = MagicMock()
+    redis_client.get = AsyncMock(return_value="1")
+    rule_cache = TierRuleCache(check_interval=60)
+
+    with (
+        patch(f"{MODULE}.tier_repository", tier_repo),
+        patch(f"{MODULE}.rate_limit_repository", rl_repo),
+        patch.object(rate_limit_module, "client", redis_client),
+    ):
+        for _ in range(3):
+            await rule_cache.get_tier(db=MagicMock(), tier_id=tier_id)
+
+    redis_client.get.assert_awaited_once()
+
+
+async def test_get_tier_keeps_rules_when_version_read_fails() -> None:
+    tier_id = uuid4()
+    tier_repo, rl_repo = _repos(tier_id, [])
+    redis_client = MagicMock()
+    redis_client.get = AsyncMock(side_effect=ConnectionError("down"))
+    rule_cache = TierRuleCache(check_interval=0)
+
+    with (
+        patch(f"{MODULE}.tier_repository", tier_repo),
+        patch(f"{MODULE}.rate_limit_repository", rl_repo),
+        patch.object(rate_limit_module, "client", redis_client),
+    ):
+        await rule_cache.get_tier(db=MagicMock(), tier_id=tier_id)
+        await rule_cache.get_tier(db=MagicMock(), tier_id=tier_id)
+
+    tier_repo.get.assert_awaited_once()
+
+
+async def test_invalidate_clears_rules_and_bumps_version() -> None:
+    tier_id = uuid4()
+    tier_repo, rl_repo = _repos(tier_id, [])
+    redis_client = MagicMock()
+    redis_client.get = AsyncMock(return_value=None)
+    redis_client.incr = AsyncMock(return_value=5)
+    rule_cache = TierRuleCache(check_interval=60)
+
+    with (
+        patch(f"{MODULE}.tier_repository", tier_repo),
+        patch(f"{MODULE}.rate_limit_repository", rl_repo),
+        patch.object(rate_limit_module, "client", redis_client),
+    ):
+        await rule_cache.get_tier(db=MagicMock(), tier_id=tier_id)
+        await rule_cache.invalidate()
+        await rule_cache.get_tier(db=MagicMock(), tier_id=tier_id)
+
+    redis_client.incr.assert_awaited_once_with(RULES_VERSION_KEY)
+    assert tier_repo.get.await_count == 2
+
+
+async def test_load_racing_invalidation_is_not_stored() -> None:
+    tier_id = uuid4()
+    rule_cache = TierRuleCache(check_interval=0)
+
+    async def _get_tier_row(**_kwargs):
+        rule_cache.clear()
+        return {"id": tier_id, "name": "free"}
+
+    tier_repo, rl_repo = _repos(tier_id, [])
+    tier_repo.get = AsyncMock(side_effect=_get_tier_row)
+
+    with (
+        patch(f"{MODULE}.tier_repository", tier_repo),
+        patch(f"{MODULE}.rate_limit_repository", rl_repo),
+        patch.object(rate_limit_module, "client", None),
+    ):
+        assert await rule_cache.get_tier(db=MagicMock(), tier_id=tier_id) is not None
+        await rule_cache.get_tier(db=MagicMock(), tier_id=tier_id)
+
+    assert tier_repo.get.await_count == 2
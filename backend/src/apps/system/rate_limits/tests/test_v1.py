@@ -220,3 +220,16 @@ async def test_erase_missing_rate_limit_is_not_found(
     )
     assert response.status_code == 404
     assert response.json() == problem_body("Rate Limit not found", 404, "not_found")
+
+
+async def test_read_my_rate_limit_usage(client: AsyncClient, admin_headers: dict[str, str]) -> None:
+    response = await client.get("/api/v1/system/rate-limits/usage/me", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    for item in response.json():
+        assert item["remaining"] <= item["limit"]
+        assert item["reset_after"] >= 0
+
+
+async def test_read_my_rate_limit_usage_unauthorized(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/system/rate-limits/usage/me")
+    assert response.status_code == 401
@@ -8,10 +8,11 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 # Local Dependencies
 from src.apps.system.auth.deps import get_current_superuser
 from src.core.db.session import async_get_db
-from src.apps.system.rate_limits.deps import rate_limiter
+from src.apps.system.rate_limits.deps import concurrency_limiter, rate_limiter
 from src.apps.system.tasks.deps import get_task_service, task_filters, task_sort_order
 from src.apps.system.tasks.schemas import Job, TaskRead
 from src.apps.system.tasks.services import TaskService
+from src.core.common.repository import CountMode
 from src.core.common.schemas import PaginatedListResponse
 
 router = APIRouter(tags=["System - Tasks"])
@@ -39,7 +40,11 @@ async def create_sample_task(
 @router.get(
     "/system/tasks/processed",
     response_model=PaginatedListResponse[TaskRead],
-    dependencies=[Depends(get_current_superuser), Depends(rate_limiter)],
+    dependencies=[
+        Depends(get_current_superuser),
+        Depends(rate_limiter),
+        Depends(concurrency_limiter),
+    ],
 )
 async def list_processed_tasks(
     request: Request,
@@ -49,6 +54,8 @@ async def list_processed_tasks(
     sort_by: Optional[List[Tuple[str, str]]] = Depends(task_sort_order),
     page: int = 1,
     items_per_page: int = 10,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
 ) -> dict:
     """
     Get all processed (non-pending) tasks from the database (paginated).
@@ -61,6 +68,8 @@ async def list_processed_tasks(
         items_per_page=items_per_page,
         filters=filters,
         sort_by=sort_by,
+        cursor=cursor,
+        count=count,
     )
 
 
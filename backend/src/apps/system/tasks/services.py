@@ -5,7 +5,7 @@ from typing import Optional, List, Tuple
 from celery.result import AsyncResult
 from celery import states
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select, func, col, or_
+from sqlmodel import select, col, or_
 from sqlalchemy import not_ as sa_not
 
 # Local Dependencies
@@ -15,7 +15,8 @@ from src.apps.system.tasks.models import Task
 from src.apps.system.tasks.schemas import Job, TaskRead
 from src.worker import app as celery_app
 from src.core.exceptions.http_exceptions import NotFoundException
-from src.core.utils.api_params import compute_offset, paginated_response
+from src.core.common.repository import CountMode
+from src.core.utils.api_params import compute_offset, cursor_paginated_response
 
 
 class TaskService:
@@ -33,25 +34,28 @@ class TaskService:
         items_per_page: int = 10,
         filters: dict | None = None,
         sort_by: Optional[List[Tuple[str, str]]] = None,
+        cursor: Optional[str] = None,
+        count: CountMode = "exact",
     ) -> dict:
-        filters = filters or {}
-        stmt_without_pagination = select(Task).where(sa_not(col(Task.status) == states.PENDING))
-        stmt_without_pagination = self.task_repo.apply_filtering(stmt_without_pagination, **filters)
-
-        stmt_count = select(func.count()).select_from(stmt_without_pagination.subquery())
-        count_result = await session.exec(stmt_count)
-        total_count = count_result.one()
-
-        stmt = self.task_repo.apply_sorting(stmt_without_pagination, sort_by)
-        stmt = stmt.offset(compute_offset(page, items_per_page)).limit(items_per_page)
-        result = await session.exec(stmt)
-        tasks = result.all()
-        data = [TaskRead.model_validate(task) for task in tasks]
+        stmt = self.task_repo.select_columns(TaskRead).where(
+            sa_not(col(Task.status) == states.PENDING)
+        )
+        stmt = self.task_repo.apply_filtering(stmt, **(filters or {}))
+
+        tasks_data = await self.task_repo.paginate(
+            db=session,
+            stmt=stmt,
+            offset=compute_offset(page, items_per_page),
+            limit=items_per_page,
+            sort_by=sort_by,
+            cursor=cursor,
+            keyset=True,
+            count=count,
+        )
+        tasks_data["data"] = [TaskRead.model_validate(task) for task in tasks_data["data"]]
 
-        return paginated_response(
-            data={"data": data, "total_count": total_count},
-            page=page,
-            items_per_page=items_per_page,
+        return cursor_paginated_response(
+            data=tasks_data, items_per_page=items_per_page, page=None if cursor else page
         )
 
     async def get_pending_tasks(self, session: AsyncSession) -> List[TaskRead]:
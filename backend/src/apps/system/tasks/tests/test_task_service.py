@@ -39,19 +39,36 @@ async def test_create_sample_shared_task_returns_job() -> None:
 
 
 async def test_get_processed_tasks_returns_paginated_dict() -> None:
-    service = TaskService(task_repo=_task_repo())
-    session = AsyncMock()
-    count_result = MagicMock()
-    count_result.one.return_value = 0
-    list_result = MagicMock()
-    list_result.all.return_value = []
-    session.exec.side_effect = [count_result, list_result]
+    repo = _task_repo()
+    repo.paginate = AsyncMock(
+        return_value={
+            "data": [{"id": 1, "task_id": "t-1", "status": states.SUCCESS}],
+            "total_count": 1,
+            "next_cursor": None,
+        }
+    )
+    service = TaskService(task_repo=repo)
+
+    result = await service.get_processed_tasks(session=AsyncMock())
+
+    assert result["data"] == [TaskRead(id=1, task_id="t-1", status=states.SUCCESS)]
+    assert result["total_count"] == 1
+    assert result["has_more"] is False
+    assert result["page"] == 1
+    assert repo.paginate.await_args.kwargs["keyset"] is True
+
+
+async def test_get_processed_tasks_by_cursor_has_no_page() -> None:
+    repo = _task_repo()
+    repo.paginate = AsyncMock(return_value={"data": [], "total_count": 0, "next_cursor": "c2"})
+    service = TaskService(task_repo=repo)
 
-    result = await service.get_processed_tasks(session=session)
+    result = await service.get_processed_tasks(session=AsyncMock(), cursor="c1")
 
-    assert result["data"] == []
-    assert result["total_count"] == 0
-    assert session.exec.await_count == 2
+    assert result["page"] is None
+    assert result["has_more"] is True
+    assert result["next_cursor"] == "c2"
+    assert repo.paginate.await_args.kwargs["cursor"] == "c1"
 
 
 async def test_get_pending_tasks_returns_task_reads() -> None:
@@ -7,6 +7,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 # Local Dependencies
+from src.apps.system.rate_limits.rule_cache import tier_rule_cache
 from src.apps.system.tiers.repositories import TierRepository, tier_repository
 from src.apps.system.tiers.schemas import (
     TierRead,
@@ -72,6 +73,7 @@ class TierService:
             raise ForbiddenException(detail="Default Tier cannot be updated")
 
         await self.tier_repo.update(db=db, object=values, id=tier_id)
+        await tier_rule_cache.invalidate()
         return {"message": "Tier updated"}
 
     async def db_delete_tier(self, db: AsyncSession, tier_id: UUID) -> Dict[str, str]:
@@ -91,6 +93,7 @@ class TierService:
                 detail="An unexpected error occurred. Please try again later or contact support if the problem persists."
             )
 
+        await tier_rule_cache.invalidate()
         return {"message": "Tier deleted from the database"}
 
 
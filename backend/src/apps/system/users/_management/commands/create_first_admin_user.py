@@ -18,7 +18,7 @@ async def create_first_admin_user(session: AsyncSession) -> None:
     name = settings.USER_FIRST_ADMIN_NAME
     email = settings.USER_FIRST_ADMIN_EMAIL
     username = settings.USER_FIRST_ADMIN_USERNAME
-    hashed_password = get_password_hash(settings.USER_FIRST_ADMIN_PASSWORD)
+    hashed_password = await get_password_hash(settings.USER_FIRST_ADMIN_PASSWORD)
 
     # Checking if user already exists (by id OR email)
     query = select(User).where(or_(User.id == id, User.email == email))
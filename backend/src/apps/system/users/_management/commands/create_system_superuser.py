@@ -18,7 +18,7 @@ async def create_system_superuser(session: AsyncSession) -> None:
     name = settings.USER_SYSTEM_NAME
     email = settings.USER_SYSTEM_EMAIL
     username = settings.USER_SYSTEM_USERNAME
-    hashed_password = get_password_hash(settings.USER_SYSTEM_PASSWORD)
+    hashed_password = await get_password_hash(settings.USER_SYSTEM_PASSWORD)
 
     # Checking if user already exists (by id OR email)
     query = select(User).where(or_(User.id == id, User.email == email))
@@ -4,16 +4,19 @@ from uuid import UUID
 
 # Third-Party Dependencies
 from sqlmodel.ext.asyncio.session import AsyncSession
-from fastapi import Depends, Request
+from fastapi import Depends, Request, Response
 import fastapi
 
 # Local Dependencies
 from src.apps.system.auth.deps import get_current_user, get_current_superuser
 from src.apps.system.users.deps import get_user_service, user_filters, user_sort_order
 from src.apps.system.users.services import UserService
+from src.apps.system.rate_limits.deps import concurrency_limiter
 from src.core.db.session import async_get_db
 from src.core.security import oauth2_scheme
+from src.core.common.repository import CountMode
 from src.core.common.schemas import PaginatedListResponse
+from src.core.utils.etag import etag_matches, not_modified, resource_etag
 from src.apps.system.users.schemas import (
     UserCreate,
     UserUpdate,
@@ -35,7 +38,11 @@ async def write_user(
     return await user_service.create_user(db=db, user=user)
 
 
-@router.get("/system/users", response_model=PaginatedListResponse[UserRead])
+@router.get(
+    "/system/users",
+    response_model=PaginatedListResponse[UserRead],
+    dependencies=[Depends(concurrency_limiter)],
+)
 async def read_users(
     request: Request,
     current_user: Annotated[dict, Depends(get_current_user)],
@@ -45,6 +52,8 @@ async def read_users(
     sort_by: Optional[List[Tuple[str, str]]] = Depends(user_sort_order),
     page: int = 1,
     items_per_page: int = 10,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
 ) -> dict:
     return await user_service.get_users(
         db=db,
@@ -52,26 +61,39 @@ async def read_users(
         items_per_page=items_per_page,
         filters=filters,
         sort_by=sort_by,
+        cursor=cursor,
+        count=count,
     )
 
 
 @router.get("/system/users/me/", response_model=UserRead)
 async def read_users_me(
     request: Request,
+    response: Response,
     current_user: Annotated[dict, Depends(get_current_user)],
-) -> dict:
+) -> dict | Response:
+    etag = resource_etag(current_user)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return current_user
 
 
 @router.get("/system/users/{user_id}", response_model=UserRead)
 async def read_user(
     request: Request,
+    response: Response,
     current_user: Annotated[dict, Depends(get_current_user)],
     user_id: UUID,
     db: Annotated[AsyncSession, Depends(async_get_db)],
     user_service: UserService = Depends(get_user_service),
-) -> dict:
-    return await user_service.get_user(db=db, user_id=user_id)
+) -> dict | Response:
+    user = await user_service.get_user(db=db, user_id=user_id)
+    etag = resource_etag(user)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return user
 
 
 @router.patch("/system/users/{user_id}")
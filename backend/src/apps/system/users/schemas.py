@@ -38,6 +38,18 @@ class UserRead(UserBase, UserMediaBase, UserRelationshipBase, UUIDMixin):
     pass
 
 
+class UserPrincipal(
+    UserBase,
+    UserMediaBase,
+    UserRelationshipBase,
+    UserPermissionBase,
+    UUIDMixin,
+    TimestampMixin,
+    SoftDeleteMixin,
+):
+    """The authenticated user as handlers see it: every column but the password hash."""
+
+
 class UserCreate(UserBase):
     model_config = ConfigDict(extra="forbid")
 
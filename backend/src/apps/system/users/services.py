@@ -7,6 +7,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 # Local Dependencies
+from src.apps.system.auth.principal_cache import principal_cache
 from src.apps.system.users.repositories import UserRepository, user_repository
 from src.apps.system.tiers.repositories import TierRepository, tier_repository
 from src.apps.system.rate_limits.repositories import RateLimitRepository, rate_limit_repository
@@ -29,7 +30,8 @@ from src.core.exceptions.http_exceptions import (
 from src.core.security import get_password_hash
 from src.core.config import settings
 from src.core.utils import cache
-from src.core.utils.api_params import compute_offset, paginated_response
+from src.core.common.repository import CountMode
+from src.core.utils.api_params import compute_offset, cursor_paginated_response
 from src.apps.system.users.tasks import send_welcome_email
 
 
@@ -54,7 +56,7 @@ class UserService:
             raise DuplicateValueException(detail="Username not available")
 
         user_internal_dict = user.model_dump()
-        user_internal_dict["hashed_password"] = get_password_hash(
+        user_internal_dict["hashed_password"] = await get_password_hash(
             password=user_internal_dict["password"]
         )
         del user_internal_dict["password"]
@@ -84,6 +86,8 @@ class UserService:
         items_per_page: int = 10,
         filters: dict | None = None,
         sort_by: Optional[List[Tuple[str, str]]] = None,
+        cursor: Optional[str] = None,
+        count: CountMode = "exact",
     ) -> dict:
         users_data = await self.user_repo.get_multi(
             db=db,
@@ -91,10 +95,15 @@ class UserService:
             limit=items_per_page,
             schema_to_select=UserRead,
             sort_by=sort_by,
+            cursor=cursor,
+            keyset=True,
+            count=count,
             is_deleted=False,
             **(filters or {}),
         )
-        return paginated_response(data=users_data, page=page, items_per_page=items_per_page)
+        return cursor_paginated_response(
+            data=users_data, items_per_page=items_per_page, page=None if cursor else page
+        )
 
     async def get_user(self, db: AsyncSession, user_id: UUID) -> dict:
         db_user = await self.user_repo.get(
@@ -126,6 +135,7 @@ class UserService:
                 raise DuplicateValueException(detail="Email is already registered")
 
         await self.user_repo.update(db=db, object=values, id=user_id)
+        await principal_cache.invalidate_user(user_id)
         return {"message": "User updated"}
 
     async def delete_user(
@@ -145,6 +155,7 @@ class UserService:
 
         # Soft delete user on the database
         await self.user_repo.delete(db=db, db_row=db_user, id=user_id)
+        await principal_cache.invalidate_user(user_id)
 
         # Remove user from Redis cache
         if cache.client:
@@ -168,6 +179,7 @@ class UserService:
             raise InternalErrorException(
                 detail="An unexpected error occurred. Please try again later or contact support if the problem persists."
             )
+        await principal_cache.invalidate_user(user_id)
 
         # Remove user from Redis cache
         if cache.client:
@@ -230,6 +242,7 @@ class UserService:
             raise NotFoundException(detail="Tier not found")
 
         await self.user_repo.update(db=db, object=values, id=user_id)
+        await principal_cache.invalidate_user(user_id)
         return {
             "message": f"User '{db_user['username']}' have been assigned to '{db_tier['name']}' tier."
         }
@@ -70,7 +70,11 @@ async def test_create_user_raises_when_default_tier_missing() -> None:
     user_repo.exists.return_value = False
     tier_repo.get.return_value = None
 
-    with patch("src.apps.system.users.services.get_password_hash", return_value="hashed"):
+    with patch(
+        "src.apps.system.users.services.get_password_hash",
+        new_callable=AsyncMock,
+        return_value="hashed",
+    ):
         with pytest.raises(BadRequestException):
             await service.create_user(db=object(), user=_user_create())
 
@@ -85,13 +89,15 @@ async def test_create_user_hashes_password_and_queues_welcome_email() -> None:
     user_repo.create.return_value = created
 
     with patch(
-        "src.apps.system.users.services.get_password_hash", return_value="hashed"
+        "src.apps.system.users.services.get_password_hash",
+        new_callable=AsyncMock,
+        return_value="hashed",
     ) as hash_fn:
         with patch("src.apps.system.users.services.send_welcome_email") as welcome:
             result = await service.create_user(db=object(), user=_user_create())
 
     assert result is created
-    hash_fn.assert_called_once_with(password="Str1ngst!")
+    hash_fn.assert_awaited_once_with(password="Str1ngst!")
     user_repo.create.assert_awaited_once()
     welcome.delay.assert_called_once_with(email="user@tester.com", username="userson")
 
@@ -209,6 +215,23 @@ async def test_update_user_writes_values() -> None:
     user_repo.update.assert_awaited_once()
 
 
+async def test_update_user_invalidates_cached_principals() -> None:
+    user_id = uuid4()
+    service, user_repo, _, _ = _service()
+    user_repo.get.return_value = {"id": user_id, "username": "userson", "email": "user@tester.com"}
+
+    with patch("src.apps.system.users.services.principal_cache") as principals:
+        principals.invalidate_user = AsyncMock()
+        await service.update_user(
+            db=object(),
+            user_id=user_id,
+            values=UserUpdate(name="New Name"),
+            current_user={"id": user_id, "is_superuser": False},
+        )
+
+    principals.invalidate_user.assert_awaited_once_with(user_id)
+
+
 async def test_delete_user_raises_when_missing() -> None:
     service, user_repo, _, _ = _service()
     user_repo.get.return_value = None
@@ -302,6 +325,26 @@ async def test_delete_user_removes_username_from_cache() -> None:
     cache_client.hdel.assert_awaited_once()
 
 
+async def test_delete_user_invalidates_cached_principals() -> None:
+    user_id = uuid4()
+    service, user_repo, _, _ = _service()
+    user_repo.get.return_value = {"id": user_id, "is_deleted": False, "username": "userson"}
+
+    with (
+        patch("src.apps.system.users.services.cache") as cache_mod,
+        patch("src.apps.system.users.services.principal_cache") as principals,
+    ):
+        cache_mod.client = None
+        principals.invalidate_user = AsyncMock()
+        await service.delete_user(
+            db=object(),
+            user_id=user_id,
+            current_user={"id": user_id, "is_superuser": False},
+        )
+
+    principals.invalidate_user.assert_awaited_once_with(user_id)
+
+
 async def test_db_delete_user_raises_when_missing() -> None:
     service, user_repo, _, _ = _service()
     user_repo.get.return_value = None
@@ -461,7 +504,10 @@ async def test_update_user_tier_assigns_tier() -> None:
     tier_repo.get.return_value = {"id": tier_id, "name": "premium"}
     values = UserTierUpdate(tier_id=tier_id)
 
-    result = await service.update_user_tier(db=object(), user_id=user_id, values=values)
+    with patch("src.apps.system.users.services.principal_cache") as principals:
+        principals.invalidate_user = AsyncMock()
+        result = await service.update_user_tier(db=object(), user_id=user_id, values=values)
 
     assert "premium" in result["message"]
     user_repo.update.assert_awaited_once()
+    principals.invalidate_user.assert_awaited_once_with(user_id)
@@ -77,6 +77,58 @@ async def test_get_multiple_users(client: AsyncClient, admin_headers: dict[str,
     assert "items_per_page" in result
 
 
+async def test_get_multiple_users_by_cursor(
+    client: AsyncClient, admin_headers: dict[str, str]
+) -> None:
+    await _create_disposable_user(client, admin_headers)
+    await _create_disposable_user(client, admin_headers)
+
+    seen: list[str] = []
+    params: dict[str, str | int] = {"items_per_page": 1}
+    for _ in range(100):
+        response = await client.get("/api/v1/system/users", params=params, headers=admin_headers)
+        assert response.status_code == 200
+        result = response.json()
+        seen.extend(user["id"] for user in result["data"])
+        if not result["has_more"]:
+            break
+        assert result["next_cursor"]
+        params["cursor"] = result["next_cursor"]
+
+    assert result["next_cursor"] is None
+    assert len(seen) == len(set(seen)) == result["total_count"]
+
+
+async def test_get_multiple_users_invalid_cursor(
+    client: AsyncClient, admin_headers: dict[str, str]
+) -> None:
+    response = await client.get(
+        "/api/v1/system/users", params={"cursor": "garbage"}, headers=admin_headers
+    )
+    assert response.status_code == 400
+    assert response.json()["code"] == "invalid_cursor"
+
+
+@pytest.mark.parametrize("count", ["exact", "none", "estimate", "window"])
+async def test_get_multiple_users_count_modes(
+    client: AsyncClient, admin_headers: dict[str, str], count: str
+) -> None:
+    exact = await client.get("/api/v1/system/users", headers=admin_headers)
+    response = await client.get(
+        "/api/v1/system/users", params={"count": count}, headers=admin_headers
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["data"] == exact.json()["data"]
+    assert result["has_more"] == exact.json()["has_more"]
+    if count == "none":
+        assert result["total_count"] is None
+    elif count in ("exact", "window"):
+        assert result["total_count"] == exact.json()["total_count"]
+    else:
+        assert result["total_count"] >= len(result["data"])
+
+
 async def test_update_your_own_user(client: AsyncClient, admin_headers: dict[str, str]) -> None:
     user_id, username, password = await _create_disposable_user(client, admin_headers)
     headers = await _auth_headers(client, username, password)
@@ -7,6 +7,7 @@ from src.apps.system.tiers.routers.v1 import router as tiers_router
 from src.apps.system.rate_limits.routers.v1 import router as rate_limits_router
 from src.apps.system.users.routers.v1 import router as users_router
 from src.apps.system.tasks.routers.v1 import router as tasks_router
+from src.apps.system.cache.routers.v1 import router as cache_router
 from src.apps.blog.posts.routers.v1 import router as posts_router
 from src.apps.blog.tags.routers.v1 import router as tags_router
 
@@ -19,5 +20,6 @@ api_v1_router.include_router(tiers_router)
 api_v1_router.include_router(rate_limits_router)
 api_v1_router.include_router(users_router)
 api_v1_router.include_router(tasks_router)
+api_v1_router.include_router(cache_router)
 api_v1_router.include_router(posts_router)
 api_v1_router.include_router(tags_router)
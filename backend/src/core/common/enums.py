@@ -5,3 +5,11 @@ from enum import StrEnum
 class EmailSenderType(StrEnum):
     logger = "logger"
     smtp = "smtp"
+
+
+class RateLimitCostBasis(StrEnum):
+    """What a rate limit rule's ``cost`` is multiplied by for each request."""
+
+    fixed = "fixed"
+    items_per_page = "items_per_page"
+    body_kib = "body_kib"
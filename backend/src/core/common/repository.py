@@ -2,17 +2,23 @@
 from typing import (
     Any,
     Generic,
+    Literal,
     TypeVar,
     Union,
     get_origin,
     get_args,
 )
 from datetime import datetime, UTC
+from functools import lru_cache
 
 # Third-Party Dependencies
 from sqlmodel import SQLModel, select, update, delete, func, and_, or_, inspect
+from sqlalchemy import column as sa_column, insert, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy import asc, desc, Select, Column
+from sqlalchemy import asc, desc, false, Select, Column, TypeDecorator
+from sqlalchemy.sql import ColumnElement
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.engine.row import Row
 from sqlalchemy.sql import Join
 
@@ -22,7 +28,13 @@ from src.core.utils.repository import (
     _extract_matching_columns_from_kwargs,
     _auto_detect_join_condition,
     _add_column_with_prefix,
+    _encode_cursor,
+    _decode_cursor,
+    _Explain,
+    _plan_rows,
+    _chunked,
 )
+from src.core.exceptions.repository_exceptions import InvalidCursorError
 from src.core.common.models import Base
 from src.core.config import settings
 from src.core.logger import logger_postgres
@@ -35,6 +47,17 @@ DeleteSchemaType = TypeVar("DeleteSchemaType", bound=SQLModel)
 
 SchemaToSelect = type[SQLModel] | list[type[SQLModel]] | None
 SortBy = list[tuple[str, str]] | None
+CountMode = Literal["exact", "none", "estimate", "window"]
+
+WINDOW_COUNT_LABEL = "_window_total_count"
+
+# asyncpg sends parameter counts as int16, so one statement can bind at most this many.
+MAX_BIND_PARAMETERS = 32767
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(python_type: type) -> TypeAdapter:
+    return TypeAdapter(python_type)
 
 
 class RepositoryBase(
@@ -190,7 +213,7 @@ class RepositoryBase(
         """
         if sort_by:
             # Get the column names from the current SQL statement
-            column_names = [col.name for col in stmt.columns]
+            column_names = [col.name for col in stmt.selected_columns]
 
             # Create a mapping of column names to their respective tables/models
             column_to_model = {}
@@ -230,6 +253,96 @@ class RepositoryBase(
 
         return stmt
 
+    def keyset_sort(self, sort_by: SortBy) -> list[tuple[str, str]]:
+        """
+        The sort keys of a keyset page: the model columns of ``sort_by`` (``created_at``
+        when there are none, as in ``apply_sorting``) followed by ``id`` as the
+        tie-breaker, so every row has a unique position.
+        """
+        columns = self._model.__table__.columns
+        keys = [
+            (field_name, direction)
+            for field_name, direction in sort_by or []
+            if field_name in columns and direction in ("asc", "desc")
+        ]
+        if not sort_by and "created_at" in columns:
+            keys = [("created_at", "asc")]
+        if all(field_name != "id" for field_name, _ in keys):
+            keys.append(("id", "asc"))
+        return keys
+
+    def _cursor_value(self, field_name: str, value: Any) -> Any:
+        if value is None:
+            return None
+        column_type = self._model.__table__.columns[field_name].type
+        if isinstance(column_type, TypeDecorator):
+            # AutoString and friends only know their python type through ``impl``.
+            column_type = column_type.impl_instance
+        try:
+            python_type = column_type.python_type
+        except NotImplementedError:
+            return value
+        try:
+            return _type_adapter(python_type).validate_python(value)
+        except ValidationError as e:
+            raise InvalidCursorError() from e
+
+    def _after(self, field_name: str, direction: str, value: Any) -> ColumnElement:
+        # Postgres sorts NULL last ascending and first descending.
+        column = getattr(self._model, field_name)
+        nullable = self._model.__table__.columns[field_name].nullable
+        if direction == "asc":
+            if value is None:
+                return false()
+            return or_(column > value, column.is_(None)) if nullable else column > value
+        if value is None:
+            return column.is_not(None)
+        return column < value
+
+    def apply_cursor(self, stmt: Select, keys: list[tuple[str, str]], cursor: str) -> Select:
+        """
+        Keep only the rows sorted after the row ``cursor`` points at.
+
+        Parameters
+        ----------
+        stmt : Select
+            The SQLAlchemy select statement to filter.
+        keys : list[tuple[str, str]]
+            The sort keys from ``keyset_sort`` the cursor was issued for.
+        cursor : str
+            A ``next_cursor`` returned by ``paginate``.
+
+        Returns
+        -------
+        Select
+            The statement filtered to ``(k1 after v1) OR (k1 = v1 AND (k2 after v2 OR ...))``.
+
+        Raises
+        ------
+        InvalidCursorError
+            If the cursor is malformed or was issued for other sort keys.
+        """
+        values = [
+            self._cursor_value(field_name, value)
+            for (field_name, _), value in zip(keys, _decode_cursor(cursor, keys), strict=True)
+        ]
+        clause: ColumnElement | None = None
+        for (field_name, direction), value in reversed(list(zip(keys, values, strict=True))):
+            after = self._after(field_name, direction, value)
+            if clause is None:
+                clause = after
+                continue
+            column = getattr(self._model, field_name)
+            equal = column.is_(None) if value is None else column == value
+            clause = or_(after, and_(equal, clause))
+        return stmt.where(clause)
+
+    def select_columns(self, schema_to_select: SchemaToSelect = None) -> Select:
+        """``SELECT`` of the model columns matching ``schema_to_select`` (all by default)."""
+        return select(
+            *_extract_matching_columns_from_schema(model=self._model, schema=schema_to_select)
+        )
+
     async def create(
         self, db: AsyncSession, object: CreateSchemaType, with_commit: bool = True
     ) -> ModelType:
@@ -261,6 +374,211 @@ class RepositoryBase(
             await db.commit()
         return db_object
 
+    def _update_audit_values(
+        self, current_user: dict[str, Any], update_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """``updated_at``/``updated_by_user_id`` to stamp on an update, if the model has them."""
+        audit: dict[str, Any] = {}
+        # Core ``update().values()`` does not fire ORM ``onupdate`` defaults
+        if "updated_at" in self._model.__table__.columns:
+            audit["updated_at"] = datetime.now(UTC)
+
+        if "updated_by_user_id" in self._model.__table__.columns:
+            if "updated_by_user_id" not in update_data:
+                if "id" in current_user:
+                    audit["updated_by_user_id"] = current_user["id"]
+                else:
+                    audit["updated_by_user_id"] = settings.USER_SYSTEM_ID
+        return audit
+
+    def _insert_rows(
+        self, objects: list[CreateSchemaType | dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        columns = self._model.__table__.columns
+        rows = [object if isinstance(object, dict) else object.model_dump() for object in objects]
+        return [{key: value for key, value in row.items() if key in columns} for row in rows]
+
+    @staticmethod
+    def _rows_per_statement(columns: int) -> int:
+        # Two parameters are kept for the ``updated_at``/``updated_by_user_id`` stamps.
+        return max(1, (MAX_BIND_PARAMETERS - 2) // columns)
+
+    async def create_many(
+        self,
+        db: AsyncSession,
+        objects: list[CreateSchemaType | dict[str, Any]],
+        with_commit: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Create many records with multi-row ``INSERT ... RETURNING`` statements.
+
+        Rows are sent in as few statements as asyncpg's bind parameter limit allows,
+        instead of one ORM flush per object as with ``create``. Column defaults are
+        applied per row; ORM events do not fire.
+
+        Parameters
+        ----------
+        db : AsyncSession
+            The SQLModel async session.
+        objects : list[CreateSchemaType | dict[str, Any]]
+            The SQLModel (Pydantic) schemas or dictionaries containing the data to be
+            saved. They must all set the same fields.
+        with_commit : bool, optional
+            Flag indicating whether to commit the changes to the database.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The created rows, in the order of ``objects``.
+        """
+        table = self._model.__table__
+        created: list[dict[str, Any]] = []
+        # Column defaults are bound too, so budget for every column of the table.
+        rows_per_statement = self._rows_per_statement(len(table.columns))
+        for chunk in _chunked(self._insert_rows(objects), rows_per_statement):
+            stmt = insert(table).values(list(chunk)).returning(*table.columns)
+            result = await db.exec(stmt)  # type: ignore
+            created.extend(dict(row) for row in result.mappings())
+
+        if not with_commit:
+            await db.flush()
+        else:
+            await db.commit()
+        return created
+
+    async def upsert_many(
+        self,
+        db: AsyncSession,
+        objects: list[CreateSchemaType | dict[str, Any]],
+        conflict_target: list[str] | None = None,
+        update_columns: list[str] | None = None,
+        do_nothing: bool = False,
+        with_commit: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Insert many records, updating (or skipping) those that already exist.
+
+        Uses ``INSERT ... ON CONFLICT`` in as few statements as asyncpg's bind
+        parameter limit allows.
+
+        Parameters
+        ----------
+        db : AsyncSession
+            The SQLModel async session.
+        objects : list[CreateSchemaType | dict[str, Any]]
+            The SQLModel (Pydantic) schemas or dictionaries containing the data to be
+            saved. They must all set the same fields.
+        conflict_target : list[str] | None, optional
+            Columns of the unique index or constraint that detects existing rows.
+            Default is the primary key.
+        update_columns : list[str] | None, optional
+            Columns overwritten on existing rows. Default is every field set by
+            ``objects`` except the conflict target and the primary key.
+        do_nothing : bool, optional
+            Leave existing rows untouched (``ON CONFLICT DO NOTHING``).
+        with_commit : bool, optional
+            Flag indicating whether to commit the changes to the database.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The inserted and updated rows. Skipped rows are not returned.
+
+        Notes
+        -----
+        - When updating, a later object with the same conflict target replaces an
+          earlier one, since Postgres cannot update a row twice in one statement.
+        """
+        table = self._model.__table__
+        primary_key = [c.name for c in table.primary_key.columns]
+        conflict_target = conflict_target or primary_key
+        rows = self._insert_rows(objects)
+
+        if not do_nothing and rows:
+            if all(name in rows[0] for name in conflict_target):
+                by_target = {tuple(row[name] for name in conflict_target): row for row in rows}
+                rows = list(by_target.values())
+            if update_columns is None:
+                update_columns = [
+                    name for name in rows[0] if name not in conflict_target + primary_key
+                ]
+
+        current_user = getattr(db, "current_user", {})
+        upserted: list[dict[str, Any]] = []
+        for chunk in _chunked(rows, self._rows_per_statement(len(table.columns))):
+            stmt = pg_insert(table).values(list(chunk))
+            if do_nothing or not update_columns:
+                stmt = stmt.on_conflict_do_nothing(index_elements=conflict_target)
+            else:
+                set_ = {name: stmt.excluded[name] for name in update_columns}
+                set_.update(self._update_audit_values(current_user, set_))
+                stmt = stmt.on_conflict_do_update(index_elements=conflict_target, set_=set_)
+            result = await db.exec(stmt.returning(*table.columns))  # type: ignore
+            upserted.extend(dict(row) for row in result.mappings())
+
+        if not with_commit:
+            await db.flush()
+        else:
+            await db.commit()
+        return upserted
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        objects: dict[Any, UpdateSchemaType | dict[str, Any]],
+        with_commit: bool = True,
+    ) -> int:
+        """
+        Update many records by id, each with its own values.
+
+        Runs set-based ``UPDATE ... FROM (VALUES ...)`` statements, one per distinct
+        set of updated fields and as few as asyncpg's bind parameter limit allows,
+        instead of one ``update`` per record.
+
+        Parameters
+        ----------
+        db : AsyncSession
+            The SQLModel async session.
+        objects : dict[Any, UpdateSchemaType | dict[str, Any]]
+            The values to set, by record id.
+        with_commit : bool, optional
+            Flag indicating whether to commit the changes to the database.
+
+        Returns
+        -------
+        int
+            The number of updated records.
+        """
+        table = self._model.__table__
+        current_user = getattr(db, "current_user", {})
+
+        # Records updating the same fields share a statement.
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for record_id, object in objects.items():
+            data = object if isinstance(object, dict) else object.model_dump(exclude_unset=True)
+            data = {key: value for key, value in data.items() if key in table.columns}
+            if data:
+                groups.setdefault(tuple(sorted(data)), []).append({**data, "id": record_id})
+
+        updated = 0
+        for fields, rows in groups.items():
+            names = ("id", *fields)
+            for chunk in _chunked(rows, self._rows_per_statement(len(names))):
+                source = values(
+                    *(sa_column(name, table.c[name].type) for name in names), name="source"
+                ).data([tuple(row[name] for name in names) for row in chunk])
+                set_ = {name: source.c[name] for name in fields}
+                set_.update(self._update_audit_values(current_user, set_))
+                stmt = update(table).where(table.c.id == source.c.id).values(set_)
+                result = await db.exec(stmt)  # type: ignore
+                updated += result.rowcount
+
+        if not with_commit:
+            await db.flush()
+        else:
+            await db.commit()
+        return updated
+
     async def get(
         self,
         db: AsyncSession,
@@ -415,6 +733,36 @@ class RepositoryBase(
         # Execute the count query and retrieve the total number of records
         return await db.scalar(count_query) or 0
 
+    async def estimate_count(
+        self, db: AsyncSession, stmt_without_pagination: Select | None = None
+    ) -> int:
+        """
+        Estimate the number of records that match the applied filters.
+
+        Reads the planner's row estimate from ``EXPLAIN`` without running the query,
+        so it costs the same on any table size. The estimate is only as good as the
+        table statistics (kept by autovacuum/``ANALYZE``) and can be far off for
+        selective filters.
+
+        Parameters
+        ----------
+        db : AsyncSession
+            The asynchronous database session.
+        stmt_without_pagination : Select | None
+            The SQLAlchemy select statement without offset and limit.
+
+        Returns
+        -------
+        int
+            The estimated number of records that satisfy the given filters.
+        """
+        if stmt_without_pagination is None:
+            stmt_without_pagination = select(self._model)
+
+        stmt_without_pagination = self.exclude_deleted(stmt_without_pagination)
+
+        return _plan_rows(await db.scalar(_Explain(stmt_without_pagination)))
+
     async def get_all(
         self,
         db: AsyncSession,
@@ -470,6 +818,115 @@ class RepositoryBase(
         # Return an empty list if there are no results
         return []
 
+    async def paginate(
+        self,
+        db: AsyncSession,
+        stmt: Select,
+        offset: int = 0,
+        limit: int = 100,
+        sort_by: SortBy = None,
+        cursor: str | None = None,
+        keyset: bool = False,
+        count: CountMode = "exact",
+    ) -> dict[str, Any]:
+        """
+        Fetch one page of a filtered column ``SELECT`` and count all its rows.
+
+        Parameters
+        ----------
+        db : AsyncSession
+            The SQLModel async session.
+        stmt : Select
+            Filtered, unsorted and unpaginated select of model columns (see ``select_columns``).
+        offset : int, optional
+            Number of rows to skip before fetching. Ignored when ``cursor`` is given.
+        limit : int, optional
+            Maximum number of rows to fetch. Default is 100.
+        sort_by : list[tuple[str, str]] | None
+            A list of tuples where each tuple contains a field name and the direction ('asc' or 'desc').
+        cursor : str | None, optional
+            A ``next_cursor`` from a previous page; fetches the rows after it (keyset
+            pagination), which stays fast however deep the page is.
+        keyset : bool, optional
+            Sort by ``keyset_sort(sort_by)`` and return ``next_cursor``. Implied by ``cursor``.
+        count : {"exact", "none", "estimate", "window"}, optional
+            How 'total_count' is obtained. Default is "exact".
+
+            - "exact": a second ``SELECT count(*)`` query (see ``total_count``).
+            - "none": no count; 'total_count' is None.
+            - "estimate": the planner's estimate (see ``estimate_count``), never less
+              than the rows seen so far.
+            - "window": ``count(*) OVER ()`` on the page query itself, in one round
+              trip. Falls back to "exact" for pages past the end or after a cursor,
+              where the window cannot see every row.
+
+        Returns
+        -------
+        dict[str, Any]
+            The rows under 'data' and the total count under 'total_count'. In keyset
+            mode also 'next_cursor': the cursor of the next page, or None on the last one.
+            With count "none" or "estimate" also 'has_more', from fetching one extra row.
+        """
+        stmt_without_pagination = stmt
+        keyset = keyset or cursor is not None
+        window = count == "window" and cursor is None
+        # One extra row tells whether there is a next page without counting.
+        peek = keyset or count in ("none", "estimate")
+
+        keys: list[tuple[str, str]] = []
+        hidden: list[str] = []
+        if keyset:
+            # Sort key columns the caller did not select are fetched for the cursor, then dropped.
+            keys = self.keyset_sort(sort_by)
+            selected = {column.name for column in stmt.selected_columns}
+            hidden = [field_name for field_name, _ in keys if field_name not in selected]
+            stmt = stmt.add_columns(*(getattr(self._model, field_name) for field_name in hidden))
+            stmt = self.apply_cursor(stmt, keys, cursor) if cursor is not None else stmt
+            sort_by = keys
+        if window:
+            stmt = stmt.add_columns(func.count().over().label(WINDOW_COUNT_LABEL))
+        if cursor is None:
+            stmt = stmt.offset(offset)
+        stmt = self.apply_sorting(stmt, sort_by).limit(limit + 1 if peek else limit)
+
+        data = [dict(row) for row in (await db.exec(stmt)).mappings()]
+
+        page: dict[str, Any] = {}
+        has_more = len(data) > limit
+        data = data[:limit]
+        if keyset:
+            page["next_cursor"] = (
+                _encode_cursor(keys, [data[-1][field_name] for field_name, _ in keys])
+                if has_more
+                else None
+            )
+        elif peek:
+            page["has_more"] = has_more
+
+        window_count: int | None = None
+        for row in data:
+            for field_name in hidden:
+                row.pop(field_name, None)
+            if window:
+                window_count = row.pop(WINDOW_COUNT_LABEL)
+
+        if count == "none":
+            total_count = None
+        elif count == "estimate":
+            seen = (0 if cursor is not None else offset) + len(data) + has_more
+            estimate = await self.estimate_count(
+                db=db, stmt_without_pagination=stmt_without_pagination
+            )
+            total_count = max(estimate, seen)
+        elif window_count is not None or (window and offset == 0):
+            total_count = window_count or 0
+        else:
+            total_count = await self.total_count(
+                db=db, stmt_without_pagination=stmt_without_pagination
+            )
+
+        return {"data": data, "total_count": total_count, **page}
+
     async def get_multi(
         self,
         db: AsyncSession,
@@ -477,6 +934,9 @@ class RepositoryBase(
         limit: int = 100,
         sort_by: SortBy = None,
         schema_to_select: SchemaToSelect = None,
+        cursor: str | None = None,
+        keyset: bool = False,
+        count: CountMode = "exact",
         **kwargs: Any,
     ) -> dict[str, Any]:
         """
@@ -494,41 +954,37 @@ class RepositoryBase(
             A list of tuples where each tuple contains a field name and the direction ('asc' or 'desc').
         schema_to_select : type[SQLModel] | list[type[SQLModel]] | None, optional
             SQLModel (Pydantic) schema for selecting specific columns. Default is None to select all columns.
+        cursor : str | None, optional
+            Fetch the rows after this ``next_cursor`` instead of skipping ``offset`` rows.
+        keyset : bool, optional
+            Return a ``next_cursor`` for the page after this one. Implied by ``cursor``.
+        count : {"exact", "none", "estimate", "window"}, optional
+            How 'total_count' is obtained, see ``paginate``. Default is "exact".
         kwargs : dict
             Filters to apply to the query.
 
         Returns
         -------
         dict[str, Any]
-            Dictionary containing the fetched rows under 'data' key and total count under 'total_count'.
+            Dictionary containing the fetched rows under 'data' key and total count under 'total_count'
+            (and 'next_cursor' in keyset mode or 'has_more' for some count modes, see ``paginate``).
         """
-        to_select = _extract_matching_columns_from_schema(
-            model=self._model, schema=schema_to_select
-        )
-        stmt = select(*to_select)
+        stmt = self.select_columns(schema_to_select)
 
         # Apply filtering
         stmt = self.apply_filtering(stmt, **kwargs)
 
-        # Statement without pagination
-        stmt_without_pagination = stmt
-
-        # Apply sorting if provided
-        stmt = self.apply_sorting(stmt, sort_by)
-
-        # Add pagination
-        stmt = stmt.offset(offset).limit(limit)
-
-        result = await db.exec(stmt)
-        data = [dict(row) for row in result.mappings()]
-
-        # Get the total count of records matching the query
-        total_count: int = await self.total_count(
-            db=db, stmt_without_pagination=stmt_without_pagination
+        return await self.paginate(
+            db=db,
+            stmt=stmt,
+            offset=offset,
+            limit=limit,
+            sort_by=sort_by,
+            cursor=cursor,
+            keyset=keyset,
+            count=count,
         )
 
-        return {"data": data, "total_count": total_count}
-
     def _select_joined(
         self,
         join_model: type[ModelType],
@@ -801,16 +1257,7 @@ class RepositoryBase(
         else:
             update_data = object.model_dump(exclude_unset=True)
 
-        # Core ``update().values()`` does not fire ORM ``onupdate`` defaults
-        if "updated_at" in self._model.__table__.columns:
-            update_data["updated_at"] = datetime.now(UTC)
-
-        if "updated_by_user_id" in self._model.__table__.columns:
-            if "updated_by_user_id" not in update_data:
-                if "id" in current_user:
-                    update_data["updated_by_user_id"] = current_user["id"]
-                else:
-                    update_data["updated_by_user_id"] = settings.USER_SYSTEM_ID
+        update_data.update(self._update_audit_values(current_user, update_data))
 
         stmt = update(self._model).filter_by(**kwargs).values(update_data)
 
@@ -33,13 +33,15 @@ class PaginatedListResponse(ListResponse[SchemaType]):
     Fields:
     ----------
     - 'data' (List[SchemaType]): List of items in the response.
-    - 'total_count' (int): Total number of items.
+    - 'total_count' (int | None): Total number of items (estimated or omitted on request).
     - 'has_more' (bool): Whether there are more items beyond the current page.
     - 'page' (int | None): Current page number.
     - 'items_per_page' (int | None): Number of items per page.
+    - 'next_cursor' (str | None): Cursor of the next page, when paginating by cursor.
     """
 
-    total_count: int  # Total number of items
+    total_count: int | None  # Total number of items
     has_more: bool  # Whether there are more items beyond the current page
     page: int | None = None  # Current page number
     items_per_page: int | None = None  # Number of items per page
+    next_cursor: str | None = None  # Cursor of the next page, when paginating by cursor
@@ -38,6 +38,16 @@ class CryptSettings(BaseSettings):
     ALGORITHM: str = config("ALGORITHM", default="HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = config("ACCESS_TOKEN_EXPIRE_MINUTES", default=15)
     REFRESH_TOKEN_EXPIRE_DAYS: int = config("REFRESH_TOKEN_EXPIRE_DAYS", default=7)
+    PASSWORD_HASH_WORKERS: int = config("PASSWORD_HASH_WORKERS", default=4)  # bcrypt threads per worker process # fmt: skip
+    PASSWORD_HASH_MAX_QUEUE: int = config("PASSWORD_HASH_MAX_QUEUE", default=64)  # Hashes waiting for a thread before logins get 503 # fmt: skip
+    TOKEN_BLACKLIST_CHECK_INTERVAL: float = config("TOKEN_BLACKLIST_CHECK_INTERVAL", default=1.0)  # Seconds a revoked token may still pass on other workers # fmt: skip
+    TOKEN_BLACKLIST_BLOOM_CAPACITY: int = config("TOKEN_BLACKLIST_BLOOM_CAPACITY", default=100000)  # fmt: skip
+    TOKEN_BLACKLIST_BLOOM_ERROR_RATE: float = config("TOKEN_BLACKLIST_BLOOM_ERROR_RATE", default=0.001)  # fmt: skip
+    TOKEN_BLACKLIST_PURGE_INTERVAL: float = config("TOKEN_BLACKLIST_PURGE_INTERVAL", default=3600.0)  # Seconds between purges of expired revocations # fmt: skip
+    TOKEN_BLACKLIST_PURGE_BATCH_SIZE: int = config("TOKEN_BLACKLIST_PURGE_BATCH_SIZE", default=5000)  # Rows deleted per transaction # fmt: skip
+    PRINCIPAL_CACHE_TTL: int = config("PRINCIPAL_CACHE_TTL", default=60)  # Seconds a resolved user is reused per token; 0 disables # fmt: skip
+    PRINCIPAL_CACHE_LOCAL_TTL: int = config("PRINCIPAL_CACHE_LOCAL_TTL", default=5)  # Seconds it is kept in-process before asking Redis # fmt: skip
+    PRINCIPAL_CACHE_LOCAL_MAX_ENTRIES: int = config("PRINCIPAL_CACHE_LOCAL_MAX_ENTRIES", default=1024)  # In-process principals, apart from the response L1 # fmt: skip
 
 
 class EmailSettings(BaseSettings):
@@ -259,6 +269,13 @@ class RedisHashSettings(BaseSettings):
 class DefaultRateLimitSettings(BaseSettings):
     DEFAULT_RATE_LIMIT_LIMIT: int = config("DEFAULT_RATE_LIMIT_LIMIT", default=10)
     DEFAULT_RATE_LIMIT_PERIOD: int = config("DEFAULT_RATE_LIMIT_PERIOD", default=3600)
+    RATE_LIMIT_ALGORITHM: str = str(config("RATE_LIMIT_ALGORITHM", default="fixed_window")).lower()  # fixed_window | sliding_window | gcra # fmt: skip
+    RATE_LIMIT_RULES_CHECK_INTERVAL: float = config("RATE_LIMIT_RULES_CHECK_INTERVAL", default=1.0)
+    DEFAULT_RATE_LIMIT_LOCAL_BATCH: int = config("DEFAULT_RATE_LIMIT_LOCAL_BATCH", default=0)
+    RATE_LIMIT_SYNC_INTERVAL: float = config("RATE_LIMIT_SYNC_INTERVAL", default=0.1)
+    DEFAULT_RATE_LIMIT_MAX_CONCURRENCY: int = config("DEFAULT_RATE_LIMIT_MAX_CONCURRENCY", default=0)  # fmt: skip
+    RATE_LIMIT_LEASE_TTL: float = config("RATE_LIMIT_LEASE_TTL", default=30.0)
+    RATE_LIMIT_MIDDLEWARE: bool = str(config("RATE_LIMIT_MIDDLEWARE", default="True")).lower() == "true"  # fmt: skip
     TRUST_PROXY_HEADERS: bool = str(config("TRUST_PROXY_HEADERS", default="False")).lower() == "true"  # fmt: skip
 
 
@@ -266,6 +283,17 @@ class ClientSideCacheSettings(BaseSettings):
     CLIENT_CACHE_MAX_AGE: int = config("CLIENT_CACHE_MAX_AGE", default=60)
 
 
+class LocalCacheSettings(BaseSettings):
+    CACHE_LOCAL_MAX_ENTRIES: int = config("CACHE_LOCAL_MAX_ENTRIES", default=1024)  # 0 disables the in-process tier # fmt: skip
+    CACHE_INVALIDATION_CHANNEL: str = config("CACHE_INVALIDATION_CHANNEL", default="cache:invalidate")  # fmt: skip
+
+
+class CacheCodecSettings(BaseSettings):
+    CACHE_SERIALIZER: str = str(config("CACHE_SERIALIZER", default="json")).lower()  # json | orjson | msgpack # fmt: skip
+    CACHE_COMPRESSION: str = str(config("CACHE_COMPRESSION", default="zlib")).lower()  # none | zlib | zstd | lz4 # fmt: skip
+    CACHE_COMPRESSION_MIN_SIZE: int = config("CACHE_COMPRESSION_MIN_SIZE", default=1024)  # Bytes # fmt: skip
+
+
 class CORSSettings(BaseSettings):
     CORS_ALLOW_ORIGINS: List[str] | str = config("CORS_ALLOW_ORIGINS", default="*").split(",")
     CORS_ALLOW_METHODS: List[str] | str = config("CORS_ALLOW_METHODS", default="*").upper().split(",")  # fmt: skip
@@ -312,6 +340,8 @@ class Settings(
     TestSettings,
     RedisCacheSettings,
     ClientSideCacheSettings,
+    LocalCacheSettings,
+    CacheCodecSettings,
     CORSSettings,
     RedisBrokerSettings,
     RedisRateLimiterSettings,
@@ -137,6 +137,30 @@ async def local_session() -> AsyncGenerator[AsyncSession, None]:
             await db_session.close()
 
 
+# Session for API work that outlives its request (e.g. cache refreshes after the response)
+@asynccontextmanager
+async def detached_api_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provides an API-pool session that is not tied to a request's dependency lifecycle.
+
+    Use when work started by a route keeps running after the response is sent, so the
+    request-scoped ``async_get_db`` session may already be closed.
+
+    Yields
+    ------
+    AsyncSession
+        The database session.
+    """
+
+    async with _api_session_factory() as db_session:
+        try:
+            yield db_session
+        except SQLAlchemyError as e:
+            await db_session.rollback()
+            logger_postgres.error(f"Database error: {e}")
+            raise
+
+
 # Session dependency for FastAPI routes
 async def async_get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -11,6 +11,7 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 # Local Dependencies
 from src.core.exceptions.http_exceptions import CustomException
 from src.core.exceptions.problem import code_for_status, problem_body, status_title
+from src.core.exceptions.repository_exceptions import InvalidCursorError
 from src.core.logger import logger_api
 
 
@@ -69,6 +70,10 @@ async def validation_exception_handler(
     )
 
 
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError) -> JSONResponse:
+    return _problem_response(status_code=400, detail=exc.message, code="invalid_cursor")
+
+
 async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     logger_api.exception("Unhandled exception.")
     return _problem_response(
@@ -82,4 +87,5 @@ def register_exception_handlers(application: FastAPI) -> None:
     application.add_exception_handler(CustomException, http_exception_handler)
     application.add_exception_handler(StarletteHTTPException, http_exception_handler)
     application.add_exception_handler(RequestValidationError, validation_exception_handler)
+    application.add_exception_handler(InvalidCursorError, invalid_cursor_handler)
     application.add_exception_handler(Exception, unhandled_exception_handler)
@@ -16,6 +16,8 @@ class CustomException(HTTPException):
     detail : str, optional
         A detailed message providing information about the exception. If not provided, it defaults to the description
         associated with the specified status code.
+    headers : dict[str, str], optional
+        Extra response headers (e.g. ``Retry-After``).
     """
 
     code: str = "error"
@@ -24,13 +26,14 @@ class CustomException(HTTPException):
         self,
         status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
         detail: str | None = None,
+        headers: dict[str, str] | None = None,
     ):
         if not detail:
             try:
                 detail = HTTPStatus(status_code).description
             except ValueError:
                 detail = "Error"
-        super().__init__(status_code=status_code, detail=detail)
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
 
 
 class InternalErrorException(CustomException):
@@ -101,8 +104,10 @@ class RateLimitException(CustomException):
 
     code = "rate_limit_exceeded"
 
-    def __init__(self, detail: str | None = None):
-        super().__init__(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=detail)
+    def __init__(self, detail: str | None = None, headers: dict[str, str] | None = None):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=detail, headers=headers
+        )
 
 
 class ServiceUnavailableException(CustomException):
@@ -110,5 +115,7 @@ class ServiceUnavailableException(CustomException):
 
     code = "service_unavailable"
 
-    def __init__(self, detail: str | None = None):
-        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
+    def __init__(self, detail: str | None = None, headers: dict[str, str] | None = None):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail, headers=headers
+        )
@@ -0,0 +1,9 @@
+class InvalidCursorError(Exception):
+    """
+    Exception raised when a pagination cursor cannot be decoded or was issued for a
+    different sort order.
+    """
+
+    def __init__(self, message: str = "Invalid pagination cursor.") -> None:
+        self.message = message
+        super().__init__(self.message)
@@ -29,7 +29,9 @@ class ClientCacheMiddleware(BaseHTTPMiddleware):
 
     Note
     ----
-        - Authenticated requests (`Authorization` header) get `private, no-store`.
+        - Authenticated requests (`Authorization` header) get `private, no-store`, or
+          `private, no-cache` when the response has an `ETag`, so clients keep it and
+          revalidate with `If-None-Match` (a 304 when unchanged).
         - Unauthenticated responses use `public, max-age` for the configured duration.
     """
 
@@ -57,7 +59,10 @@ class ClientCacheMiddleware(BaseHTTPMiddleware):
         # Authenticated responses are user-specific and must never be cached
         # as public (browsers would serve stale library/content on soft refresh).
         if request.headers.get("Authorization"):
-            response.headers["Cache-Control"] = "private, no-store"
+            if "ETag" in response.headers:
+                response.headers["Cache-Control"] = "private, no-cache"
+            else:
+                response.headers["Cache-Control"] = "private, no-store"
         else:
             response.headers["Cache-Control"] = f"public, max-age={self.max_age}"
         return response
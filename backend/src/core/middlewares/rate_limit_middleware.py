@@ -0,0 +1,160 @@
+# Built-in Dependencies
+from typing import Any, Callable, Dict
+
+# Third-Party Dependencies
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+
+# Local Dependencies
+from src.core.exceptions.http_exceptions import RateLimitException
+from src.core.exceptions.handlers import http_exception_handler
+from src.core.logger import logger_api
+from src.core.utils import rate_limit
+
+# Set on the request state once the middleware has counted the request, so the
+# ``rate_limiter`` dependency does not count it again.
+CHECKED_STATE_KEY = "rate_limit_checked"
+# The ``RateLimitResult`` of whoever counted the request; turned into response headers.
+RESULT_STATE_KEY = "rate_limit_result"
+
+
+def uses_dependency(dependant: Any, dependency: Callable[..., Any]) -> bool:
+    """True if ``dependency`` appears anywhere in a route's dependency tree."""
+    for sub_dependant in getattr(dependant, "dependencies", ()):
+        if sub_dependant.call is dependency or uses_dependency(sub_dependant, dependency):
+            return True
+    return False
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI middleware that adds ``X-RateLimit-*`` headers to rate limited responses
+    and, with ``check_anonymous``, applies the default rate limit to anonymous callers
+    before routing, request validation or a database session.
+
+    Parameters
+    ----------
+    app: ASGIApp
+        The wrapped application.
+    dependency: Callable
+        The rate limit dependency; only routes that use it are counted here.
+    limit: int
+        Requests allowed per ``period`` (``DEFAULT_RATE_LIMIT_LIMIT``).
+    period: int
+        Window length in seconds (``DEFAULT_RATE_LIMIT_PERIOD``).
+    algorithm: str
+        ``RATE_LIMIT_ALGORITHM``.
+    local_batch: int
+        ``DEFAULT_RATE_LIMIT_LOCAL_BATCH``.
+    trust_proxy_headers: bool
+        ``TRUST_PROXY_HEADERS``, as for ``caller_identifier``.
+    check_anonymous: bool
+        ``RATE_LIMIT_MIDDLEWARE``; when False only the headers are added.
+
+    Note
+    ----
+        - The route is resolved through the app's ``RouteIndex`` and the caller from
+          the client address or proxy headers, i.e. with the same key as the
+          ``rate_limiter`` dependency, which then skips the request.
+        - Requests with an ``Authorization`` header pass through untouched: their tier
+          rules need the user, so the dependency limits them.
+        - If Redis fails, the request passes through and the dependency decides.
+        - Headers come from whichever side counted the request, so responses the
+          endpoint returns directly (e.g. cache hits) get them too.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        dependency: Callable[..., Any],
+        limit: int,
+        period: int,
+        algorithm: str = "fixed_window",
+        local_batch: int = 0,
+        trust_proxy_headers: bool = False,
+        check_anonymous: bool = True,
+    ) -> None:
+        self.app = app
+        self.dependency = dependency
+        self.limit = limit
+        self.period = period
+        self.algorithm = algorithm
+        self.local_batch = local_batch
+        self.trust_proxy_headers = trust_proxy_headers
+        self.check_anonymous = check_anonymous
+        self._limited_routes: Dict[int, bool] = {}
+
+    def _is_limited(self, route: Any) -> bool:
+        route_id = id(route)
+        if route_id not in self._limited_routes:
+            self._limited_routes[route_id] = uses_dependency(
+                getattr(route, "dependant", None), self.dependency
+            )
+        return self._limited_routes[route_id]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or rate_limit.client is None:
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+
+        async def send_with_headers(message: Message) -> None:
+            result = state.get(RESULT_STATE_KEY)
+            if message["type"] == "http.response.start" and result is not None:
+                headers = MutableHeaders(scope=message)
+                for name, value in rate_limit.rate_limit_headers(result).items():
+                    if name not in headers:
+                        headers[name] = value
+            await send(message)
+
+        request = Request(scope)
+        if not self.check_anonymous or request.headers.get("authorization"):
+            await self.app(scope, receive, send_with_headers)
+            return
+
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+        resolved = rate_limit.get_route_index(scope["app"]).resolve(path, scope["method"])
+        if resolved is None or not self._is_limited(resolved[0]):
+            await self.app(scope, receive, send_with_headers)
+            return
+
+        caller = rate_limit.caller_identifier(request, self.trust_proxy_headers)
+        if caller is None:
+            await self.app(scope, receive, send_with_headers)
+            return
+
+        try:
+            result = await rate_limit.check_rate_limit(
+                app=scope["app"],
+                user_id=caller,
+                path=rate_limit.sanitize_path(resolved[1]),
+                limit=self.limit,
+                period=self.period,
+                algorithm=self.algorithm,
+                local_batch=self.local_batch,
+            )
+        except Exception as e:
+            logger_api.warning(f"Rate limit middleware skipped after error: {e}")
+            await self.app(scope, receive, send_with_headers)
+            return
+
+        state[CHECKED_STATE_KEY] = True
+        if result is not None:
+            state[RESULT_STATE_KEY] = result
+            if not result.allowed:
+                response = await http_exception_handler(
+                    request,
+                    RateLimitException(
+                        detail="Rate limit exceeded.",
+                        headers=rate_limit.rate_limit_headers(result),
+                    ),
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send_with_headers)
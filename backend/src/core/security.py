@@ -11,11 +11,13 @@ from jwt import InvalidTokenError
 import bcrypt
 
 # Local Dependencies
-from src.apps.system.auth.schemas import TokenData, TokenBlacklistCreate
-from src.apps.system.auth.repositories import token_blacklist_repository
+from src.apps.system.auth.schemas import TokenData
+from src.apps.system.auth.blacklist import token_blacklist
 from src.apps.system.users.repositories import user_repository
 from src.core.config import settings
+from src.core.exceptions.http_exceptions import ServiceUnavailableException
 from src.core.utils import cache
+from src.core.utils.password_hasher import PasswordHasher, PasswordHasherBusyError
 
 # Constants for token-related settings
 SECRET_KEY = settings.SECRET_KEY
@@ -28,17 +30,34 @@ TOKEN_TYPE_REFRESH: Literal["refresh"] = "refresh"
 # OAuth2PasswordBearer instance for handling token retrieval from requests
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/system/auth/login")
 
+# bcrypt runs here, never on the event loop
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS, max_queue=settings.PASSWORD_HASH_MAX_QUEUE
+)
+
+
+async def _run_hasher(fn: Any, *args: Any) -> Any:
+    try:
+        return await password_hasher.run(fn, *args)
+    except PasswordHasherBusyError:
+        raise ServiceUnavailableException(
+            detail="Too many password operations in progress, try again shortly.",
+            headers={"Retry-After": "1"},
+        )
+
 
 # Function to verify plain password against hashed password
 async def verify_password(plain_password: str, hashed_password: str) -> bool:
-    correct_password: bool = bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    correct_password: bool = await _run_hasher(
+        bcrypt.checkpw, plain_password.encode(), hashed_password.encode()
+    )
     return correct_password
 
 
 # Function to generate hashed password from plain password
-def get_password_hash(password: str) -> str:
-    hashed_password: str = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
-    return hashed_password
+async def get_password_hash(password: str) -> str:
+    hashed: bytes = await _run_hasher(bcrypt.hashpw, password.encode(), bcrypt.gensalt())
+    return hashed.decode()
 
 
 # Function to authenticate a user based on provided credentials
@@ -114,16 +133,16 @@ async def verify_token(
         An instance of TokenData representing the user if the token is valid.
         None is returned if the token is invalid or the user is not active.
     """
-    is_blacklisted = await token_blacklist_repository.exists(db, token=token)
-    if is_blacklisted:
-        return None
-
     try:
         # Decode the token payload and extract the subject (username or email)
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         if payload.get("typ") != expected_type:
             return None
 
+        jti: str | None = payload.get("jti")
+        if jti is None or await token_blacklist.is_blacklisted(db, jti):
+            return None
+
         username_or_email: str | None = payload.get("sub")
         if username_or_email is None:
             return None
@@ -137,7 +156,9 @@ async def verify_token(
             )
 
             if is_active:
-                return TokenData(username_or_email=username_or_email)
+                return TokenData(
+                    username_or_email=username_or_email, jti=jti, exp=payload.get("exp")
+                )
 
         # If not active in Redis or Redis is not available, check PostgreSQL
         user = await user_repository.get(db=db, username=username_or_email, is_deleted=False)
@@ -151,7 +172,7 @@ async def verify_token(
                     "active",
                 )
 
-            return TokenData(username_or_email=username_or_email)
+            return TokenData(username_or_email=username_or_email, jti=jti, exp=payload.get("exp"))
 
         # If user is not found in Redis or PostgreSQL, blacklist the token
         await blacklist_token(token=token, db=db)
@@ -162,11 +183,7 @@ async def verify_token(
         return None
 
 
-# Function to blacklist a token by storing it in the database
+# Function to blacklist a token until it expires (Postgres, Redis and the local filter)
 async def blacklist_token(token: str, db: AsyncSession) -> None:
     payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    expires_at = datetime.fromtimestamp(payload.get("exp"))
-    await token_blacklist_repository.create(
-        db,
-        object=TokenBlacklistCreate(**{"token": token, "expires_at": expires_at}),
-    )
+    await token_blacklist.add(db, token=token, jti=payload["jti"], expires_at=payload["exp"])
@@ -14,6 +14,8 @@ import anyio
 
 # Local Dependencies
 from src.core.middlewares.client_cache_middleware import ClientCacheMiddleware
+from src.core.middlewares.rate_limit_middleware import RateLimitMiddleware
+from src.apps.system.rate_limits.deps import rate_limiter
 from src.core.exceptions.handlers import register_exception_handlers
 from src.apps.system.auth.deps import get_current_superuser
 from src.core.db.session import async_engine as engine
@@ -21,6 +23,7 @@ from src.core.utils.alembic import get_latest_migration_version
 from src.core.utils.log import log_system_info
 from src.apps._management.commands import seed
 from src.core.utils import cache, rate_limit
+from src.core.security import password_hasher
 from src.core.config import settings
 from src.core.logger import logger_api
 from src.core.config import (
@@ -31,6 +34,7 @@ from src.core.config import (
     CORSSettings,
     RedisBrokerSettings,
     RedisRateLimiterSettings,
+    DefaultRateLimitSettings,
     EnvironmentOption,
     EnvironmentSettings,
 )
@@ -118,16 +122,23 @@ async def run_seed_scripts() -> None:
 # --------------------------------------
 # Function to create Redis cache pool during startup
 async def create_redis_cache_pool() -> None:
+    # Cache entries are binary (see cache_codec), so responses stay as bytes.
     cache.pool = redis.ConnectionPool.from_url(
         settings.REDIS_CACHE_URL,
         encoding="utf8",
-        decode_responses=True,
+        decode_responses=False,
     )
     cache.client = redis.Redis.from_pool(cache.pool)  # type: ignore
 
 
+# Function to subscribe to cross-worker L1 cache invalidations during startup
+async def start_cache_invalidation_listener() -> None:
+    await cache.start_invalidation_listener()
+
+
 # Function to close Redis cache pool during shutdown
 async def close_redis_cache_pool() -> None:
+    await cache.stop_invalidation_listener()
     await cache.client.aclose()  # type: ignore
 
 
@@ -146,6 +157,7 @@ async def create_redis_rate_limit_pool() -> None:
 
 # Function to close Redis rate limit pool during shutdown
 async def close_redis_rate_limit_pool() -> None:
+    await rate_limit.stop_local_sync()
     await rate_limit.client.aclose()  # type: ignore
 
 
@@ -190,15 +202,20 @@ async def lifespan_context(
 
     if isinstance(settings_obj, RedisCacheSettings):
         await create_redis_cache_pool()
+        await start_cache_invalidation_listener()
 
     if isinstance(settings_obj, RedisRateLimiterSettings):
         await create_redis_rate_limit_pool()
+        await rate_limit.load_rate_limit_scripts()
+        await rate_limit.start_local_sync(settings.RATE_LIMIT_SYNC_INTERVAL)
+        rate_limit.refresh_route_index(application)
 
     # Yield control back to the application
     yield
 
     # -------- SHUTDOWN --------
     await shutdown_logging()
+    password_hasher.shutdown()
 
     if isinstance(settings_obj, RedisCacheSettings):
         await close_redis_cache_pool()
@@ -288,6 +305,19 @@ def create_application(
     # --------------------------------------
     application.include_router(router)
 
+    if isinstance(settings, DefaultRateLimitSettings):
+        # Added first so CORS and client cache headers still wrap its 429 responses
+        application.add_middleware(
+            RateLimitMiddleware,
+            dependency=rate_limiter,
+            limit=settings.DEFAULT_RATE_LIMIT_LIMIT,
+            period=settings.DEFAULT_RATE_LIMIT_PERIOD,
+            algorithm=settings.RATE_LIMIT_ALGORITHM,
+            local_batch=settings.DEFAULT_RATE_LIMIT_LOCAL_BATCH,
+            trust_proxy_headers=settings.TRUST_PROXY_HEADERS,
+            check_anonymous=settings.RATE_LIMIT_MIDDLEWARE,
+        )
+
     if isinstance(settings, ClientSideCacheSettings):
         # Add middleware for client-side caching with specified max age if environment is not local (development)
         if settings.ENVIRONMENT.value != settings.ENVIRONMENT.LOCAL.value:
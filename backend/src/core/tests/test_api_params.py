@@ -3,7 +3,12 @@ import pytest
 from fastapi import HTTPException
 
 # Local Dependencies
-from src.core.utils.api_params import compute_offset, paginated_response, parse_sort_order
+from src.core.utils.api_params import (
+    compute_offset,
+    cursor_paginated_response,
+    paginated_response,
+    parse_sort_order,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -50,3 +55,29 @@ def test_parse_sort_order_rejects_invalid_field() -> None:
         parse_sort_order(sort_by=["unknown"], allowed_sort_fields=["name"])
 
     assert exc_info.value.status_code == 422
+
+
+def test_paginated_response_prefers_fetched_has_more() -> None:
+    payload = paginated_response(
+        data={"data": [1, 2], "total_count": None, "has_more": False},
+        page=3,
+        items_per_page=2,
+    )
+    assert payload["has_more"] is False
+    assert payload["total_count"] is None
+
+
+def test_cursor_paginated_response_has_more_from_next_cursor() -> None:
+    payload = cursor_paginated_response(
+        data={"data": [1, 2], "total_count": 25, "next_cursor": "abc"},
+        items_per_page=2,
+    )
+    assert payload["has_more"] is True
+    assert payload["next_cursor"] == "abc"
+    assert payload["page"] is None
+
+    last = cursor_paginated_response(
+        data={"data": [1], "total_count": 25, "next_cursor": None}, items_per_page=2, page=13
+    )
+    assert last["has_more"] is False
+    assert last["page"] == 13
@@ -1,10 +1,15 @@
 # Built-in Dependencies
-from unittest.mock import AsyncMock, patch
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
 
 # Third-Party Dependencies
 import pytest
-from fastapi import Request
+from fastapi import FastAPI, Request, Response
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Local Dependencies
 from src.core.exceptions.cache_exceptions import (
@@ -12,11 +17,19 @@ from src.core.exceptions.cache_exceptions import (
     InvalidRequestError,
 )
 from src.core.utils import cache as cache_mod
+from src.core.utils.cache_codec import CacheEntry
 from src.core.utils.cache import (
+    _INVALIDATE_TAGS_SCRIPT,
+    _MISS,
+    _RELEASE_LOCK_SCRIPT,
+    LocalCache,
+    _apply_invalidation_message,
     _as_scan_pattern,
+    _call_detached,
     _delete_keys_by_pattern,
     _format_prefix,
     _infer_resource_id,
+    _needs_refresh,
     cache,
 )
 
@@ -135,6 +148,22 @@ async def test_cache_get_hit_skips_handler() -> None:
     assert calls["n"] == 0
 
 
+async def test_cache_get_treats_other_format_version_as_miss() -> None:
+    stored = cache_mod.codec.encode({"id": "cached"})
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=bytes([stored[0] + 1]) + stored[1:])
+
+    @cache(key_prefix="blog:post", resource_id_name="post_id")
+    async def read_post(request: Request, post_id: str) -> dict:
+        return {"id": "fresh"}
+
+    with patch.object(cache_mod, "client", mock_client):
+        result = await read_post(_request("GET"), post_id="abc")
+
+    assert result == {"id": "fresh"}
+    mock_client.set.assert_awaited_once()
+
+
 async def test_cache_get_infers_uuid_resource_id() -> None:
     mock_client = AsyncMock()
     mock_client.get = AsyncMock(return_value=None)
@@ -250,6 +279,23 @@ async def test_cache_patch_deletes_item_key() -> None:
     mock_client.delete.assert_any_await("blog:post:p1")
 
 
+async def test_cache_write_deletes_all_keys_in_one_call() -> None:
+    mock_client = AsyncMock()
+
+    @cache(
+        key_prefix="blog:post",
+        resource_id_name="post_id",
+        to_invalidate_extra={"system:user": "{user_id}"},
+    )
+    async def patch_post(request: Request, user_id: str, post_id: str) -> dict:
+        return {"message": "updated"}
+
+    with patch.object(cache_mod, "client", mock_client):
+        await patch_post(_request("PATCH"), user_id="u1", post_id="p1")
+
+    mock_client.delete.assert_awaited_once_with("blog:post:p1", "system:user:u1")
+
+
 async def test_cache_write_invalidation_failure_does_not_hide_result() -> None:
     mock_client = AsyncMock()
     mock_client.delete = AsyncMock(side_effect=ConnectionError("redis down"))
@@ -262,3 +308,485 @@ async def test_cache_write_invalidation_failure_does_not_hide_result() -> None:
         result = await patch_post(_request("PATCH"), post_id="p1")
 
     assert result == {"message": "updated"}
+
+
+async def test_cache_get_indexes_key_under_formatted_tags() -> None:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True])
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(return_value=None)
+    mock_client.pipeline.return_value = pipe
+
+    @cache(
+        key_prefix="blog:posts:user:{user_id}:page",
+        resource_id_name="page",
+        expiration=60,
+        tags=["blog:posts", "blog:posts:user:{user_id}"],
+    )
+    async def read_posts(request: Request, user_id: str, page: int) -> dict:
+        return {"data": []}
+
+    with patch.object(cache_mod, "client", mock_client):
+        await read_posts(_request("GET"), user_id="u1", page=1)
+
+    pipe.set.assert_called_once()
+    assert pipe.set.call_args.args[0] == "blog:posts:user:u1:page:1"
+    indexed = [call.args[0] for call in pipe.zadd.call_args_list]
+    assert indexed == ["tag:blog:posts", "tag:blog:posts:user:u1"]
+    assert pipe.zadd.call_args.args[1].keys() == {"blog:posts:user:u1:page:1"}
+    assert pipe.zremrangebyscore.call_count == 2
+    expire_flags = [call.kwargs for call in pipe.expire.call_args_list]
+    assert {"nx": True} in expire_flags and {"gt": True} in expire_flags
+    pipe.execute.assert_awaited_once()
+
+
+async def test_cache_write_invalidates_tags_in_one_script_call() -> None:
+    mock_client = AsyncMock()
+
+    @cache(
+        key_prefix="blog:post",
+        resource_id_name="post_id",
+        tags_to_invalidate=["blog:posts:user:{user_id}"],
+    )
+    async def patch_post(request: Request, user_id: str, post_id: str) -> dict:
+        return {"message": "updated"}
+
+    with patch.object(cache_mod, "client", mock_client):
+        await patch_post(_request("PATCH"), user_id="u1", post_id="p1")
+
+    mock_client.delete.assert_awaited_once_with("blog:post:p1")
+    mock_client.eval.assert_awaited_once_with(_INVALIDATE_TAGS_SCRIPT, 1, "tag:blog:posts:user:u1")
+    mock_client.scan.assert_not_called()
+
+
+async def test_cache_get_rejects_tags_to_invalidate() -> None:
+    @cache(
+        key_prefix="blog:post",
+        resource_id_name="post_id",
+        tags_to_invalidate=["blog:posts"],
+    )
+    async def read_post(request: Request, post_id: str) -> dict:
+        return {"id": post_id}
+
+    with pytest.raises(InvalidRequestError):
+        await read_post(_request("GET"), post_id="abc")
+
+
+def test_local_cache_evicts_least_recently_used() -> None:
+    local = LocalCache(max_entries=2)
+    local.set("a", 1, ttl=60)
+    local.set("b", 2, ttl=60)
+    assert local.get("a") == 1
+    local.set("c", 3, ttl=60)
+    assert local.get("b") is _MISS
+    assert local.get("a") == 1
+    assert local.get("c") == 3
+
+
+def test_local_cache_expires_entries() -> None:
+    local = LocalCache(max_entries=10)
+    with patch.object(cache_mod.time, "monotonic", return_value=100.0):
+        local.set("a", 1, ttl=5)
+    with patch.object(cache_mod.time, "monotonic", return_value=105.0):
+        assert local.get("a") is _MISS
+    assert len(local) == 0
+
+
+def test_local_cache_evicts_by_tag_key_and_pattern() -> None:
+    local = LocalCache(max_entries=10)
+    local.set("blog:post:p1", 1, ttl=60, tag_keys=["tag:blog:post"])
+    local.set("blog:posts:user:u1:page:1", 2, ttl=60)
+    local.set("blog:tag:t1", 3, ttl=60)
+    local.evict_tags(["tag:blog:post"])
+    local.evict_patterns(["blog:posts:user:u1:*"])
+    local.evict_keys(["blog:tag:t1"])
+    assert len(local) == 0
+
+
+def test_apply_invalidation_message_clears_on_garbage() -> None:
+    local = LocalCache(max_entries=10)
+    local.set("blog:post:p1", 1, ttl=60)
+    local.set("blog:post:p2", 2, ttl=60)
+    with patch.object(cache_mod, "local_cache", local):
+        _apply_invalidation_message('{"keys": ["blog:post:p1"]}')
+        assert local.get("blog:post:p1") is _MISS
+        assert local.get("blog:post:p2") == 2
+        _apply_invalidation_message("not json")
+    assert len(local) == 0
+
+
+async def test_cache_get_serves_local_hit_without_redis() -> None:
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value='{"id": "cached"}')
+    calls = {"n": 0}
+
+    @cache(key_prefix="blog:post", resource_id_name="post_id", local_ttl=5)
+    async def read_post(request: Request, post_id: str) -> dict:
+        calls["n"] += 1
+        return {"id": "fresh"}
+
+    with (
+        patch.object(cache_mod, "client", mock_client),
+        patch.object(cache_mod, "local_cache", LocalCache(max_entries=10)),
+    ):
+        first = await read_post(_request("GET"), post_id="abc")
+        second = await read_post(_request("GET"), post_id="abc")
+
+    assert first == second == {"id": "cached"}
+    assert calls["n"] == 0
+    mock_client.get.assert_awaited_once()
+
+
+async def test_cache_write_evicts_local_and_publishes() -> None:
+    mock_client = AsyncMock()
+    local = LocalCache(max_entries=10)
+    local.set("blog:post:p1", {"id": "p1"}, ttl=60)
+
+    @cache(
+        key_prefix="blog:post",
+        resource_id_name="post_id",
+        tags_to_invalidate=["blog:posts:user:{user_id}"],
+    )
+    async def patch_post(request: Request, user_id: str, post_id: str) -> dict:
+        return {"message": "updated"}
+
+    with (
+        patch.object(cache_mod, "client", mock_client),
+        patch.object(cache_mod, "local_cache", local),
+    ):
+        await patch_post(_request("PATCH"), user_id="u1", post_id="p1")
+
+    assert local.get("blog:post:p1") is _MISS
+    mock_client.publish.assert_awaited_once()
+    channel, message = mock_client.publish.await_args.args
+    assert channel == cache_mod.settings.CACHE_INVALIDATION_CHANNEL
+    assert '"blog:post:p1"' in message
+    assert '"tag:blog:posts:user:u1"' in message
+
+
+async def test_cache_get_coalesces_concurrent_misses() -> None:
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=None)
+    calls = {"n": 0}
+
+    @cache(key_prefix="blog:posts:user:{user_id}:page", resource_id_name="page")
+    async def read_posts(request: Request, user_id: str, page: int) -> dict:
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        return {"data": [calls["n"]]}
+
+    with patch.object(cache_mod, "client", mock_client):
+        results = await asyncio.gather(
+            *(read_posts(_request("GET"), user_id="u1", page=1) for _ in range(5))
+        )
+
+    assert calls["n"] == 1
+    assert all(result == {"data": [1]} for result in results)
+    mock_client.set.assert_awaited_once()
+    assert cache_mod._inflight == {}
+
+
+async def test_cache_get_coalesced_callers_share_handler_error() -> None:
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=None)
+    calls = {"n": 0}
+
+    @cache(key_prefix="blog:post", resource_id_name="post_id")
+    async def read_post(request: Request, post_id: str) -> dict:
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        raise LookupError("missing")
+
+    with patch.object(cache_mod, "client", mock_client):
+        results = await asyncio.gather(
+            *(read_post(_request("GET"), post_id="abc") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    assert calls["n"] == 1
+    assert all(isinstance(result, LookupError) for result in results)
+
+
+async def test_cache_get_lock_holder_loads_and_releases() -> None:
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=None)
+    mock_client.set = AsyncMock(return_value=True)
+
+    @cache(key_prefix="blog:post", resource_id_name="post_id", lock_timeout=2)
+    async def read_post(request: Request, post_id: str) -> dict:
+        return {"id": post_id}
+
+    with patch.object(cache_mod, "client", mock_client):
+        result = await read_post(_request("GET"), post_id="abc")
+
+    assert result == {"id": "abc"}
+    lock_call = mock_client.set.await_args_list[0]
+    assert lock_call.args[0] == "lock:blog:post:abc"
+    assert lock_call.kwargs == {"nx": True, "px": 2000}
+    token = lock_call.args[1]
+    mock_client.eval.assert_awaited_once_with(_RELEASE_LOCK_SCRIPT, 1, "lock:blog:post:abc", token)
+
+
+async def test_cache_get_lock_loser_waits_for_holder_value() -> None:
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=[None, None, '{"id": "from-holder"}'])
+    mock_client.set = AsyncMock(return_value=None)
+    calls = {"n": 0}
+
+    @cache(key_prefix="blog:post", resource_id_name="post_id", lock_timeout=1)
+    async def read_post(request: Request, post_id: str) -> dict:
+        calls["n"] += 1
+        return {"id": "fresh"}
+
+    with (
+        patch.object(cache_mod, "client", mock_client),
+        patch.object(cache_mod, "LOCK_POLL_INTERVAL", 0),
+    ):
+        result = await read_post(_request("GET"), post_id="abc")
+
+    assert result == {"id": "from-holder"}
+    assert calls["n"] == 0
+    mock_client.eval.assert_not_called()
+
+
+async def test_cache_get_lock_loser_loads_after_timeout() -> None:
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=None)
+    mock_client.set = AsyncMock(return_value=None)
+
+    @cache(key_prefix="blog:post", resource_id_name="post_id", lock_timeout=0.01)
+    async def read_post(request: Request, post_id: str) -> dict:
+        return {"id": "fresh"}
+
+    with (
+        patch.object(cache_mod, "client", mock_client),
+        patch.object(cache_mod, "LOCK_POLL_INTERVAL", 0.005),
+    ):
+        result = await read_post(_request("GET"), post_id="abc")
+
+    assert result == {"id": "fresh"}
+
+
+def test_needs_refresh_when_stale_or_xfetch_fires() -> None:
+    assert _needs_refresh(fresh_until=100.0, delta=0.5, beta=None, now=100.0) is True
+    assert _needs_refresh(fresh_until=100.0, delta=0.5, beta=None, now=99.0) is False
+    # -log(1 - 0.99) ~= 4.6, so 0.5 s of compute pushes the deadline ~2.3 s earlier.
+    with patch.object(cache_mod.random, "random", return_value=0.99):
+        assert _needs_refresh(fresh_until=100.0, delta=0.5, beta=1.0, now=98.0) is True
+    with patch.object(cache_mod.random, "random", return_value=0.0):
+        assert _needs_refresh(fresh_until=100.0, delta=0.5, beta=1.0, now=98.0) is False
+
+
+async def test_call_detached_swaps_request_sessions() -> None:
+    request_session = MagicMock(spec=AsyncSession)
+    fresh_session = object()
+
+    @asynccontextmanager
+    async def _detached():
+        yield fresh_session
+
+    async def handler(request: Request, db: AsyncSession, page: int) -> dict:
+        return {"db": db, "page": page}
+
+    with patch.object(cache_mod, "detached_api_session", _detached):
+        result = await _call_detached(
+            handler, _request("GET"), (), {"db": request_session, "page": 2}
+        )
+
+    assert result == {"db": fresh_session, "page": 2}
+
+
+async def test_cache_get_stores_freshness_envelope_with_stale_ttl() -> None:
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=None)
+
+    @cache(key_prefix="blog:post", resource_id_name="post_id", expiration=60, stale_ttl=30)
+    async def read_post(request: Request, post_id: str) -> dict:
+        return {"id": post_id}
+
+    with patch.object(cache_mod, "client", mock_client):
+        await read_post(_request("GET"), post_id="abc")
+
+    stored = mock_client.set.await_args
+    assert stored.kwargs["ex"] == 90
+    entry = CacheEntry(stored.args[1])
+    assert entry.value == {"id": "abc"}
+    assert entry.fresh_until is not None and entry.delta >= 0
+
+
+async def test_cache_get_serves_stale_and_refreshes_in_background() -> None:
+    stale = cache_mod.codec.encode({"id": "old"}, fresh_until=1.0, delta=0.1)
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=stale)
+    mock_client.set = AsyncMock(return_value=True)
+    calls = {"n": 0}
+
+    @cache(key_prefix="blog:post", resource_id_name="post_id", expiration=60, stale_ttl=30)
+    async def read_post(request: Request, post_id: str) -> dict:
+        calls["n"] += 1
+        return {"id": "new"}
+
+    with patch.object(cache_mod, "client", mock_client):
+        result = await read_post(_request("GET"), post_id="abc")
+        assert result == {"id": "old"}
+        await asyncio.gather(*cache_mod._background_tasks)
+
+    assert calls["n"] == 1
+    lock_call, store_call = mock_client.set.await_args_list
+    assert lock_call.args[0] == "lock:blog:post:abc"
+    assert CacheEntry(store_call.args[1]).value == {"id": "new"}
+    mock_client.eval.assert_awaited_once()
+    assert cache_mod._refreshing == set()
+
+
+async def test_cache_get_raw_response_stores_and_serves_body() -> None:
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=None)
+
+    @cache(key_prefix="blog:post", resource_id_name="post_id", raw_response=True)
+    async def read_post(request: Request, post_id: str) -> dict:
+        return {"id": post_id}
+
+    with patch.object(cache_mod, "client", mock_client):
+        missed = await read_post(_request("GET"), post_id="abc")
+        stored = mock_client.set.await_args.args[1]
+        mock_client.get = AsyncMock(return_value=stored)
+        hit = await read_post(_request("GET"), post_id="abc")
+
+    assert CacheEntry(stored).value == b'{"id":"abc"}'
+    for response in (missed, hit):
+        assert isinstance(response, Response)
+        assert response.body == b'{"id":"abc"}'
+        assert response.media_type == "application/json"
+
+
+async def test_cache_get_raw_response_passes_decoded_entries_through() -> None:
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=cache_mod.codec.encode({"id": "old"}))
+
+    @cache(key_prefix="blog:post", resource_id_name="post_id", raw_response=True)
+    async def read_post(request: Request, post_id: str) -> dict:
+        return {"id": post_id}
+
+    with patch.object(cache_mod, "client", mock_client):
+        result = await read_post(_request("GET"), post_id="abc")
+
+    assert result == {"id": "old"}
+
+
+async def test_cache_raw_response_matches_uncached_route_body() -> None:
+    class Item(BaseModel):
+        id: str
+        name: str
+
+    app = FastAPI()
+    store: dict = {}
+
+    async def fake_get(key: str) -> bytes | None:
+        return store.get(key)
+
+    async def fake_set(key: str, value: bytes, ex: int) -> None:
+        store[key] = value
+
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=fake_get)
+    mock_client.set = AsyncMock(side_effect=fake_set)
+
+    @app.get("/plain/{item_id}", response_model=Item)
+    async def plain(request: Request, item_id: str) -> dict:
+        return {"id": item_id, "name": "ü", "secret": "hidden"}
+
+    @app.get("/cached/{item_id}", response_model=Item)
+    @cache(key_prefix="item", resource_id_name="item_id", raw_response=True)
+    async def cached(request: Request, item_id: str) -> dict:
+        return {"id": item_id, "name": "ü", "secret": "hidden"}
+
+    with patch.object(cache_mod, "client", mock_client):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as http:
+            expected = await http.get("/plain/a")
+            missed = await http.get("/cached/a")
+            hit = await http.get("/cached/a")
+
+    assert "secret" not in expected.text
+    assert missed.content == hit.content == expected.content
+    assert hit.headers["content-type"] == expected.headers["content-type"]
+    assert missed.headers["etag"] == hit.headers["etag"]
+    assert mock_client.set.await_count == 1
+
+
+async def test_cache_get_folds_namespace_generation_into_key() -> None:
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=[b"7", None])
+
+    @cache(
+        key_prefix="blog:posts:user:{user_id}:page",
+        resource_id_name="page",
+        namespace="blog:posts:user:{user_id}",
+    )
+    async def read_posts(request: Request, user_id: str, page: int) -> dict:
+        return {"page": page}
+
+    with patch.object(cache_mod, "client", mock_client):
+        await read_posts(_request("GET"), user_id="u1", page=1)
+
+    gen_call, key_call = mock_client.get.await_args_list
+    assert gen_call.args[0] == "gen:blog:posts:user:u1"
+    assert key_call.args[0] == "blog:posts:user:u1:page:g7:1"
+    assert mock_client.set.await_args.args[0] == "blog:posts:user:u1:page:g7:1"
+
+
+async def test_cache_write_bumps_namespace_generation() -> None:
+    mock_client = MagicMock()
+    mock_client.delete = AsyncMock()
+    mock_client.publish = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    mock_client.pipeline.return_value = pipe
+    local = LocalCache(max_entries=8)
+    local.set("blog:posts:user:u1:page:1", {"page": 1}, ttl=60, tag_keys=["gen:blog:posts:user:u1"])
+
+    @cache(key_prefix="blog:post", namespaces_to_invalidate=["blog:posts:user:{user_id}"])
+    async def create_post(request: Request, user_id: str) -> dict:
+        return {"id": "p1"}
+
+    with (
+        patch.object(cache_mod, "client", mock_client),
+        patch.object(cache_mod, "local_cache", local),
+    ):
+        await create_post(_request("POST"), user_id="u1")
+
+    pipe.incr.assert_called_once_with("gen:blog:posts:user:u1")
+    mock_client.scan.assert_not_called()
+    assert len(local) == 0
+    assert '"gen:blog:posts:user:u1"' in mock_client.publish.await_args.args[1]
+
+
+async def test_cache_get_rejects_namespaces_to_invalidate() -> None:
+    @cache(key_prefix="blog:post", resource_id_name="post_id", namespaces_to_invalidate=["x"])
+    async def read_post(request: Request, post_id: str) -> dict:
+        return {}
+
+    with pytest.raises(InvalidRequestError):
+        await read_post(_request("GET"), post_id="abc")
+
+
+async def test_cache_get_raw_response_answers_matching_etag_with_304() -> None:
+    stored = cache_mod.codec.encode_body(b'{"id":"abc"}')
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=stored)
+    etag = f'"{CacheEntry(stored).fingerprint}"'
+
+    @cache(key_prefix="blog:post", resource_id_name="post_id", raw_response=True)
+    async def read_post(request: Request, post_id: str) -> dict:
+        return {"id": post_id}
+
+    request = _request("GET")
+    with patch.object(cache_mod, "client", mock_client):
+        fresh = await read_post(request, post_id="abc")
+        request.scope["headers"] = [(b"if-none-match", etag.encode())]
+        revalidated = await read_post(Request(request.scope), post_id="abc")
+
+    assert fresh.status_code == 200
+    assert fresh.headers["ETag"] == etag
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
@@ -0,0 +1,101 @@
+# Built-in Dependencies
+import json
+from unittest.mock import patch
+
+# Third-Party Dependencies
+import pytest
+
+# Local Dependencies
+from src.core.utils import cache_codec
+from src.core.utils.cache_codec import (
+    FORMAT_VERSION,
+    CacheCodec,
+    CacheEntry,
+    get_compressor,
+    get_serializer,
+    read_entry,
+)
+
+pytestmark = pytest.mark.unit
+
+PAGE = {
+    "data": [{"id": str(index), "text": "lorem ipsum " * 500} for index in range(3)],
+    "total_count": 3,
+    "has_more": False,
+    "page": 1,
+    "items_per_page": 10,
+}
+
+
+def _codec(serializer: str = "json", compressor: str = "zlib", min_size: int = 64) -> CacheCodec:
+    return CacheCodec(get_serializer(serializer), get_compressor(compressor), min_size)
+
+
+def test_codec_round_trips_with_version_header() -> None:
+    raw = _codec().encode(PAGE, fresh_until=123.5, delta=0.25)
+    assert raw[0] == FORMAT_VERSION
+    entry = CacheEntry(raw)
+    assert entry.fresh_until == 123.5
+    assert entry.delta == 0.25
+    assert entry.value == PAGE
+
+
+def test_codec_compresses_only_above_threshold() -> None:
+    large = _codec(min_size=64).encode(PAGE)
+    assert CacheEntry(large).compressor_id == get_compressor("zlib").id
+    assert len(large) < len(json.dumps(PAGE))
+
+    small = _codec(min_size=64).encode({"id": "a"})
+    assert CacheEntry(small).compressor_id == 0
+    assert CacheEntry(small).value == {"id": "a"}
+
+
+def test_cache_entry_reads_legacy_json_text() -> None:
+    entry = CacheEntry('{"id": "a"}')
+    assert entry.is_legacy is True
+    assert entry.fresh_until is None
+    assert entry.value == {"id": "a"}
+
+
+@pytest.mark.parametrize("raw", ['["a"]', '"a"'])
+def test_cache_entry_detects_legacy_json_by_shape(raw: str) -> None:
+    assert CacheEntry(raw).is_legacy is True
+    assert CacheEntry(raw).value == json.loads(raw)
+
+
+def test_entry_from_another_format_version_is_a_miss() -> None:
+    raw = _codec().encode(PAGE)
+    other_version = bytes([FORMAT_VERSION + 1]) + raw[1:]
+
+    with pytest.raises(ValueError):
+        CacheEntry(other_version)
+    assert read_entry(other_version) is None
+    assert read_entry(b"") is None
+    assert read_entry(None) is None
+    assert read_entry(raw).value == PAGE
+
+
+def test_cache_entry_decodes_lazily_once() -> None:
+    entry = CacheEntry(_codec().encode(PAGE))
+    serializer = cache_codec._serializer_by_id(entry.serializer_id)
+    with patch.object(cache_codec, "_serializer_by_id", return_value=serializer) as lookup:
+        assert entry.fresh_until is None
+        lookup.assert_not_called()
+        assert entry.value == PAGE
+        assert entry.value == PAGE
+    lookup.assert_called_once()
+
+
+def test_unknown_codec_names_are_rejected() -> None:
+    with pytest.raises(ValueError, match="serializer"):
+        get_serializer("pickle")
+    with pytest.raises(ValueError, match="compressor"):
+        get_compressor("brotli")
+
+
+def test_codec_encode_body_round_trips_bytes() -> None:
+    body = json.dumps(PAGE).encode()
+    entry = CacheEntry(_codec().encode_body(body, fresh_until=5.0))
+    assert entry.compressor_id == get_compressor("zlib").id
+    assert entry.fresh_until == 5.0
+    assert entry.value == body
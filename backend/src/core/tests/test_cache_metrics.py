@@ -0,0 +1,96 @@
+# Built-in Dependencies
+import math
+from unittest.mock import AsyncMock, patch
+
+# Third-Party Dependencies
+import pytest
+from fastapi import Request
+
+# Local Dependencies
+from src.core.utils import cache as cache_mod
+from src.core.utils.cache import cache
+from src.core.utils.cache_metrics import (
+    SIZE_BUCKETS,
+    CacheMetrics,
+    Histogram,
+    cache_metrics,
+    prefix_scan_pattern,
+    render_metric,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _request() -> Request:
+    return Request({"type": "http", "method": "GET", "headers": []})
+
+
+def test_histogram_places_values_in_upper_bound_bucket() -> None:
+    histogram = Histogram(SIZE_BUCKETS)
+    histogram.observe(256)
+    histogram.observe(257)
+    histogram.observe(10**9)
+
+    assert histogram.counts[0] == 1
+    assert histogram.counts[1] == 1
+    assert histogram.counts[-1] == 1
+    assert histogram.count == 3
+
+
+def test_render_prometheus_uses_cumulative_buckets() -> None:
+    metrics = CacheMetrics()
+    prefix = metrics.register('blog:"post"')
+    prefix.hits = 2
+    prefix.payload_bytes.observe(100)
+    prefix.payload_bytes.observe(2000)
+
+    text = metrics.render_prometheus()
+
+    assert 'cache_hits_total{prefix="blog:\\"post\\""} 2' in text
+    assert 'cache_payload_bytes_bucket{prefix="blog:\\"post\\"",le="256"} 1' in text
+    assert 'cache_payload_bytes_bucket{prefix="blog:\\"post\\"",le="+Inf"} 2' in text
+    assert 'cache_payload_bytes_count{prefix="blog:\\"post\\""} 2' in text
+
+
+def test_render_metric_renders_unlabelled_samples() -> None:
+    histogram = Histogram((1.0, math.inf))
+    histogram.observe(0.5)
+
+    assert render_metric("jobs_total", "counter", [({}, 3)]) == [
+        "# TYPE jobs_total counter",
+        "jobs_total 3",
+    ]
+    assert render_metric("job_seconds", "histogram", [({}, histogram)]) == [
+        "# TYPE job_seconds histogram",
+        'job_seconds_bucket{le="1.0"} 1',
+        'job_seconds_bucket{le="+Inf"} 1',
+        "job_seconds_sum 0.5",
+        "job_seconds_count 1",
+    ]
+
+
+def test_prefix_scan_pattern_replaces_placeholders() -> None:
+    assert prefix_scan_pattern("blog:posts:user:{user_id}:page") == "blog:posts:user:*:page:*"
+
+
+async def test_cache_decorator_counts_misses_hits_and_sizes() -> None:
+    stored: dict = {}
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=lambda key: stored.get(key))
+    mock_client.set = AsyncMock(side_effect=lambda key, value, ex: stored.update({key: value}))
+
+    @cache(key_prefix="metrics:test:item", resource_id_name="item_id")
+    async def read_item(request: Request, item_id: str) -> dict:
+        return {"id": item_id}
+
+    metrics = cache_metrics.register("metrics:test:item")
+    with patch.object(cache_mod, "client", mock_client):
+        await read_item(_request(), item_id="a")
+        await read_item(_request(), item_id="a")
+
+    assert metrics.misses == 1
+    assert metrics.hits == 1
+    assert metrics.payload_bytes.count == 1
+    assert metrics.encode_seconds.count == 1
+    assert metrics.decode_seconds.count == 1
+    assert metrics.redis_seconds.count == 3
@@ -33,6 +33,11 @@ EXPECTED_SETTINGS_FIELDS = frozenset(
         "ALGORITHM",
         "API_BASE_URL",
         "APP_VERSION",
+        "CACHE_COMPRESSION",
+        "CACHE_COMPRESSION_MIN_SIZE",
+        "CACHE_INVALIDATION_CHANNEL",
+        "CACHE_LOCAL_MAX_ENTRIES",
+        "CACHE_SERIALIZER",
         "CLIENT_CACHE_MAX_AGE",
         "CONTACT_EMAIL",
         "CONTACT_NAME",
@@ -43,6 +48,8 @@ EXPECTED_SETTINGS_FIELDS = frozenset(
         "CORS_EXPOSE_HEADERS",
         "CORS_MAX_AGE",
         "DEFAULT_RATE_LIMIT_LIMIT",
+        "DEFAULT_RATE_LIMIT_LOCAL_BATCH",
+        "DEFAULT_RATE_LIMIT_MAX_CONCURRENCY",
         "DEFAULT_RATE_LIMIT_PERIOD",
         "EMAILS_FROM_EMAIL",
         "EMAILS_FROM_NAME",
@@ -52,6 +59,8 @@ EXPECTED_SETTINGS_FIELDS = frozenset(
         "LOG_FORMAT",
         "LOG_LEVEL",
         "LOG_TO_FILE",
+        "PASSWORD_HASH_MAX_QUEUE",
+        "PASSWORD_HASH_WORKERS",
         "POSTGRES_ASYNC_URI",
         "POSTGRES_CELERY_URI",
         "POSTGRES_DB",
@@ -60,8 +69,16 @@ EXPECTED_SETTINGS_FIELDS = frozenset(
         "POSTGRES_PORT",
         "POSTGRES_SERVER",
         "POSTGRES_USER",
+        "PRINCIPAL_CACHE_LOCAL_MAX_ENTRIES",
+        "PRINCIPAL_CACHE_LOCAL_TTL",
+        "PRINCIPAL_CACHE_TTL",
         "PROJECT_DESCRIPTION",
         "PROJECT_NAME",
+        "RATE_LIMIT_ALGORITHM",
+        "RATE_LIMIT_LEASE_TTL",
+        "RATE_LIMIT_MIDDLEWARE",
+        "RATE_LIMIT_RULES_CHECK_INTERVAL",
+        "RATE_LIMIT_SYNC_INTERVAL",
         "REDIS_BROKER_DB",
         "REDIS_BROKER_HOST",
         "REDIS_BROKER_PASSWORD",
@@ -91,6 +108,11 @@ EXPECTED_SETTINGS_FIELDS = frozenset(
         "SMTP_PORT",
         "SMTP_USER",
         "TIER_NAME_DEFAULT",
+        "TOKEN_BLACKLIST_BLOOM_CAPACITY",
+        "TOKEN_BLACKLIST_BLOOM_ERROR_RATE",
+        "TOKEN_BLACKLIST_CHECK_INTERVAL",
+        "TOKEN_BLACKLIST_PURGE_BATCH_SIZE",
+        "TOKEN_BLACKLIST_PURGE_INTERVAL",
         "TRUST_PROXY_HEADERS",
         "USER_FIRST_ADMIN_EMAIL",
         "USER_FIRST_ADMIN_ID",
@@ -123,6 +145,16 @@ EXPECTED_CONFIG_SNIPPETS = frozenset(
         'config("ALGORITHM", default="HS256")',
         'config("ACCESS_TOKEN_EXPIRE_MINUTES", default=15)',
         'config("REFRESH_TOKEN_EXPIRE_DAYS", default=7)',
+        'config("PASSWORD_HASH_WORKERS", default=4)',
+        'config("PASSWORD_HASH_MAX_QUEUE", default=64)',
+        'config("TOKEN_BLACKLIST_CHECK_INTERVAL", default=1.0)',
+        'config("TOKEN_BLACKLIST_BLOOM_CAPACITY", default=100000)',
+        'config("TOKEN_BLACKLIST_BLOOM_ERROR_RATE", default=0.001)',
+        'config("TOKEN_BLACKLIST_PURGE_INTERVAL", default=3600.0)',
+        'config("TOKEN_BLACKLIST_PURGE_BATCH_SIZE", default=5000)',
+        'config("PRINCIPAL_CACHE_TTL", default=60)',
+        'config("PRINCIPAL_CACHE_LOCAL_TTL", default=5)',
+        'config("PRINCIPAL_CACHE_LOCAL_MAX_ENTRIES", default=1024)',
         'config("SMTP_HOST", default=None)',
         'config("SMTP_PORT", default=587)',
         'config("SMTP_USER", default=None)',
@@ -170,8 +202,20 @@ EXPECTED_CONFIG_SNIPPETS = frozenset(
         'config("REDIS_RATE_LIMIT_USE_SSL", default=False)',
         'config("DEFAULT_RATE_LIMIT_LIMIT", default=10)',
         'config("DEFAULT_RATE_LIMIT_PERIOD", default=3600)',
+        'config("RATE_LIMIT_ALGORITHM", default="fixed_window")',
+        'config("RATE_LIMIT_RULES_CHECK_INTERVAL", default=1.0)',
+        'config("DEFAULT_RATE_LIMIT_LOCAL_BATCH", default=0)',
+        'config("RATE_LIMIT_SYNC_INTERVAL", default=0.1)',
+        'config("DEFAULT_RATE_LIMIT_MAX_CONCURRENCY", default=0)',
+        'config("RATE_LIMIT_LEASE_TTL", default=30.0)',
+        'config("RATE_LIMIT_MIDDLEWARE", default="True")',
         'config("TRUST_PROXY_HEADERS", default="False")',
         'config("CLIENT_CACHE_MAX_AGE", default=60)',
+        'config("CACHE_LOCAL_MAX_ENTRIES", default=1024)',
+        'config("CACHE_INVALIDATION_CHANNEL", default="cache:invalidate")',
+        'config("CACHE_SERIALIZER", default="json")',
+        'config("CACHE_COMPRESSION", default="zlib")',
+        'config("CACHE_COMPRESSION_MIN_SIZE", default=1024)',
         'config("CORS_ALLOW_ORIGINS", default="*")',
         'config("CORS_ALLOW_METHODS", default="*")',
         'config("CORS_ALLOW_HEADERS", default="*")',
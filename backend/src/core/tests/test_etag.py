@@ -0,0 +1,66 @@
+# Built-in Dependencies
+from datetime import UTC, datetime
+from uuid import uuid4
+
+# Third-Party Dependencies
+import pytest
+from fastapi import Request
+
+# Local Dependencies
+from src.core.utils.etag import etag_matches, make_etag, not_modified, resource_etag
+
+pytestmark = pytest.mark.unit
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def test_resource_etag_uses_updated_at_when_present() -> None:
+    resource = {"id": uuid4(), "name": "a", "updated_at": datetime(2024, 1, 1, tzinfo=UTC)}
+    etag = resource_etag(resource)
+    assert etag == resource_etag({**resource, "name": "b"})
+    assert etag != resource_etag({**resource, "updated_at": datetime(2024, 1, 2, tzinfo=UTC)})
+
+
+def test_resource_etag_falls_back_to_created_at_until_first_update() -> None:
+    created_at = datetime(2024, 1, 1, tzinfo=UTC)
+    resource = {"id": uuid4(), "name": "a", "created_at": created_at, "updated_at": None}
+    etag = resource_etag(resource)
+
+    assert etag == make_etag(f"{resource['id']}-{created_at.timestamp():.6f}")
+    assert etag == resource_etag({**resource, "name": "b"})
+    updated = resource_etag({**resource, "updated_at": datetime(2024, 1, 2, tzinfo=UTC)})
+    assert updated != etag
+    assert updated.startswith(f'"{resource["id"]}-')
+
+
+def test_resource_etag_fingerprints_content_without_updated_at() -> None:
+    etag = resource_etag({"id": "1", "name": "a"})
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == resource_etag({"name": "a", "id": "1"})
+    assert etag != resource_etag({"id": "1", "name": "b"})
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"x", "abc"', True),
+        ("*", True),
+        ('"abcd"', False),
+    ],
+)
+def test_etag_matches_if_none_match(header: str | None, expected: bool) -> None:
+    assert etag_matches(_request(header), make_etag("abc")) is expected
+
+
+def test_not_modified_has_no_body() -> None:
+    response = not_modified('"abc"')
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["ETag"] == '"abc"'
+    assert "content-length" not in response.headers
@@ -0,0 +1,127 @@
+# Built-in Dependencies
+from unittest.mock import patch
+import asyncio
+import threading
+import time
+
+# Third-Party Dependencies
+import pytest
+
+# Local Dependencies
+from src.core.exceptions.http_exceptions import ServiceUnavailableException
+from src.core.utils.password_hasher import PasswordHasher, PasswordHasherBusyError
+from src.core import security
+
+pytestmark = pytest.mark.unit
+
+
+async def test_password_hasher_runs_off_the_event_loop() -> None:
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    loop_thread = threading.get_ident()
+
+    worker_thread = await hasher.run(threading.get_ident)
+    hasher.shutdown()
+
+    assert worker_thread != loop_thread
+    snapshot = hasher.snapshot()
+    assert snapshot["submitted"] == snapshot["completed"] == 1
+    assert snapshot["hash_seconds"]["count"] == 1
+
+
+async def test_password_hasher_rejects_beyond_queue_and_tracks_depth() -> None:
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    running = asyncio.ensure_future(hasher.run(release.wait))
+    queued = asyncio.ensure_future(hasher.run(release.wait))
+    while hasher.running < 1:
+        await asyncio.sleep(0.001)
+
+    assert hasher.queued == 1
+    with pytest.raises(PasswordHasherBusyError):
+        await hasher.run(release.wait)
+
+    release.set()
+    await asyncio.gather(running, queued)
+    hasher.shutdown()
+
+    snapshot = hasher.snapshot()
+    assert (snapshot["completed"], snapshot["rejected"]) == (2, 1)
+    assert (snapshot["running"], snapshot["queued"], snapshot["max_queued"]) == (0, 0, 1)
+
+
+async def test_password_hasher_counts_failures() -> None:
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+
+    with pytest.raises(ZeroDivisionError):
+        await hasher.run(lambda: 1 / 0)
+    hasher.shutdown()
+
+    assert hasher.snapshot()["failed"] == 1
+    assert hasher.in_flight == 0
+
+
+async def test_password_hasher_keeps_the_slot_of_a_cancelled_caller_until_the_job_ends() -> None:
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    running = asyncio.ensure_future(hasher.run(release.wait))
+    queued = asyncio.ensure_future(hasher.run(release.wait))
+    while hasher.running < 1:
+        await asyncio.sleep(0.001)
+
+    running.cancel()
+    queued.cancel()
+    await asyncio.gather(running, queued, return_exceptions=True)
+
+    # The queued job was dropped; the running one still holds its thread and slot.
+    assert (hasher.in_flight, hasher.running, hasher.queued) == (1, 1, 0)
+    extra = asyncio.ensure_future(hasher.run(release.wait))
+    await asyncio.sleep(0)
+    with pytest.raises(PasswordHasherBusyError):
+        await hasher.run(release.wait)
+
+    release.set()
+    await extra
+    hasher.shutdown()
+
+    snapshot = hasher.snapshot()
+    assert (snapshot["completed"], snapshot["failed"], snapshot["rejected"]) == (2, 0, 1)
+    assert hasher.in_flight == 0
+
+
+async def test_password_hasher_keeps_the_loop_responsive() -> None:
+    hasher = PasswordHasher(max_workers=2, max_queue=0)
+    ticks = 0
+
+    async def _tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    ticker = asyncio.ensure_future(_tick())
+    await asyncio.gather(hasher.run(time.sleep, 0.1), hasher.run(time.sleep, 0.1))
+    ticker.cancel()
+    hasher.shutdown()
+
+    assert ticks >= 5
+
+
+def test_password_hasher_renders_prometheus_text() -> None:
+    text = PasswordHasher(max_workers=2, max_queue=4).render_prometheus()
+
+    assert "# TYPE password_hash_rejected_total counter" in text
+    assert "password_hash_workers 2" in text
+    assert 'password_hash_wait_seconds_bucket{le="+Inf"} 0' in text
+
+
+async def test_verify_password_maps_full_queue_to_503() -> None:
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+    hasher.in_flight = 1
+
+    with patch.object(security, "password_hasher", hasher):
+        with pytest.raises(ServiceUnavailableException) as exc_info:
+            await security.verify_password("Str1ngst!", "hash")
+
+    assert exc_info.value.headers == {"Retry-After": "1"}
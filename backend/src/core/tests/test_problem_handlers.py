@@ -10,11 +10,13 @@ from fastapi.exceptions import RequestValidationError
 # Local Dependencies
 from src.core.exceptions.handlers import (
     http_exception_handler,
+    invalid_cursor_handler,
     unhandled_exception_handler,
     validation_exception_handler,
 )
 from src.core.exceptions.http_exceptions import NotFoundException, RateLimitException
 from src.core.exceptions.problem import problem_body
+from src.core.exceptions.repository_exceptions import InvalidCursorError
 
 pytestmark = pytest.mark.unit
 
@@ -80,6 +82,13 @@ async def test_validation_error_includes_errors_list() -> None:
     assert body["errors"]
 
 
+async def test_invalid_cursor_is_a_bad_request() -> None:
+    response = await invalid_cursor_handler(MagicMock(), InvalidCursorError())
+
+    assert response.status_code == 400
+    assert _body(response) == problem_body("Invalid pagination cursor.", 400, "invalid_cursor")
+
+
 async def test_unhandled_exception_does_not_leak_internals() -> None:
     with patch("src.core.exceptions.handlers.logger_api") as logger:
         response = await unhandled_exception_handler(MagicMock(), RuntimeError("secret-trace"))
@@ -5,24 +5,54 @@ from unittest.mock import AsyncMock, MagicMock, patch
 # Third-Party Dependencies
 import pytest
 from fastapi import APIRouter, FastAPI
+from redis.exceptions import NoScriptError
 from starlette.requests import Request
 
 # Local Dependencies
 from src.core.exceptions.cache_exceptions import MissingClientError
 from src.core.utils import rate_limit as rate_limit_module
 from src.core.utils.rate_limit import (
+    check_rate_limit,
     caller_identifier,
     is_rate_limited,
+    get_route_index,
+    load_rate_limit_scripts,
     is_valid_path,
     match_longest_prefix,
     normalize_route_path,
+    request_cost,
     request_route_template,
     sanitize_path,
+    ConcurrencyLimiter,
+    LocalRateLimiter,
+    RateLimitResult,
+    RuleTrie,
+    get_rate_limit_usage,
+    rate_limit_headers,
 )
 
 pytestmark = pytest.mark.unit
 
 
+def test_rule_trie_matches_like_longest_prefix() -> None:
+    rules = [
+        {"path": "api_v1_system_tasks", "limit": 3},
+        {"path": "api_v1_system_tasks_queue-health", "limit": 1},
+        {"path": "api_v1_system_tasks_queue", "limit": 2},
+        {"path": None, "limit": 9},
+    ]
+    trie = RuleTrie(rules)
+    for template in (
+        "api_v1_system_tasks",
+        "api_v1_system_tasks_queue-health",
+        "api_v1_system_tasks_{task_id}",
+        "api_v1_system_tasksx",
+        "api_v1_system",
+        "api_v1_users",
+    ):
+        assert trie.match(template) == match_longest_prefix(template, rules)
+
+
 def test_normalize_route_path_strips_query_string() -> None:
     assert normalize_route_path("/users?name=john") == "/users"
 
@@ -194,7 +224,7 @@ async def test_is_rate_limited_rejects_period_below_one() -> None:
             await is_rate_limited(app, "user-1", "api_v1_system_tasks", 1, 0)
 
 
-async def test_is_rate_limited_uses_incr_and_expire_nx() -> None:
+async def test_is_rate_limited_uses_incrby_and_expire_nx() -> None:
     app = FastAPI()
 
     @app.get("/api/v1/system/tasks/queue-health")
@@ -210,8 +240,412 @@ async def test_is_rate_limited_uses_incr_and_expire_nx() -> None:
         limited = await is_rate_limited(app, "user-1", "api_v1_system_tasks", 1, 60)
 
     assert limited is True
-    pipe.incr.assert_called_once()
+    assert pipe.incrby.call_args.args[1] == 1
     pipe.expire.assert_called_once()
     expire_kwargs = pipe.expire.call_args.kwargs
     assert expire_kwargs.get("nx") is True
     assert pipe.expire.call_args.args[1] == 60
+
+
+def _queue_health_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/system/tasks/queue-health")
+    def _queue_health() -> dict:
+        return {}
+
+    return app
+
+
+async def test_check_rate_limit_fixed_window_reports_remaining() -> None:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[2, True])
+    mock_client = MagicMock()
+    mock_client.pipeline.return_value = pipe
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        result = await check_rate_limit(_queue_health_app(), "user-1", "api_v1_system_tasks", 5, 60)
+
+    assert result is not None
+    assert result.allowed is True
+    assert result.remaining == 3
+    assert 0 < result.reset_after <= 60
+    assert result.retry_after == 0
+
+
+async def test_check_rate_limit_fixed_window_counts_cost() -> None:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[6, True])
+    mock_client = MagicMock()
+    mock_client.pipeline.return_value = pipe
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        result = await check_rate_limit(
+            _queue_health_app(), "user-1", "api_v1_system_tasks", 5, 60, cost=4
+        )
+
+    assert result is not None and result.allowed is False
+    assert pipe.incrby.call_args.args[1] == 4
+
+
+async def test_check_rate_limit_rejects_cost_below_one() -> None:
+    with patch.object(rate_limit_module, "client", MagicMock()):
+        with pytest.raises(ValueError, match="cost must be at least 1"):
+            await check_rate_limit(FastAPI(), "user-1", "api_v1_system_tasks", 5, 60, cost=0)
+
+
+@pytest.mark.parametrize("algorithm", ["sliding_window", "gcra"])
+async def test_check_rate_limit_scripts_pass_cost(algorithm: str) -> None:
+    mock_client = MagicMock()
+    mock_client.evalsha = AsyncMock(return_value=[1, 2, 1500, 0])
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        await check_rate_limit(
+            _queue_health_app(), "user-1", "api_v1_system_tasks", 5, 60, algorithm, cost=3
+        )
+
+    assert mock_client.evalsha.await_args.args[-1] == 3
+
+
+@pytest.mark.parametrize("algorithm", ["sliding_window", "gcra"])
+async def test_check_rate_limit_scripts_use_evalsha(algorithm: str) -> None:
+    mock_client = MagicMock()
+    mock_client.evalsha = AsyncMock(return_value=[0, 0, 1500, 1250])
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        result = await check_rate_limit(
+            _queue_health_app(), "user-1", "api_v1_system_tasks", 5, 60, algorithm
+        )
+
+    assert result == (False, 5, 0, 1.5, 1.25)
+    mock_client.evalsha.assert_awaited_once()
+    keys = mock_client.evalsha.await_args.args[2:3]
+    assert keys[0].startswith("ratelimit:user-1:api_v1_system_tasks:")
+
+
+async def test_check_rate_limit_reloads_script_after_noscript() -> None:
+    mock_client = MagicMock()
+    mock_client.evalsha = AsyncMock(side_effect=[NoScriptError("NOSCRIPT"), [1, 4, 12000, 0]])
+    mock_client.script_load = AsyncMock()
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        result = await check_rate_limit(
+            _queue_health_app(), "user-1", "api_v1_system_tasks", 5, 60, "gcra"
+        )
+
+    assert result is not None and result.allowed and result.remaining == 4
+    mock_client.script_load.assert_awaited_once()
+    assert mock_client.evalsha.await_count == 2
+
+
+async def test_check_rate_limit_rejects_unknown_algorithm() -> None:
+    with patch.object(rate_limit_module, "client", MagicMock()):
+        with pytest.raises(ValueError, match="Unknown rate limit algorithm"):
+            await check_rate_limit(FastAPI(), "user-1", "api_v1_system_tasks", 5, 60, "leaky")
+
+
+async def test_load_rate_limit_scripts_loads_every_script() -> None:
+    mock_client = MagicMock()
+    mock_client.script_load = AsyncMock()
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        await load_rate_limit_scripts()
+
+    assert mock_client.script_load.await_count == 3
+
+
+def _counting_client(start: int = 0) -> MagicMock:
+    """Pipeline mock whose INCRBY replies keep a running total per key."""
+    totals: dict[str, int] = {}
+    mock_client = MagicMock()
+
+    def _pipeline(**_kwargs):
+        pipe = MagicMock()
+        replies: list = []
+
+        def _incrby(key, amount):
+            totals[key] = totals.get(key, start) + amount
+            replies.extend([totals[key], True])
+
+        pipe.incrby.side_effect = _incrby
+        pipe.execute = AsyncMock(side_effect=lambda: list(replies))
+        return pipe
+
+    mock_client.pipeline.side_effect = _pipeline
+    return mock_client
+
+
+async def test_local_rate_limiter_batches_redis_writes() -> None:
+    limiter = LocalRateLimiter()
+    mock_client = _counting_client()
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        results = [await limiter.check("ratelimit:ip:path", 100, 60, 5, 1000.0) for _ in range(12)]
+
+    assert all(result.allowed for result in results)
+    assert results[-1].remaining == 88
+    # Requests 5 and 10 filled the batch; the other ten were admitted from memory.
+    assert mock_client.pipeline.call_count == 2
+
+
+async def test_local_rate_limiter_denies_from_memory_once_over_limit() -> None:
+    limiter = LocalRateLimiter()
+    # Other workers already used 8 of the 10 requests in this window.
+    mock_client = _counting_client(start=8)
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        first = await limiter.check("ratelimit:ip:path", 10, 60, 3, 1000.0)
+        await limiter.sync(1000.0)
+        results = [await limiter.check("ratelimit:ip:path", 10, 60, 3, 1000.0) for _ in range(4)]
+
+    assert first.allowed
+    assert [result.allowed for result in results] == [True, False, False, False]
+    assert results[-1].retry_after == 20.0
+    assert mock_client.pipeline.call_count == 1
+
+
+async def test_local_rate_limiter_counts_cost() -> None:
+    limiter = LocalRateLimiter()
+    mock_client = _counting_client()
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        first = await limiter.check("ratelimit:ip:path", 10, 60, 20, 1000.0, cost=6)
+        second = await limiter.check("ratelimit:ip:path", 10, 60, 20, 1000.0, cost=6)
+        third = await limiter.check("ratelimit:ip:path", 10, 60, 20, 1000.0, cost=4)
+
+    assert (first.allowed, first.remaining) == (True, 4)
+    assert second.allowed is False
+    assert (third.allowed, third.remaining) == (True, 0)
+
+
+async def test_local_rate_limiter_sync_flushes_and_drops_finished_windows() -> None:
+    limiter = LocalRateLimiter()
+    mock_client = _counting_client()
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        await limiter.check("ratelimit:ip:path", 10, 60, 5, 1000.0)
+        await limiter.sync(1000.0)
+        assert len(limiter) == 1
+        await limiter.sync(1021.0)
+
+    assert len(limiter) == 0
+    pipe = mock_client.pipeline.call_args_list[0]
+    assert pipe.kwargs == {"transaction": False}
+
+
+async def test_local_rate_limiter_keeps_counts_when_flush_fails() -> None:
+    limiter = LocalRateLimiter()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(side_effect=ConnectionError("down"))
+    mock_client = MagicMock()
+    mock_client.pipeline.return_value = pipe
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        await limiter.check("ratelimit:ip:path", 10, 60, 5, 1000.0)
+        with pytest.raises(ConnectionError):
+            await limiter.sync(1000.0)
+        with pytest.raises(ConnectionError):
+            await limiter.sync(1000.0)
+
+    assert pipe.incrby.call_args_list[-1].args == ("ratelimit:ip:path:960", 1)
+
+
+async def test_check_rate_limit_uses_local_limiter_for_batched_rules() -> None:
+    mock_client = MagicMock()
+    mock_client.evalsha = AsyncMock()
+
+    with (
+        patch.object(rate_limit_module, "client", mock_client),
+        patch.object(rate_limit_module, "local_rate_limiter", LocalRateLimiter()),
+    ):
+        result = await check_rate_limit(
+            _queue_health_app(), "1.2.3.4", "api_v1_system_tasks", 5, 60, "gcra", local_batch=10
+        )
+
+    assert result is not None and result.allowed and result.remaining == 4
+    mock_client.evalsha.assert_not_awaited()
+    mock_client.pipeline.assert_not_called()
+
+
+def test_rate_limit_headers_add_retry_after_only_when_denied() -> None:
+    assert rate_limit_headers(RateLimitResult(True, 10, 7, 12.2, 0.0)) == {
+        "X-RateLimit-Limit": "10",
+        "X-RateLimit-Remaining": "7",
+        "X-RateLimit-Reset": "13",
+    }
+    denied = rate_limit_headers(RateLimitResult(False, 10, 0, 12.2, 0.3))
+    assert denied["Retry-After"] == "1"
+
+
+async def test_get_rate_limit_usage_reads_all_rules_with_one_mget() -> None:
+    rules = [
+        {"path": "api_v1_a", "limit": 5, "period": 60},
+        {"path": "api_v1_b", "limit": 4, "period": 60, "local_batch": 10},
+    ]
+    mock_client = MagicMock()
+    mock_client.mget = AsyncMock(return_value=["2", None])
+
+    with (
+        patch.object(rate_limit_module, "client", mock_client),
+        patch.object(rate_limit_module.time, "time", return_value=1000.0),
+    ):
+        usage = await get_rate_limit_usage("user-1", rules)
+
+    mock_client.mget.assert_awaited_once_with(
+        ["ratelimit:user-1:api_v1_a:960", "ratelimit:user-1:api_v1_b:960"]
+    )
+    assert usage == [
+        RateLimitResult(True, 5, 3, 20.0, 0.0),
+        RateLimitResult(True, 4, 4, 20.0, 0.0),
+    ]
+
+
+async def test_get_rate_limit_usage_sliding_window_and_gcra() -> None:
+    rules = [{"path": "api_v1_a", "limit": 10, "period": 60}]
+    mock_client = MagicMock()
+
+    with (
+        patch.object(rate_limit_module, "client", mock_client),
+        patch.object(rate_limit_module.time, "time", return_value=1005.0),
+    ):
+        # 45s into window 16: current 4, previous 8 weighted by 15/60 -> 6 used.
+        mock_client.mget = AsyncMock(return_value=["4", "8"])
+        (sliding,) = await get_rate_limit_usage("user-1", rules, "sliding_window")
+        # TAT 30s ahead with one request per 6s -> 5 of 10 left.
+        mock_client.mget = AsyncMock(return_value=["1035000.000"])
+        (gcra,) = await get_rate_limit_usage("user-1", rules, "gcra")
+
+    assert sliding == RateLimitResult(True, 10, 4, 15.0, 0.0)
+    assert gcra == RateLimitResult(True, 10, 5, 30.0, 0.0)
+
+
+async def test_concurrency_limiter_rejects_locally_when_worker_holds_every_slot() -> None:
+    limiter = ConcurrencyLimiter()
+    mock_client = MagicMock()
+    mock_client.evalsha = AsyncMock(return_value=1)
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        first = await limiter.acquire("ratelimit:u:path:inflight", 1, 30)
+        second = await limiter.acquire("ratelimit:u:path:inflight", 1, 30)
+
+    assert first is not None
+    assert second is None
+    mock_client.evalsha.assert_awaited_once()
+    assert mock_client.evalsha.await_args.args[2] == "ratelimit:u:path:inflight"
+
+
+async def test_concurrency_limiter_frees_local_slot_when_redis_refuses() -> None:
+    limiter = ConcurrencyLimiter()
+    mock_client = MagicMock()
+    mock_client.evalsha = AsyncMock(return_value=0)
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        lease = await limiter.acquire("ratelimit:u:path:inflight", 2, 30)
+
+    assert lease is None
+    assert limiter.held("ratelimit:u:path:inflight") == 0
+
+
+async def test_concurrency_limiter_release_removes_lease() -> None:
+    limiter = ConcurrencyLimiter()
+    mock_client = MagicMock()
+    mock_client.evalsha = AsyncMock(return_value=1)
+    mock_client.zrem = AsyncMock()
+
+    with patch.object(rate_limit_module, "client", mock_client):
+        lease = await limiter.acquire("ratelimit:u:path:inflight", 2, 30)
+        assert lease is not None
+        await limiter.release(lease)
+
+    assert limiter.held("ratelimit:u:path:inflight") == 0
+    mock_client.zrem.assert_awaited_once_with("ratelimit:u:path:inflight", lease.lease_id)
+
+
+def test_is_valid_path_reuses_route_index_until_routes_change() -> None:
+    app = FastAPI()
+
+    @app.get("/api/v1/system/tasks/queue-health")
+    def _queue_health() -> dict:
+        return {}
+
+    with patch.object(
+        rate_limit_module, "collect_routes", wraps=rate_limit_module.collect_routes
+    ) as collect:
+        assert is_valid_path("/api/v1/system/tasks", app) is True
+        assert is_valid_path("api_v1_system", app) is True
+        assert collect.call_count == 1
+
+        @app.get("/api/v1/blog/posts")
+        def _posts() -> dict:
+            return {}
+
+        assert is_valid_path("api_v1_blog_posts", app) is True
+        assert collect.call_count == 2
+
+
+def test_route_index_sees_routes_added_to_included_router() -> None:
+    app = FastAPI()
+    inner = APIRouter(prefix="/api")
+    app.include_router(inner)
+    assert is_valid_path("/api/late", app) is False
+
+    @inner.get("/late")
+    def _late() -> dict:
+        return {}
+
+    assert is_valid_path("/api/late", app) is True
+
+
+def test_request_route_template_resolves_from_route_index() -> None:
+    app = FastAPI()
+    inner = APIRouter()
+
+    @inner.get("/system/tasks/{task_id}")
+    def _read_task() -> dict:
+        return {}
+
+    v1 = APIRouter(prefix="/api/v1")
+    v1.include_router(inner)
+    app.include_router(v1)
+    route = get_route_index(app)._routes[-1]
+    request = _request(host="127.0.0.1", path="/unrelated/url")
+    request.scope.update({"app": app, "route": route})
+
+    assert request_route_template(request) == "/api/v1/system/tasks/{task_id}"
+
+
+def _cost_request(query_string: bytes = b"", headers: list | None = None) -> Request:
+    app = FastAPI()
+
+    @app.get("/items")
+    def _items(items_per_page: int = 25) -> list:
+        return []
+
+    route = app.router.routes[-1]
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/items",
+            "query_string": query_string,
+            "headers": headers or [],
+            "route": route,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    ("rule", "query_string", "headers", "expected"),
+    [
+        (None, b"items_per_page=50", [], 1),
+        ({"cost": 3}, b"", [], 3),
+        ({"cost": 2, "cost_basis": "items_per_page"}, b"items_per_page=50", [], 100),
+        ({"cost": 2, "cost_basis": "items_per_page"}, b"", [], 50),
+        ({"cost": 2, "cost_basis": "items_per_page"}, b"items_per_page=abc", [], 2),
+        ({"cost": 1, "cost_basis": "body_kib"}, b"", [(b"content-length", b"3000")], 3),
+        ({"cost": 1, "cost_basis": "body_kib"}, b"", [(b"content-length", b"0")], 1),
+        ({"cost": 5, "cost_basis": "body_kib"}, b"", [], 5),
+    ],
+)
+def test_request_cost(rule: dict | None, query_string: bytes, headers: list, expected: int) -> None:
+    assert request_cost(_cost_request(query_string, headers), rule) == expected
@@ -0,0 +1,143 @@
+# Built-in Dependencies
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party Dependencies
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, Request, Response
+from httpx import ASGITransport, AsyncClient
+
+# Local Dependencies
+from src.core.middlewares.rate_limit_middleware import (
+    CHECKED_STATE_KEY,
+    RESULT_STATE_KEY,
+    RateLimitMiddleware,
+)
+from src.core.utils import rate_limit as rate_limit_module
+from src.core.utils.rate_limit import RateLimitResult
+
+pytestmark = pytest.mark.unit
+
+
+async def _limiter(request: Request) -> None:
+    request.state.seen_checked = request.scope.get("state", {}).get(CHECKED_STATE_KEY, False)
+
+
+def _app(handler_calls: list) -> FastAPI:
+    app = FastAPI()
+    router = APIRouter(prefix="/api/v1/items")
+
+    @router.get("/{item_id}", dependencies=[Depends(_limiter)])
+    async def read_item(item_id: int, request: Request) -> dict:
+        handler_calls.append(item_id)
+        return {"checked": request.state.seen_checked}
+
+    @router.get("/")
+    async def list_items() -> list:
+        return []
+
+    app.include_router(router)
+    app.add_middleware(RateLimitMiddleware, dependency=_limiter, limit=2, period=60)
+    return app
+
+
+async def _get(app: FastAPI, path: str, **kwargs) -> object:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, **kwargs)
+
+
+async def test_middleware_rejects_over_limit_before_routing() -> None:
+    calls: list = []
+    check = AsyncMock(return_value=RateLimitResult(False, 2, 0, 30.0, 30.0))
+
+    with (
+        patch.object(rate_limit_module, "client", MagicMock()),
+        patch.object(rate_limit_module, "check_rate_limit", check),
+    ):
+        response = await _get(_app(calls), "/api/v1/items/7")
+
+    assert response.status_code == 429
+    assert response.json()["code"] == "rate_limit_exceeded"
+    assert response.headers["Retry-After"] == "30"
+    assert response.headers["X-RateLimit-Remaining"] == "0"
+    assert calls == []
+    assert check.await_args.kwargs["path"] == "api_v1_items_{item_id}"
+    assert check.await_args.kwargs["user_id"] == "127.0.0.1"
+
+
+async def test_middleware_marks_counted_requests_for_the_dependency() -> None:
+    calls: list = []
+    check = AsyncMock(return_value=RateLimitResult(True, 2, 1, 30.0, 0.0))
+
+    with (
+        patch.object(rate_limit_module, "client", MagicMock()),
+        patch.object(rate_limit_module, "check_rate_limit", check),
+    ):
+        response = await _get(_app(calls), "/api/v1/items/7")
+
+    assert response.status_code == 200
+    assert response.json() == {"checked": True}
+    assert calls == [7]
+    assert response.headers["X-RateLimit-Limit"] == "2"
+    assert response.headers["X-RateLimit-Remaining"] == "1"
+    assert "Retry-After" not in response.headers
+
+
+@pytest.mark.parametrize(
+    ("path", "headers"),
+    [
+        ("/api/v1/items/", {}),
+        ("/api/v1/missing", {}),
+        ("/api/v1/items/7", {"Authorization": "Bearer token"}),
+    ],
+)
+async def test_middleware_skips_unlimited_unknown_and_authenticated(
+    path: str, headers: dict
+) -> None:
+    check = AsyncMock()
+
+    with (
+        patch.object(rate_limit_module, "client", MagicMock()),
+        patch.object(rate_limit_module, "check_rate_limit", check),
+    ):
+        await _get(_app([]), path, headers=headers)
+
+    check.assert_not_awaited()
+
+
+async def test_middleware_defers_to_dependency_when_redis_fails() -> None:
+    check = AsyncMock(side_effect=ConnectionError("down"))
+
+    with (
+        patch.object(rate_limit_module, "client", MagicMock()),
+        patch.object(rate_limit_module, "check_rate_limit", check),
+    ):
+        response = await _get(_app([]), "/api/v1/items/7")
+
+    assert response.status_code == 200
+    assert response.json() == {"checked": False}
+
+
+async def test_middleware_adds_headers_from_dependency_result() -> None:
+    async def _counting_limiter(request: Request) -> None:
+        request.scope["state"][RESULT_STATE_KEY] = RateLimitResult(True, 9, 4, 10.0, 0.0)
+
+    app = FastAPI()
+
+    @app.get("/items", dependencies=[Depends(_counting_limiter)])
+    async def list_items() -> Response:
+        return Response(b"[]", media_type="application/json")
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        dependency=_counting_limiter,
+        limit=2,
+        period=60,
+        check_anonymous=False,
+    )
+
+    with patch.object(rate_limit_module, "client", MagicMock()):
+        response = await _get(app, "/items")
+
+    assert response.headers["X-RateLimit-Limit"] == "9"
+    assert response.headers["X-RateLimit-Remaining"] == "4"
@@ -0,0 +1,118 @@
+# Built-in Dependencies
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+# Third-Party Dependencies
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+# Local Dependencies
+from src.apps.blog.posts_tags_assoc.models import PostTagAssoc
+from src.apps.blog.posts_tags_assoc.schemas import PostTagAssocCreateInternal
+from src.apps.blog.tags.models import Tag
+from src.apps.blog.tags.schemas import TagCreateInternal, TagUpdate
+from src.core.common.repository import MAX_BIND_PARAMETERS, RepositoryBase
+
+pytestmark = pytest.mark.unit
+
+
+def _db(rows: list[dict] | None = None, rowcount: int = 0) -> AsyncMock:
+    db = AsyncMock()
+    db.exec = AsyncMock(
+        return_value=MagicMock(mappings=MagicMock(return_value=rows or []), rowcount=rowcount)
+    )
+    return db
+
+
+def _statements(db: AsyncMock) -> list:
+    return [call.args[0] for call in db.exec.await_args_list]
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=asyncpg.dialect()))
+
+
+async def test_create_many_inserts_all_rows_in_one_statement() -> None:
+    tag = {"id": uuid4(), "name": "Python"}
+    db = _db(rows=[tag])
+
+    created = await RepositoryBase(Tag).create_many(
+        db, [TagCreateInternal(name="Python"), TagCreateInternal(name="Redis")]
+    )
+
+    assert created == [tag]
+    (stmt,) = _statements(db)
+    sql = _sql(stmt)
+    assert sql.startswith("INSERT INTO blog_tag (id, name, created_at, updated_at, is_deleted)")
+    assert sql.count("::UUID") == 2
+    assert "RETURNING blog_tag.id" in sql
+    db.commit.assert_awaited_once()
+
+
+async def test_create_many_chunks_to_the_bind_parameter_limit() -> None:
+    repo = RepositoryBase(Tag)
+    rows_per_statement = (MAX_BIND_PARAMETERS - 2) // len(Tag.__table__.columns)
+    db = _db()
+
+    await repo.create_many(
+        db,
+        [TagCreateInternal(name=f"tag-{i}") for i in range(rows_per_statement + 1)],
+        with_commit=False,
+    )
+
+    first, second = _statements(db)
+    assert len(first.compile(dialect=asyncpg.dialect()).params) <= MAX_BIND_PARAMETERS
+    assert _sql(second).count("::UUID") == 1
+    db.flush.assert_awaited_once()
+    db.commit.assert_not_awaited()
+
+
+async def test_upsert_many_updates_all_but_the_conflict_target() -> None:
+    tag_id = uuid4()
+    db = _db()
+
+    await RepositoryBase(Tag).upsert_many(
+        db,
+        [{"id": tag_id, "name": "Python"}, {"id": tag_id, "name": "Python 3"}],
+        conflict_target=["id"],
+    )
+
+    sql = _sql(_statements(db)[0])
+    assert "ON CONFLICT (id) DO UPDATE SET name = excluded.name, updated_at = " in sql
+    # The duplicate id is folded into one row, the last one wins.
+    assert sql.count("::UUID") == 1
+    assert "Python 3" in _statements(db)[0].compile(dialect=asyncpg.dialect()).params.values()
+
+
+async def test_upsert_many_do_nothing_on_primary_key_by_default() -> None:
+    db = _db()
+
+    await RepositoryBase(PostTagAssoc).upsert_many(
+        db,
+        [PostTagAssocCreateInternal(post_id=uuid4(), tag_id=uuid4())],
+        do_nothing=True,
+    )
+
+    assert "ON CONFLICT (post_id, tag_id) DO NOTHING" in _sql(_statements(db)[0])
+
+
+async def test_update_many_groups_records_by_updated_fields() -> None:
+    db = _db(rowcount=2)
+
+    updated = await RepositoryBase(Tag).update_many(
+        db,
+        {
+            uuid4(): TagUpdate(name="Python"),
+            uuid4(): {"name": "Redis"},
+            uuid4(): {"is_deleted": True, "unknown": 1},
+            uuid4(): {},
+        },
+    )
+
+    assert updated == 4
+    by_name, by_deleted = (_sql(stmt) for stmt in _statements(db))
+    assert by_name.startswith("UPDATE blog_tag SET name=source.name, updated_at=")
+    assert "FROM (VALUES ($2::UUID, $3::VARCHAR), ($4::UUID, $5::VARCHAR)) AS source" in by_name
+    assert "WHERE blog_tag.id = source.id" in by_name
+    assert "is_deleted=source.is_deleted" in by_deleted
+    db.commit.assert_awaited_once()
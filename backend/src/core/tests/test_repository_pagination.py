@@ -0,0 +1,236 @@
+# Built-in Dependencies
+import base64
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+# Third-Party Dependencies
+import pytest
+from sqlalchemy.dialects import postgresql
+
+# Local Dependencies
+from src.apps.system.users.models import User
+from src.apps.system.users.schemas import UserRead
+from src.core.common.repository import WINDOW_COUNT_LABEL, RepositoryBase
+from src.core.exceptions.repository_exceptions import InvalidCursorError
+from src.core.utils.repository import _decode_cursor, _encode_cursor, _Explain
+
+pytestmark = pytest.mark.unit
+
+KEYS = [("created_at", "asc"), ("id", "asc")]
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _db(rows: list[dict]) -> AsyncMock:
+    db = AsyncMock()
+    db.exec = AsyncMock(return_value=MagicMock(mappings=MagicMock(return_value=rows)))
+    return db
+
+
+def _rows(count: int) -> list[dict]:
+    return [
+        {"id": uuid4(), "username": f"user{i}", "created_at": datetime(2026, 1, i + 1)}
+        for i in range(count)
+    ]
+
+
+def test_cursor_round_trips_and_is_url_safe() -> None:
+    user_id = uuid4()
+    cursor = _encode_cursor(KEYS, [datetime(2026, 1, 1, tzinfo=timezone.utc), user_id])
+
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+    assert _decode_cursor(cursor, KEYS) == ["2026-01-01 00:00:00+00:00", str(user_id)]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "e30"])
+def test_malformed_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        _decode_cursor(cursor, KEYS)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"k": [["created_at", "asc"], ["id", "asc"]], "v": 5},
+        {"k": [["created_at", "asc"], ["id", "asc"]], "v": "ab"},
+        {"k": "ab", "v": ["2026-01-01", "x"]},
+        {"k": [5, 6], "v": ["2026-01-01", "x"]},
+        {"k": [["created_at"], ["id", "asc"]], "v": ["2026-01-01", "x"]},
+        [1, 2],
+    ],
+)
+def test_cursor_of_the_wrong_shape_is_rejected(payload: object) -> None:
+    cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    with pytest.raises(InvalidCursorError):
+        _decode_cursor(cursor, KEYS)
+
+
+def test_cursor_for_another_sort_order_is_rejected() -> None:
+    cursor = _encode_cursor(KEYS, ["2026-01-01", str(uuid4())])
+
+    with pytest.raises(InvalidCursorError, match="sort order"):
+        _decode_cursor(cursor, [("username", "desc"), ("id", "asc")])
+
+
+def test_keyset_sort_defaults_and_adds_id_tie_breaker() -> None:
+    repo = RepositoryBase(User)
+
+    assert repo.keyset_sort(None) == KEYS
+    assert repo.keyset_sort([("username", "desc"), ("unknown", "asc")]) == [
+        ("username", "desc"),
+        ("id", "asc"),
+    ]
+    assert repo.keyset_sort([("id", "desc")]) == [("id", "desc")]
+
+
+def test_apply_cursor_compares_every_sort_key() -> None:
+    repo = RepositoryBase(User)
+    keys = [("username", "desc"), ("id", "asc")]
+    cursor = _encode_cursor(keys, ["userson", str(uuid4())])
+
+    sql = _sql(repo.apply_cursor(repo.select_columns(UserRead), keys, cursor))
+
+    assert (
+        "system_users.username < %(username_1)s OR system_users.username = %(username_2)s "
+        "AND system_users.id > %(id_1)s" in sql
+    )
+
+
+def test_apply_cursor_rejects_values_of_the_wrong_type() -> None:
+    repo = RepositoryBase(User)
+    cursor = _encode_cursor(KEYS, ["yesterday", str(uuid4())])
+
+    with pytest.raises(InvalidCursorError):
+        repo.apply_cursor(repo.select_columns(UserRead), KEYS, cursor)
+
+
+@pytest.mark.parametrize("value", [5, ["userson"], {"a": 1}])
+def test_apply_cursor_rejects_non_strings_for_string_columns(value: object) -> None:
+    repo = RepositoryBase(User)
+    keys = [("username", "desc"), ("id", "asc")]
+    cursor = _encode_cursor(keys, [value, str(uuid4())])
+
+    with pytest.raises(InvalidCursorError):
+        repo.apply_cursor(repo.select_columns(UserRead), keys, cursor)
+
+
+async def test_paginate_keyset_returns_next_cursor_and_hides_sort_columns() -> None:
+    repo = RepositoryBase(User)
+    rows = _rows(3)
+    db = _db([dict(row) for row in rows])
+
+    with patch.object(repo, "total_count", AsyncMock(return_value=7)):
+        page = await repo.paginate(db, repo.select_columns(UserRead), limit=2, keyset=True)
+
+    assert page["total_count"] == 7
+    assert [row["id"] for row in page["data"]] == [rows[0]["id"], rows[1]["id"]]
+    assert all("created_at" not in row for row in page["data"])
+    assert _decode_cursor(page["next_cursor"], KEYS) == [
+        str(rows[1]["created_at"]),
+        str(rows[1]["id"]),
+    ]
+    sql = _sql(db.exec.await_args.args[0])
+    assert "ORDER BY system_users.created_at ASC, system_users.id ASC" in sql
+    assert "LIMIT" in sql
+
+
+async def test_paginate_from_cursor_ignores_offset_and_ends_on_short_page() -> None:
+    repo = RepositoryBase(User)
+    cursor = _encode_cursor(KEYS, [str(datetime(2026, 1, 2)), str(uuid4())])
+    db = _db(_rows(1))
+
+    with patch.object(repo, "total_count", AsyncMock(return_value=3)):
+        page = await repo.paginate(
+            db, repo.select_columns(UserRead), offset=20, limit=2, cursor=cursor
+        )
+
+    assert page["next_cursor"] is None
+    assert len(page["data"]) == 1
+    sql = _sql(db.exec.await_args.args[0])
+    assert "system_users.created_at > " in sql
+    assert "OFFSET" not in sql
+
+
+async def test_get_multi_without_keyset_keeps_offset_pagination() -> None:
+    repo = RepositoryBase(User)
+    db = _db(_rows(2))
+
+    with patch.object(repo, "total_count", AsyncMock(return_value=2)):
+        page = await repo.get_multi(db, offset=10, limit=2, schema_to_select=UserRead)
+
+    assert page.keys() == {"data", "total_count"}
+    assert "OFFSET" in _sql(db.exec.await_args.args[0])
+
+
+async def test_count_none_fetches_one_extra_row_instead_of_counting() -> None:
+    repo = RepositoryBase(User)
+    db = _db(_rows(3))
+    total_count = AsyncMock()
+
+    with patch.object(repo, "total_count", total_count):
+        page = await repo.get_multi(db, limit=2, schema_to_select=UserRead, count="none")
+
+    assert page["total_count"] is None
+    assert page["has_more"] is True
+    assert len(page["data"]) == 2
+    assert "LIMIT" in _sql(db.exec.await_args.args[0])
+    total_count.assert_not_awaited()
+
+
+async def test_count_window_reads_total_from_the_page_query() -> None:
+    repo = RepositoryBase(User)
+    rows = [{**row, WINDOW_COUNT_LABEL: 42} for row in _rows(2)]
+    db = _db(rows)
+    total_count = AsyncMock()
+
+    with patch.object(repo, "total_count", total_count):
+        page = await repo.get_multi(db, limit=2, schema_to_select=UserRead, count="window")
+
+    assert page["total_count"] == 42
+    assert all(WINDOW_COUNT_LABEL not in row for row in page["data"])
+    assert "count(*) OVER ()" in _sql(db.exec.await_args.args[0])
+    total_count.assert_not_awaited()
+
+
+async def test_count_window_past_the_last_page_counts_exactly() -> None:
+    repo = RepositoryBase(User)
+    db = _db([])
+
+    with patch.object(repo, "total_count", AsyncMock(return_value=5)) as total_count:
+        page = await repo.get_multi(db, offset=10, limit=2, count="window")
+
+    assert page["total_count"] == 5
+    total_count.assert_awaited_once()
+
+
+@pytest.mark.parametrize(("plan_rows", "expected"), [(1000, 1000), (1, 3)])
+async def test_count_estimate_uses_the_plan_but_not_less_than_rows_seen(
+    plan_rows: int, expected: int
+) -> None:
+    repo = RepositoryBase(User)
+    db = _db(_rows(3))
+    db.scalar = AsyncMock(return_value=f'[{{"Plan": {{"Plan Rows": {plan_rows}}}}}]')
+
+    page = await repo.get_multi(db, limit=2, schema_to_select=UserRead, count="estimate")
+
+    assert page["total_count"] == expected
+    assert page["has_more"] is True
+    sql = _sql(db.scalar.await_args.args[0])
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "system_users.is_deleted IS false" in sql
+
+
+def test_explain_keeps_bound_parameters() -> None:
+    repo = RepositoryBase(User)
+    user_id = uuid4()
+    stmt = repo.apply_filtering(repo.select_columns(UserRead), id=user_id)
+
+    compiled = _Explain(stmt).compile(dialect=postgresql.dialect())
+
+    assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert user_id in compiled.params.values()
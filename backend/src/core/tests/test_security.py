@@ -14,6 +14,7 @@ from src.core.security import (
     TOKEN_TYPE_ACCESS,
     TOKEN_TYPE_REFRESH,
     authenticate_user,
+    blacklist_token,
     create_access_token,
     create_refresh_token,
     get_password_hash,
@@ -25,13 +26,13 @@ pytestmark = pytest.mark.unit
 
 
 async def test_password_hash_roundtrip() -> None:
-    hashed = get_password_hash("Str1ngst!")
+    hashed = await get_password_hash("Str1ngst!")
     assert await verify_password("Str1ngst!", hashed) is True
     assert await verify_password("wrong-pass", hashed) is False
 
 
 async def test_authenticate_user_by_email_and_username() -> None:
-    db_user = {"username": "admin", "hashed_password": get_password_hash("Str1ngst!")}
+    db_user = {"username": "admin", "hashed_password": await get_password_hash("Str1ngst!")}
     with patch("src.core.security.user_repository") as repo:
         repo.get = AsyncMock(return_value=db_user)
         by_email = await authenticate_user("admin@tester.com", "Str1ngst!", db=object())
@@ -46,7 +47,7 @@ async def test_authenticate_user_unknown_and_wrong_password() -> None:
         repo.get = AsyncMock(return_value=None)
         assert await authenticate_user("nobody", "x", db=object()) is False
 
-    hashed = get_password_hash("Str1ngst!")
+    hashed = await get_password_hash("Str1ngst!")
     with patch("src.core.security.user_repository") as repo:
         repo.get = AsyncMock(return_value={"hashed_password": hashed})
         assert await authenticate_user("admin", "wrong-pass", db=object()) is False
@@ -66,21 +67,44 @@ async def test_create_tokens_with_and_without_expiry() -> None:
 
 
 async def test_verify_token_blacklisted_and_invalid() -> None:
-    with patch("src.core.security.token_blacklist_repository") as repo:
-        repo.exists = AsyncMock(return_value=True)
-        assert await verify_token("tok", db=object(), expected_type="access") is None
-
-    with patch("src.core.security.token_blacklist_repository") as repo:
-        repo.exists = AsyncMock(return_value=False)
+    access = await create_access_token({"sub": "admin"})
+    jti = jwt.decode(access, SECRET_KEY, algorithms=[ALGORITHM])["jti"]
+    with patch("src.core.security.token_blacklist") as blacklist:
+        blacklist.is_blacklisted = AsyncMock(return_value=True)
+        assert await verify_token(access, db=object(), expected_type="access") is None
+    assert blacklist.is_blacklisted.await_args.args[1] == jti
+
+    with patch("src.core.security.token_blacklist") as blacklist:
+        blacklist.is_blacklisted = AsyncMock(return_value=False)
         with patch("src.core.security.jwt.decode", side_effect=InvalidTokenError("bad")):
             assert await verify_token("tok", db=object(), expected_type="access") is None
+    blacklist.is_blacklisted.assert_not_awaited()
+
+
+async def test_verify_token_rejects_token_without_jti() -> None:
+    token = jwt.encode({"sub": "admin", "typ": TOKEN_TYPE_ACCESS}, SECRET_KEY, algorithm=ALGORITHM)
+    with patch("src.core.security.token_blacklist") as blacklist:
+        blacklist.is_blacklisted = AsyncMock(return_value=False)
+        assert await verify_token(token, db=object(), expected_type="access") is None
+
+
+async def test_blacklist_token_revokes_its_jti() -> None:
+    access = await create_access_token({"sub": "admin"})
+    payload = jwt.decode(access, SECRET_KEY, algorithms=[ALGORITHM])
+    with patch("src.core.security.token_blacklist") as blacklist:
+        blacklist.add = AsyncMock()
+        await blacklist_token(access, db="db")
+
+    blacklist.add.assert_awaited_once_with(
+        "db", token=access, jti=payload["jti"], expires_at=payload["exp"]
+    )
 
 
 async def test_verify_token_rejects_wrong_typ() -> None:
     access = await create_access_token({"sub": "admin"})
     refresh = await create_refresh_token({"sub": "admin"})
-    with patch("src.core.security.token_blacklist_repository") as repo:
-        repo.exists = AsyncMock(return_value=False)
+    with patch("src.core.security.token_blacklist") as blacklist:
+        blacklist.is_blacklisted = AsyncMock(return_value=False)
         with patch("src.core.security.user_repository") as user_repo:
             user_repo.get = AsyncMock()
             assert await verify_token(access, db=object(), expected_type="refresh") is None
@@ -91,8 +115,8 @@ async def test_verify_token_rejects_wrong_typ() -> None:
 async def test_verify_token_accepts_matching_typ() -> None:
     access = await create_access_token({"sub": "admin"})
     user = {"username": "admin"}
-    with patch("src.core.security.token_blacklist_repository") as repo:
-        repo.exists = AsyncMock(return_value=False)
+    with patch("src.core.security.token_blacklist") as blacklist:
+        blacklist.is_blacklisted = AsyncMock(return_value=False)
         with patch("src.core.security.cache") as cache_module:
             cache_module.client = None
             with patch("src.core.security.user_repository") as user_repo:
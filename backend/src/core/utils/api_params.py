@@ -54,7 +54,9 @@ def paginated_response(data: dict, page: int, items_per_page: int) -> dict:
     Parameters
     ----------
     data : dict
-        Data to be paginated, including the list of items and total count.
+        Data to be paginated, including the list of items and total count. If it also
+        has 'has_more' (counts other than "exact", see ``RepositoryBase.paginate``), that
+        is used instead of comparing the page with the total count.
     page : int
         Current page number.
     items_per_page : int
@@ -68,12 +70,42 @@ def paginated_response(data: dict, page: int, items_per_page: int) -> dict:
     return {
         "data": data["data"],
         "total_count": data["total_count"],
-        "has_more": (page * items_per_page) < data["total_count"],
+        "has_more": data["has_more"]
+        if "has_more" in data
+        else (page * items_per_page) < data["total_count"],
         "page": page,
         "items_per_page": items_per_page,
     }
 
 
+def cursor_paginated_response(data: dict, items_per_page: int, page: int | None = None) -> dict:
+    """
+    Create a paginated response for data fetched in keyset mode (with ``next_cursor``).
+
+    Parameters
+    ----------
+    data : dict
+        Data to be paginated, including the list of items, total count and next cursor.
+    items_per_page : int
+        Number of items per page.
+    page : int | None, optional
+        Current page number, if the page was fetched by offset rather than by cursor.
+
+    Returns
+    ----------
+    dict
+        A structured paginated response dict; ``next_cursor`` fetches the following page.
+    """
+    return {
+        "data": data["data"],
+        "total_count": data["total_count"],
+        "has_more": data.get("next_cursor") is not None,
+        "page": page,
+        "items_per_page": items_per_page,
+        "next_cursor": data.get("next_cursor"),
+    }
+
+
 # Function to calculate the offset
 def compute_offset(page: int, items_per_page: int) -> int:
     """
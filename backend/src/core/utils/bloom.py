@@ -0,0 +1,54 @@
+# Built-in Dependencies
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    In-process Bloom filter over strings (or bytes; ``"a"`` and ``b"a"`` are the same item).
+
+    ``item in bloom`` is never a false negative; false positives happen at roughly
+    ``error_rate`` while at most ``capacity`` items were added. Items cannot be removed;
+    build a new filter to drop them.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        if capacity < 1:
+            raise ValueError("Bloom filter capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _positions(self, item: object) -> list[int]:
+        if isinstance(item, str):
+            item = item.encode()
+        elif not isinstance(item, bytes):
+            raise TypeError(f"Bloom filter items must be str or bytes, not {type(item).__name__}")
+        # Double hashing (Kirsch-Mitzenmacher): k positions from one 128-bit digest.
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def add(self, item: str | bytes) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: object) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item)
+        )
+
+    @property
+    def saturated(self) -> bool:
+        """True once more than ``capacity`` items were added."""
+        return self.count > self.capacity
@@ -1,11 +1,22 @@
 # Built-in Dependencies
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Tuple, Union
+from contextlib import AsyncExitStack
+from collections import OrderedDict
+from uuid import uuid4
 import functools
+import fnmatch
+import asyncio
+import random
+import math
 import json
+import time
 import re
 
 # Third-Party Dependencies
 from redis.asyncio import Redis, ConnectionPool
+from sqlmodel.ext.asyncio.session import AsyncSession
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import serialize_response
 from fastapi.encoders import jsonable_encoder
 from fastapi import Request
 
@@ -14,10 +25,211 @@ from src.core.exceptions.cache_exceptions import (
     CacheIdentificationInferenceError,
     InvalidRequestError,
 )
+from src.core.utils.cache_codec import RAW_SERIALIZER, CacheEntry, build_codec, read_entry
+from src.core.utils.cache_metrics import cache_metrics
+from src.core.utils.etag import etag_matches, make_etag, not_modified
+from src.core.db.session import detached_api_session
+from src.core.config import settings
 from src.core.logger import logger_redis
 
 pool: ConnectionPool | None = None
 client: Redis | None = None
+codec = build_codec()
+
+TAG_KEY_PREFIX = "tag"
+LOCK_KEY_PREFIX = "lock"
+GENERATION_KEY_PREFIX = "gen"
+LOCK_POLL_INTERVAL = 0.05
+REFRESH_LOCK_TTL = 10
+
+# Delete every member of each tag index (KEYS), then the index itself. One round trip,
+# atomic on the server; DEL is chunked because Lua `unpack` has a stack limit.
+_INVALIDATE_TAGS_SCRIPT = """
+local deleted = 0
+for _, tag_key in ipairs(KEYS) do
+    local members = redis.call('ZRANGE', tag_key, 0, -1)
+    for i = 1, #members, 1000 do
+        local last = math.min(i + 999, #members)
+        deleted = deleted + redis.call('DEL', unpack(members, i, last))
+    end
+    redis.call('DEL', tag_key)
+end
+return deleted
+"""
+
+# Release a lock only if we still hold it (the token matches).
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_MISS = object()
+
+
+class RenderedBody(NamedTuple):
+    """A stored response body and its ETag (``None`` if it could not be stored)."""
+
+    body: bytes
+    etag: str | None
+
+
+_inflight: Dict[str, asyncio.Future] = {}
+_refreshing: set[str] = set()
+_background_tasks: set[asyncio.Task] = set()
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU with a TTL per entry (the L1 tier in front of Redis).
+
+    Entries keep the formatted tag keys they were stored with, so tag, key and pattern
+    invalidations evict them exactly like their Redis counterparts. Values are the
+    JSON-compatible payloads a Redis hit would return; callers must not mutate them.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[float, Any, frozenset[str]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISS
+        expires_at, value, _tag_keys = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return _MISS
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: int, tag_keys: Iterable[str] = ()) -> None:
+        if self.max_entries <= 0 or ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value, frozenset(tag_keys))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def evict_keys(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def evict_tags(self, tag_keys: Iterable[str]) -> None:
+        tag_set = set(tag_keys)
+        if not tag_set:
+            return
+        for key in [k for k, entry in self._entries.items() if entry[2] & tag_set]:
+            del self._entries[key]
+
+    def evict_patterns(self, patterns: Iterable[str]) -> None:
+        for pattern in patterns:
+            for key in [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+local_cache = LocalCache(max_entries=settings.CACHE_LOCAL_MAX_ENTRIES)
+listener_task: asyncio.Task | None = None
+# Other in-process caches that follow the same invalidations as ``local_cache``.
+_registered_local_caches: List[LocalCache] = []
+
+
+def register_local_cache(instance: LocalCache) -> LocalCache:
+    """
+    Have ``instance`` evicted by the same key, tag and pattern invalidations as
+    ``local_cache``, on every worker. For data that needs its own size budget.
+    """
+    _registered_local_caches.append(instance)
+    return instance
+
+
+def _local_caches() -> List[LocalCache]:
+    return [local_cache, *_registered_local_caches]
+
+
+def _has_local_tier() -> bool:
+    return any(instance.max_entries > 0 for instance in _local_caches())
+
+
+def _clear_local() -> None:
+    for instance in _local_caches():
+        instance.clear()
+
+
+def _evict_local(keys: List[str], tag_keys: List[str], patterns: List[str]) -> None:
+    for instance in _local_caches():
+        instance.evict_keys(keys)
+        instance.evict_tags(tag_keys)
+        instance.evict_patterns(patterns)
+
+
+async def _publish_invalidation(keys: List[str], tag_keys: List[str], patterns: List[str]) -> None:
+    """Evict locally, then tell every other worker/node to evict the same L1 entries."""
+    _evict_local(keys, tag_keys, patterns)
+    if client is None or not _has_local_tier():
+        return
+    if not (keys or tag_keys or patterns):
+        return
+    message = json.dumps({"keys": keys, "tags": tag_keys, "patterns": patterns})
+    await client.publish(settings.CACHE_INVALIDATION_CHANNEL, message)
+
+
+def _apply_invalidation_message(data: Any) -> None:
+    try:
+        message = json.loads(data)
+        _evict_local(message.get("keys", []), message.get("tags", []), message.get("patterns", []))
+    except Exception as exc:
+        # A message we cannot read may have carried evictions; drop everything to stay safe.
+        logger_redis.warning(f"Unreadable cache invalidation message; clearing L1: {exc}")
+        _clear_local()
+
+
+async def _listen_for_invalidations() -> None:
+    """Apply invalidations published by other workers. Reconnects until cancelled."""
+    while True:
+        if client is None:
+            return
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    _apply_invalidation_message(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # Messages may have been lost while disconnected.
+            logger_redis.exception(f"Cache invalidation listener failed: {exc}")
+            _clear_local()
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
+
+
+async def start_invalidation_listener() -> None:
+    global listener_task
+    if not _has_local_tier() or client is None or listener_task is not None:
+        return
+    listener_task = asyncio.create_task(_listen_for_invalidations())
+
+
+async def stop_invalidation_listener() -> None:
+    global listener_task
+    if listener_task is None:
+        return
+    listener_task.cancel()
+    try:
+        await listener_task
+    except asyncio.CancelledError:
+        pass
+    listener_task = None
 
 
 def _stable_cache_value(value: Any) -> Any:
@@ -75,6 +287,267 @@ def _as_scan_pattern(pattern: str) -> str:
     return f"{pattern}*"
 
 
+def _tag_key(tag: str) -> str:
+    return f"{TAG_KEY_PREFIX}:{tag}"
+
+
+def _format_tags(tags: List[str], kwargs: Dict[str, Any]) -> List[str]:
+    return [_tag_key(_format_prefix(tag, kwargs)) for tag in tags]
+
+
+def _generation_key(namespace: str, kwargs: Dict[str, Any]) -> str:
+    return f"{GENERATION_KEY_PREFIX}:{_format_prefix(namespace, kwargs)}"
+
+
+async def _bump_generations(generation_keys: List[str]) -> None:
+    """Move each namespace to a new generation; keys stamped with the old one go unread."""
+    if client is None or not generation_keys:
+        return
+    pipe = client.pipeline(transaction=False)
+    for generation_key in generation_keys:
+        pipe.incr(generation_key)
+    await pipe.execute()
+
+
+async def _set_with_tags(
+    cache_key: str, serialized: bytes, expiration: int, tag_keys: List[str]
+) -> None:
+    """
+    Store ``cache_key`` and index it under each tag in one pipeline.
+
+    Tag indexes are sorted sets scored by the member's expiry, so expired members are
+    pruned on every write and a hot tag never grows past its live keys. The index TTL
+    only ever moves forward (``NX`` then ``GT``) so it outlives its longest member.
+    """
+    if client is None:
+        return
+    if not tag_keys:
+        await client.set(cache_key, serialized, ex=expiration)
+        return
+
+    now = time.time()
+    pipe = client.pipeline()
+    pipe.set(cache_key, serialized, ex=expiration)
+    for tag_key in tag_keys:
+        pipe.zadd(tag_key, {cache_key: now + expiration})
+        pipe.zremrangebyscore(tag_key, "-inf", now)
+        pipe.expire(tag_key, expiration, nx=True)
+        pipe.expire(tag_key, expiration, gt=True)
+    await pipe.execute()
+
+
+async def _invalidate_tags(tag_keys: List[str]) -> None:
+    """Delete every key indexed under ``tag_keys`` with a single server-side script."""
+    if client is None:
+        logger_redis.warning("Redis cache client is not initialized; skip tag invalidation.")
+        return
+    if not tag_keys:
+        return
+    await client.eval(_INVALIDATE_TAGS_SCRIPT, len(tag_keys), *tag_keys)
+
+
+def _needs_refresh(fresh_until: float, delta: float, beta: float | None, now: float) -> bool:
+    """
+    Stale entries always refresh. With ``beta``, fresh entries refresh early with the
+    XFetch probability: the closer to the deadline and the slower the handler, the likelier.
+    """
+    if now >= fresh_until:
+        return True
+    if beta is None or delta <= 0:
+        return False
+    return now - delta * beta * math.log(1.0 - random.random()) >= fresh_until
+
+
+async def _call_detached(func: Callable, request: Request, args: Any, kwargs: Any) -> Any:
+    """Call the handler with fresh sessions in place of the request-scoped ones."""
+    async with AsyncExitStack() as stack:
+        detached_kwargs = {}
+        for name, value in kwargs.items():
+            if isinstance(value, AsyncSession):
+                value = await stack.enter_async_context(detached_api_session())
+            detached_kwargs[name] = value
+        return await func(request, *args, **detached_kwargs)
+
+
+async def _refresh(cache_key: str, load: Callable[[], Awaitable[Any]]) -> None:
+    """Reload ``cache_key`` once across the fleet; skip if another process holds its lock."""
+    lock_key = f"{LOCK_KEY_PREFIX}:{cache_key}"
+    token = uuid4().hex
+    try:
+        if client is None:
+            return
+        if not await client.set(lock_key, token, nx=True, ex=REFRESH_LOCK_TTL):
+            return
+        try:
+            await load()
+        finally:
+            await client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+    except Exception as exc:
+        logger_redis.exception(f"Background cache refresh failed for '{cache_key}': {exc}")
+    finally:
+        _refreshing.discard(cache_key)
+
+
+def _schedule_refresh(cache_key: str, load: Callable[[], Awaitable[Any]]) -> None:
+    if cache_key in _refreshing:
+        return
+    _refreshing.add(cache_key)
+    task = asyncio.create_task(_refresh(cache_key, load))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _mark_retrieved(future: asyncio.Future) -> None:
+    # Followers may all be gone; keep asyncio from logging an unretrieved exception.
+    if not future.cancelled():
+        future.exception()
+
+
+async def _single_flight(key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run ``load`` once per ``key`` in this process; concurrent callers await its outcome.
+
+    Followers share the leader's result or exception. If the leader is cancelled (client
+    disconnect), followers load for themselves instead of inheriting the cancellation.
+    """
+    pending = _inflight.get(key)
+    if pending is not None:
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if pending.cancelled():
+                return await _single_flight(key, load)
+            raise
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    future.add_done_callback(_mark_retrieved)
+    _inflight[key] = future
+    try:
+        result = await load()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+
+async def _wait_for_cached(cache_key: str, timeout: float) -> Any:
+    """Poll ``cache_key`` until it is filled or ``timeout`` passes; ``_MISS`` on timeout."""
+    if client is None:
+        return _MISS
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+        try:
+            cached_data = await client.get(cache_key)
+        except Exception as exc:
+            logger_redis.exception(f"Redis GET failed while waiting for '{cache_key}': {exc}")
+            return _MISS
+        entry = read_entry(cached_data)
+        if entry is not None:
+            return _entry_value(entry)
+    return _MISS
+
+
+async def _load_with_lock(
+    cache_key: str, load: Callable[[], Awaitable[Any]], lock_timeout: float | None
+) -> Any:
+    """
+    Run ``load`` under a fleet-wide Redis lock for ``cache_key``.
+
+    Callers that lose the lock poll the cache key until the holder stores it, for at
+    most ``lock_timeout`` seconds, then load themselves. The lock expires after the same
+    ``lock_timeout`` so a crashed holder never stalls readers for longer than that.
+    """
+    if lock_timeout is None or client is None:
+        return await load()
+
+    lock_key = f"{LOCK_KEY_PREFIX}:{cache_key}"
+    token = uuid4().hex
+    try:
+        acquired = await client.set(lock_key, token, nx=True, px=int(lock_timeout * 1000))
+    except Exception as exc:
+        logger_redis.exception(f"Redis lock failed for '{cache_key}': {exc}")
+        return await load()
+
+    if not acquired:
+        cached_value = await _wait_for_cached(cache_key, lock_timeout)
+        if cached_value is not _MISS:
+            return cached_value
+        return await load()
+
+    try:
+        return await load()
+    finally:
+        try:
+            await client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception as exc:
+            logger_redis.exception(f"Redis lock release failed for '{cache_key}': {exc}")
+
+
+async def _render_response_body(request: Request, result: Any) -> bytes:
+    """
+    Serialize ``result`` to the JSON body FastAPI would send for the matched route.
+
+    Uses the route's ``response_model`` (validation, include/exclude options) through
+    FastAPI's own serializer, so a cached body is byte-for-byte the uncached response.
+    """
+    route = request.scope.get("route")
+    field = getattr(route, "response_field", None)
+    if field is None:
+        return JSONResponse(jsonable_encoder(result)).body
+    return await serialize_response(
+        field=field,
+        response_content=result,
+        include=route.response_model_include,
+        exclude=route.response_model_exclude,
+        by_alias=route.response_model_by_alias,
+        exclude_unset=route.response_model_exclude_unset,
+        exclude_defaults=route.response_model_exclude_defaults,
+        exclude_none=route.response_model_exclude_none,
+        dump_json=True,
+    )
+
+
+def _entry_etag(entry: CacheEntry) -> str | None:
+    if entry.serializer_id != RAW_SERIALIZER.id:
+        return None
+    return make_etag(entry.fingerprint)
+
+
+def _entry_value(entry: CacheEntry) -> Any:
+    etag = _entry_etag(entry)
+    if etag is not None:
+        return RenderedBody(entry.value, etag)
+    return entry.value
+
+
+def _as_response(request: Request, value: Any) -> Any:
+    """
+    Wrap a stored response body in a ``Response`` (304 if ``If-None-Match`` matches its
+    ETag); other values go through FastAPI.
+    """
+    if not isinstance(value, RenderedBody):
+        return value
+    if value.etag is None:
+        headers = None
+    elif etag_matches(request, value.etag):
+        return not_modified(value.etag)
+    else:
+        headers = {"ETag": value.etag}
+    status_code = getattr(request.scope.get("route"), "status_code", None) or 200
+    return Response(
+        content=value.body, status_code=status_code, headers=headers, media_type="application/json"
+    )
+
+
 async def _delete_keys_by_pattern(pattern: str) -> None:
     """Delete Redis keys matching ``pattern`` via SCAN. Stop only when the cursor is 0."""
     if client is None:
@@ -94,6 +567,34 @@ async def _delete_keys_by_pattern(pattern: str) -> None:
             break
 
 
+def format_tag_keys(tags: List[str]) -> List[str]:
+    """Formatted tag index keys, as ``LocalCache.set`` and the helpers below expect."""
+    return [_tag_key(tag) for tag in tags]
+
+
+async def get_value(key: str) -> Any:
+    """Decoded value stored under ``key`` in Redis, or ``None`` on a miss."""
+    if client is None:
+        return None
+    entry = read_entry(await client.get(key))
+    if entry is None:
+        return None
+    return entry.value
+
+
+async def set_value(key: str, value: Any, expiration: int, tags: List[str]) -> None:
+    """Store a JSON-compatible ``value`` under ``key``, indexed under ``tags``."""
+    await _set_with_tags(key, codec.encode(value), expiration, format_tag_keys(tags))
+
+
+async def invalidate_tags(tags: List[str]) -> None:
+    """Delete every Redis and L1 entry indexed under ``tags``, on every worker."""
+    formatted = format_tag_keys(tags)
+    if client is not None:
+        await _invalidate_tags(formatted)
+    await _publish_invalidation([], formatted, [])
+
+
 def cache(
     key_prefix: str,
     resource_id_name: str | None = None,
@@ -101,6 +602,15 @@ def cache(
     resource_id_type: Union[type, Tuple[type, ...]] = int,
     to_invalidate_extra: Dict[str, Any] | None = None,
     pattern_to_invalidate_extra: List[str] | None = None,
+    tags: List[str] | None = None,
+    tags_to_invalidate: List[str] | None = None,
+    local_ttl: int | None = None,
+    lock_timeout: float | None = None,
+    stale_ttl: int = 0,
+    early_refresh_beta: float | None = None,
+    raw_response: bool = False,
+    namespace: str | None = None,
+    namespaces_to_invalidate: List[str] | None = None,
 ) -> Callable:
     """
     Cache decorator for FastAPI endpoints (Redis).
@@ -108,6 +618,43 @@ def cache(
     GET reads/writes ``{prefix}:{resource_id}``. Other methods run the handler first,
     then delete that item key (if a resource id is known) and optional extra keys/patterns.
 
+    ``tags`` (GET) index the stored key under each formatted tag, e.g.
+    ``["blog:posts:user:{user_id}"]``. ``tags_to_invalidate`` (writes) delete every key
+    indexed under those tags in one round trip, independent of the keyspace size. Prefer
+    tags over ``pattern_to_invalidate_extra``, which SCANs the whole keyspace and stays
+    for keys that are not indexed.
+
+    ``namespace`` (GET), e.g. ``"blog:posts:user:{user_id}"``, folds that namespace's
+    generation counter into the key. ``namespaces_to_invalidate`` (writes) INCR the
+    counters, which invalidates every variant (page, filters, sort) in one O(1) command;
+    the orphaned keys age out with their TTL. Counters (``gen:{namespace}``) never expire.
+
+    ``local_ttl`` (GET) opts the prefix into the in-process L1 tier: hits are served from
+    worker memory for up to ``min(local_ttl, expiration)`` seconds without a Redis round
+    trip or payload decoding. Every write invalidation also evicts L1 entries locally and
+    publishes the eviction on ``CACHE_INVALIDATION_CHANNEL`` for the other workers.
+
+    Concurrent GET misses on the same key inside one process are coalesced: one call runs
+    the handler and the others await its result. ``lock_timeout`` (seconds) extends this
+    across processes with a Redis lock; callers that lose it wait for the holder to fill
+    the key, up to ``lock_timeout``, before falling back to the handler.
+
+    ``stale_ttl`` keeps an entry for that many seconds past ``expiration``: a stale hit is
+    returned immediately while one background task (per key, fleet-wide) reruns the
+    handler on its own session. ``early_refresh_beta`` refreshes fresh entries early with
+    XFetch probabilistic expiration, weighted by the handler time stored with the value
+    (1.0 is the usual choice; higher refreshes earlier).
+
+    ``raw_response`` (GET) stores the final JSON body, rendered once through the route's
+    ``response_model``, and serves hits as a ``Response`` with those bytes: no decoding,
+    re-validation or re-serialization. The handler must return what the route's
+    ``response_model`` accepts; headers set on an injected ``Response`` are not replayed.
+    These responses carry a strong ``ETag`` (the stored payload's fingerprint), and a hit
+    whose ``If-None-Match`` matches it gets a 304 before the payload is even decoded.
+
+    Every call is counted per ``key_prefix`` in ``cache_metrics`` (hits, misses, stale
+    serves, invalidations, encode/decode and Redis timings, payload sizes).
+
     Redis failures fail open: the handler still runs. Invalidation failures are logged
     and do not hide service errors. ``InvalidRequestError`` (invalidate on GET) and
     ``CacheIdentificationInferenceError`` remain programmer errors.
@@ -115,11 +662,19 @@ def cache(
     POST/create may omit ``resource_id_name`` and only pass ``pattern_to_invalidate_extra``.
     """
 
+    tracks_freshness = stale_ttl > 0 or early_refresh_beta is not None
+    metrics = cache_metrics.register(key_prefix)
+
     def wrapper(func: Callable) -> Callable:
         @functools.wraps(func)
         async def inner(request: Request, *args: Any, **kwargs: Any) -> Any:
             if request.method == "GET":
-                if to_invalidate_extra is not None or pattern_to_invalidate_extra is not None:
+                if (
+                    to_invalidate_extra is not None
+                    or pattern_to_invalidate_extra is not None
+                    or tags_to_invalidate is not None
+                    or namespaces_to_invalidate is not None
+                ):
                     raise InvalidRequestError
 
             resource_id: Any | None = None
@@ -139,21 +694,101 @@ def cache(
                         "Redis cache client is not initialized; skipping cache for GET."
                     )
                     return await func(request, *args, **kwargs)
+                tag_keys = _format_tags(tags, kwargs) if tags else []
+                local_expiration = min(local_ttl, expiration) if local_ttl is not None else 0
+                # L1 entries are keyed without the generation and evicted when it moves.
+                local_key = cache_key
+                local_tag_keys = tag_keys
+                generation_key = _generation_key(namespace, kwargs) if namespace else None
+                if generation_key is not None:
+                    local_tag_keys = [*tag_keys, generation_key]
+
+                async def store(result: Any, delta: float) -> Any:
+                    """Store ``result``; return what to respond with."""
+                    fresh_until = time.time() + expiration if tracks_freshness else None
+                    if raw_response:
+                        result = RenderedBody(result, None)
+                    try:
+                        started = time.perf_counter()
+                        if raw_response:
+                            serialized = codec.encode_body(result.body, fresh_until, delta)
+                            result = RenderedBody(result.body, _entry_etag(CacheEntry(serialized)))
+                            encoded = result
+                        else:
+                            encoded = jsonable_encoder(result)
+                            serialized = codec.encode(encoded, fresh_until, delta)
+                        metrics.encode_seconds.observe(time.perf_counter() - started)
+                        metrics.payload_bytes.observe(len(serialized))
+                        started = time.perf_counter()
+                        await _set_with_tags(
+                            cache_key, serialized, expiration + stale_ttl, tag_keys
+                        )
+                        metrics.redis_seconds.observe(time.perf_counter() - started)
+                        local_cache.set(local_key, encoded, local_expiration, local_tag_keys)
+                    except Exception as exc:
+                        metrics.errors += 1
+                        logger_redis.exception(f"Redis SETEX failed for '{cache_key}': {exc}")
+                    return result
+
+                async def produce(call: Callable[[], Awaitable[Any]]) -> Any:
+                    started = time.monotonic()
+                    result = await call()
+                    if raw_response:
+                        result = await _render_response_body(request, result)
+                    return await store(result, time.monotonic() - started)
+
+                async def load() -> Any:
+                    return await produce(lambda: func(request, *args, **kwargs))
+
+                async def reload() -> None:
+                    await produce(lambda: _call_detached(func, request, args, kwargs))
+
+                if local_expiration > 0:
+                    local_hit = local_cache.get(local_key)
+                    if local_hit is not _MISS:
+                        metrics.local_hits += 1
+                        return _as_response(request, local_hit)
+
                 try:
+                    started = time.perf_counter()
+                    if generation_key is not None:
+                        generation = await client.get(generation_key)
+                        cache_key = f"{formatted_key_prefix}:g{int(generation or 0)}:{resource_id}"
                     cached_data = await client.get(cache_key)
-                    if cached_data:
-                        return json.loads(cached_data)
+                    metrics.redis_seconds.observe(time.perf_counter() - started)
+                    entry = read_entry(cached_data)
+                    if entry is not None:
+                        metrics.hits += 1
+                        fresh_until = entry.fresh_until
+                        now = time.time()
+                        is_fresh = fresh_until is None or now < fresh_until
+                        if not is_fresh:
+                            metrics.stale_hits += 1
+                        if fresh_until is not None and _needs_refresh(
+                            fresh_until, entry.delta, early_refresh_beta, now
+                        ):
+                            _schedule_refresh(cache_key, reload)
+                        etag = _entry_etag(entry)
+                        if etag is not None and etag_matches(request, etag):
+                            metrics.not_modified += 1
+                            return not_modified(etag)
+                        started = time.perf_counter()
+                        value = _entry_value(entry)
+                        metrics.decode_seconds.observe(time.perf_counter() - started)
+                        if is_fresh:
+                            local_cache.set(local_key, value, local_expiration, local_tag_keys)
+                        return _as_response(request, value)
                 except Exception as exc:
+                    metrics.errors += 1
                     logger_redis.exception(f"Redis GET failed for '{cache_key}': {exc}")
                     return await func(request, *args, **kwargs)
 
-                result = await func(request, *args, **kwargs)
-                try:
-                    serialized = json.dumps(jsonable_encoder(result))
-                    await client.set(cache_key, serialized, ex=expiration)
-                except Exception as exc:
-                    logger_redis.exception(f"Redis SETEX failed for '{cache_key}': {exc}")
-                return result
+                metrics.misses += 1
+
+                result = await _single_flight(
+                    cache_key, lambda: _load_with_lock(cache_key, load, lock_timeout)
+                )
+                return _as_response(request, result)
 
             result = await func(request, *args, **kwargs)
             if client is None:
@@ -161,19 +796,48 @@ def cache(
                     "Redis cache client is not initialized; skipping cache invalidation."
                 )
                 return result
+            invalidated_keys: List[str] = []
+            invalidated_tag_keys: List[str] = []
+            invalidated_patterns: List[str] = []
+            generation_keys: List[str] = []
+            metrics.invalidations += 1
             try:
                 if cache_key is not None:
-                    await client.delete(cache_key)
+                    invalidated_keys.append(cache_key)
                 if to_invalidate_extra is not None:
                     formatted_extra = _format_extra_data(to_invalidate_extra, kwargs)
                     for extra_prefix, extra_id in formatted_extra.items():
-                        await client.delete(f"{extra_prefix}:{extra_id}")
+                        invalidated_keys.append(f"{extra_prefix}:{extra_id}")
+                if tags_to_invalidate is not None:
+                    invalidated_tag_keys = _format_tags(tags_to_invalidate, kwargs)
+                if namespaces_to_invalidate is not None:
+                    generation_keys = [
+                        _generation_key(namespace_to_invalidate, kwargs)
+                        for namespace_to_invalidate in namespaces_to_invalidate
+                    ]
                 if pattern_to_invalidate_extra is not None:
-                    for pattern in pattern_to_invalidate_extra:
-                        formatted_pattern = _format_prefix(pattern, kwargs)
-                        await _delete_keys_by_pattern(_as_scan_pattern(formatted_pattern))
+                    invalidated_patterns = [
+                        _as_scan_pattern(_format_prefix(pattern, kwargs))
+                        for pattern in pattern_to_invalidate_extra
+                    ]
+
+                started = time.perf_counter()
+                if invalidated_keys:
+                    await client.delete(*invalidated_keys)
+                await _invalidate_tags(invalidated_tag_keys)
+                await _bump_generations(generation_keys)
+                for pattern in invalidated_patterns:
+                    await _delete_keys_by_pattern(pattern)
+                metrics.redis_seconds.observe(time.perf_counter() - started)
             except Exception as exc:
+                metrics.errors += 1
                 logger_redis.exception(f"Redis cache invalidation failed: {exc}")
+            try:
+                await _publish_invalidation(
+                    invalidated_keys, invalidated_tag_keys + generation_keys, invalidated_patterns
+                )
+            except Exception as exc:
+                logger_redis.exception(f"Cache invalidation publish failed: {exc}")
             return result
 
         return inner
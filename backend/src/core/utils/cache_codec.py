@@ -0,0 +1,224 @@
+# Built-in Dependencies
+from typing import Any, Callable, Dict, NamedTuple
+from functools import cached_property
+import importlib
+import struct
+import json
+import zlib
+
+# Local Dependencies
+from src.core.utils.etag import fingerprint
+from src.core.config import settings
+
+# Every binary entry starts with this header:
+# format version, serializer id, compressor id, fresh-until epoch (0 = none), handler seconds.
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("!BBBdd")
+# Entries written before the binary format are JSON text: an object, list or string.
+_LEGACY_FIRST_BYTES = (b"{", b"[", b'"')
+
+
+class Serializer(NamedTuple):
+    id: int
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+class Compressor(NamedTuple):
+    id: int
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+# Stores an already-encoded body (e.g. a rendered response) as is. Not selectable by
+# name: it only carries bytes, so it is used explicitly via ``CacheCodec.encode_body``.
+RAW_SERIALIZER = Serializer(id=0, dumps=bytes, loads=bytes)
+
+
+def _json_serializer() -> Serializer:
+    return Serializer(
+        id=1,
+        dumps=lambda obj: json.dumps(obj, separators=(",", ":")).encode(),
+        loads=json.loads,
+    )
+
+
+def _orjson_serializer() -> Serializer:
+    orjson = importlib.import_module("orjson")
+    return Serializer(id=2, dumps=orjson.dumps, loads=orjson.loads)
+
+
+def _msgpack_serializer() -> Serializer:
+    msgpack = importlib.import_module("msgpack")
+    return Serializer(
+        id=3,
+        dumps=lambda obj: msgpack.packb(obj, use_bin_type=True),
+        loads=lambda data: msgpack.unpackb(data, raw=False),
+    )
+
+
+def _no_compressor() -> Compressor:
+    return Compressor(id=0, compress=lambda data: data, decompress=lambda data: data)
+
+
+def _zlib_compressor() -> Compressor:
+    return Compressor(
+        id=1, compress=lambda data: zlib.compress(data, 1), decompress=zlib.decompress
+    )
+
+
+def _zstd_compressor() -> Compressor:
+    zstandard = importlib.import_module("zstandard")
+    compressor = zstandard.ZstdCompressor(level=3)
+    decompressor = zstandard.ZstdDecompressor()
+    return Compressor(id=2, compress=compressor.compress, decompress=decompressor.decompress)
+
+
+def _lz4_compressor() -> Compressor:
+    lz4_frame = importlib.import_module("lz4.frame")
+    return Compressor(id=3, compress=lz4_frame.compress, decompress=lz4_frame.decompress)
+
+
+SERIALIZERS: Dict[str, Callable[[], Serializer]] = {
+    "json": _json_serializer,
+    "orjson": _orjson_serializer,
+    "msgpack": _msgpack_serializer,
+}
+COMPRESSORS: Dict[str, Callable[[], Compressor]] = {
+    "none": _no_compressor,
+    "zlib": _zlib_compressor,
+    "zstd": _zstd_compressor,
+    "lz4": _lz4_compressor,
+}
+
+# Ids resolve lazily so an entry written by another worker with an optional codec only
+# needs that package where it is read.
+_SERIALIZER_IDS = {1: "json", 2: "orjson", 3: "msgpack"}
+_COMPRESSOR_IDS = {0: "none", 1: "zlib", 2: "zstd", 3: "lz4"}
+_resolved_serializers: Dict[int, Serializer] = {RAW_SERIALIZER.id: RAW_SERIALIZER}
+_resolved_compressors: Dict[int, Compressor] = {}
+
+
+def get_serializer(name: str) -> Serializer:
+    """Build a serializer by name. ``orjson``/``msgpack`` need their package installed."""
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown cache serializer '{name}'")
+    return SERIALIZERS[name]()
+
+
+def get_compressor(name: str) -> Compressor:
+    """Build a compressor by name. ``zstd``/``lz4`` need ``zstandard``/``lz4`` installed."""
+    if name not in COMPRESSORS:
+        raise ValueError(f"Unknown cache compressor '{name}'")
+    return COMPRESSORS[name]()
+
+
+def _serializer_by_id(serializer_id: int) -> Serializer:
+    if serializer_id not in _resolved_serializers:
+        _resolved_serializers[serializer_id] = get_serializer(_SERIALIZER_IDS[serializer_id])
+    return _resolved_serializers[serializer_id]
+
+
+def _compressor_by_id(compressor_id: int) -> Compressor:
+    if compressor_id not in _resolved_compressors:
+        _resolved_compressors[compressor_id] = get_compressor(_COMPRESSOR_IDS[compressor_id])
+    return _resolved_compressors[compressor_id]
+
+
+class CacheCodec:
+    """
+    Encode JSON-compatible payloads into versioned, optionally compressed cache entries.
+
+    Payloads smaller than ``compression_min_size`` bytes are stored uncompressed, since
+    compressing them costs more CPU than the memory it saves.
+    """
+
+    def __init__(
+        self,
+        serializer: Serializer,
+        compressor: Compressor,
+        compression_min_size: int,
+    ) -> None:
+        self.serializer = serializer
+        self.compressor = compressor
+        self.compression_min_size = compression_min_size
+
+    def encode(self, payload: Any, fresh_until: float | None = None, delta: float = 0.0) -> bytes:
+        return self._pack(self.serializer.id, self.serializer.dumps(payload), fresh_until, delta)
+
+    def encode_body(
+        self, body: bytes, fresh_until: float | None = None, delta: float = 0.0
+    ) -> bytes:
+        """Store pre-encoded ``body`` bytes; the entry's ``value`` is those bytes again."""
+        return self._pack(RAW_SERIALIZER.id, body, fresh_until, delta)
+
+    def _pack(
+        self, serializer_id: int, body: bytes, fresh_until: float | None, delta: float
+    ) -> bytes:
+        compressor_id = 0
+        if self.compressor.id != 0 and len(body) >= self.compression_min_size:
+            body = self.compressor.compress(body)
+            compressor_id = self.compressor.id
+        header = _HEADER.pack(
+            FORMAT_VERSION, serializer_id, compressor_id, fresh_until or 0.0, delta
+        )
+        return header + body
+
+
+class CacheEntry:
+    """
+    A cached entry whose payload is decoded only when ``value`` is first read.
+
+    The freshness metadata lives in the fixed-size header, so deciding whether to
+    refresh never touches the payload. Entries written before the binary format (plain
+    JSON text) are read as fresh values without a deadline. Raises ``ValueError`` for
+    any other format version; use ``read_entry`` to treat those as a miss.
+    """
+
+    def __init__(self, raw: bytes | str) -> None:
+        if isinstance(raw, str):
+            raw = raw.encode()
+        self.raw = raw
+        self.is_legacy = raw[:1] in _LEGACY_FIRST_BYTES
+        if self.is_legacy:
+            self.serializer_id, self.compressor_id = 1, 0
+            self.fresh_until: float | None = None
+            self.delta = 0.0
+            self._body_offset = 0
+        elif len(raw) >= _HEADER.size and raw[0] == FORMAT_VERSION:
+            _, self.serializer_id, self.compressor_id, fresh_until, self.delta = (
+                _HEADER.unpack_from(raw)
+            )
+            self.fresh_until = fresh_until or None
+            self._body_offset = _HEADER.size
+        else:
+            raise ValueError(f"Unsupported cache entry format {raw[:1]!r}")
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Digest of the stored payload; changes exactly when the payload does."""
+        return fingerprint(memoryview(self.raw)[self._body_offset :])
+
+    @cached_property
+    def value(self) -> Any:
+        body = memoryview(self.raw)[self._body_offset :].tobytes()
+        body = _compressor_by_id(self.compressor_id).decompress(body)
+        return _serializer_by_id(self.serializer_id).loads(body)
+
+
+def read_entry(raw: bytes | str | None) -> CacheEntry | None:
+    """``CacheEntry`` for ``raw``, or ``None`` if it is empty or from another format version."""
+    if not raw:
+        return None
+    try:
+        return CacheEntry(raw)
+    except ValueError:
+        return None
+
+
+def build_codec() -> CacheCodec:
+    return CacheCodec(
+        serializer=get_serializer(settings.CACHE_SERIALIZER),
+        compressor=get_compressor(settings.CACHE_COMPRESSION),
+        compression_min_size=settings.CACHE_COMPRESSION_MIN_SIZE,
+    )
@@ -0,0 +1,175 @@
+# Built-in Dependencies
+from typing import Any, Dict, Iterable, List, Tuple
+from bisect import bisect_left
+import math
+import re
+
+SIZE_BUCKETS: Tuple[float, ...] = (256, 1024, 4096, 16384, 65536, 262144, 1048576, math.inf)
+SECONDS_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    math.inf,
+)
+
+# Redis keys the cache writes besides entries: tag indexes, generation counters, locks.
+INTERNAL_PREFIXES = ("tag", "gen", "lock")
+
+
+class Histogram:
+    """Fixed-bucket histogram; ``counts[i]`` holds observations ``<= buckets[i]``."""
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": {
+                ("+Inf" if math.isinf(bound) else str(bound)): count
+                for bound, count in zip(self.buckets, self.counts, strict=True)
+            },
+        }
+
+
+class PrefixMetrics:
+    """Counters and histograms for one ``cache()`` key prefix in this process."""
+
+    COUNTERS = (
+        "hits",
+        "local_hits",
+        "stale_hits",
+        "not_modified",
+        "misses",
+        "invalidations",
+        "errors",
+    )
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.local_hits = 0
+        self.stale_hits = 0
+        self.not_modified = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+        self.encode_seconds = Histogram(SECONDS_BUCKETS)
+        self.decode_seconds = Histogram(SECONDS_BUCKETS)
+        self.redis_seconds = Histogram(SECONDS_BUCKETS)
+        self.payload_bytes = Histogram(SIZE_BUCKETS)
+
+    def histograms(self) -> Dict[str, Histogram]:
+        return {
+            "encode_seconds": self.encode_seconds,
+            "decode_seconds": self.decode_seconds,
+            "redis_seconds": self.redis_seconds,
+            "payload_bytes": self.payload_bytes,
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {name: getattr(self, name) for name in self.COUNTERS}
+        for name, histogram in self.histograms().items():
+            data[name] = histogram.snapshot()
+        return data
+
+
+class CacheMetrics:
+    """
+    Per-process registry of ``PrefixMetrics`` keyed by the unformatted ``key_prefix``.
+
+    Templates (not formatted keys) keep the label set bounded. Every worker keeps its own
+    numbers; aggregate across workers in the scraper.
+    """
+
+    def __init__(self) -> None:
+        self._prefixes: Dict[str, PrefixMetrics] = {}
+
+    def register(self, key_prefix: str) -> PrefixMetrics:
+        if key_prefix not in self._prefixes:
+            self._prefixes[key_prefix] = PrefixMetrics()
+        return self._prefixes[key_prefix]
+
+    def prefixes(self) -> List[str]:
+        return sorted(self._prefixes)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {prefix: self._prefixes[prefix].snapshot() for prefix in self.prefixes()}
+
+    def reset(self) -> None:
+        for prefix in self._prefixes:
+            self._prefixes[prefix] = PrefixMetrics()
+
+    def render_prometheus(self) -> str:
+        """Render every prefix in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for name in PrefixMetrics.COUNTERS:
+            samples = [
+                ({"prefix": prefix}, getattr(self._prefixes[prefix], name))
+                for prefix in self.prefixes()
+            ]
+            lines += render_metric(f"cache_{name}_total", "counter", samples)
+        for name in PrefixMetrics().histograms():
+            samples = [
+                ({"prefix": prefix}, self._prefixes[prefix].histograms()[name])
+                for prefix in self.prefixes()
+            ]
+            lines += render_metric(f"cache_{name}", "histogram", samples)
+        return "\n".join(lines) + "\n"
+
+
+def render_metric(
+    metric: str, kind: str, samples: Iterable[Tuple[Dict[str, str], Any]]
+) -> List[str]:
+    """
+    Prometheus text lines for one metric: its ``# TYPE`` line, then one sample per
+    label set. Histogram samples are ``Histogram`` instances, rendered as cumulative
+    ``_bucket`` lines plus ``_sum`` and ``_count``.
+    """
+    lines = [f"# TYPE {metric} {kind}"]
+    for labels, value in samples:
+        if not isinstance(value, Histogram):
+            lines.append(f"{metric}{_labels(labels)} {value}")
+            continue
+        cumulative = 0
+        for bound, count in zip(value.buckets, value.counts, strict=True):
+            cumulative += count
+            le = "+Inf" if math.isinf(bound) else repr(bound)
+            lines.append(f"{metric}_bucket{_labels({**labels, 'le': le})} {cumulative}")
+        lines.append(f"{metric}_sum{_labels(labels)} {value.sum}")
+        lines.append(f"{metric}_count{_labels(labels)} {value.count}")
+    return lines
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f"{name}={_label(value)}" for name, value in labels.items()) + "}"
+
+
+def _label(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def prefix_scan_pattern(key_prefix: str) -> str:
+    """``blog:posts:user:{user_id}:page`` -> ``blog:posts:user:*:page:*`` (every key it writes)."""
+    return re.sub(r"{.*?}", "*", key_prefix) + ":*"
+
+
+cache_metrics = CacheMetrics()
@@ -0,0 +1,50 @@
+# Built-in Dependencies
+from datetime import datetime
+from typing import Any, Dict
+import hashlib
+import json
+
+# Third-Party Dependencies
+from fastapi.encoders import jsonable_encoder
+from fastapi import Request, Response
+
+
+def fingerprint(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def make_etag(value: str) -> str:
+    """Quote ``value`` as a strong entity tag."""
+    return f'"{value}"'
+
+
+def resource_etag(resource: Dict[str, Any]) -> str:
+    """
+    Strong ETag for a single resource.
+
+    Rows that carry timestamps are tagged by ``id`` and ``updated_at``, falling back to
+    ``created_at`` while a row has never been updated, so a row keeps one tag format
+    and no serialization is needed. Resources without timestamps are tagged by a
+    fingerprint of their content.
+    """
+    version = resource.get("updated_at") or resource.get("created_at")
+    if isinstance(version, datetime) and resource.get("id") is not None:
+        return make_etag(f"{resource['id']}-{version.timestamp():.6f}")
+    content = json.dumps(jsonable_encoder(resource), sort_keys=True, separators=(",", ":"))
+    return make_etag(fingerprint(content.encode()))
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """``If-None-Match`` check; uses weak comparison, as RFC 9110 requires for it."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,160 @@
+# Built-in Dependencies
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+import asyncio
+import math
+import threading
+import time
+
+# Local Dependencies
+from src.core.utils.cache_metrics import Histogram, render_metric
+
+T = TypeVar("T")
+
+# bcrypt at the default cost takes ~50-300 ms; queue waits can reach seconds in a storm.
+HASH_SECONDS_BUCKETS: Tuple[float, ...] = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    math.inf,
+)
+
+
+class PasswordHasherBusyError(Exception):
+    """
+    Exception raised when the password hashing queue is full.
+    """
+
+    def __init__(self, message: str = "Password hashing queue is full.") -> None:
+        self.message = message
+        super().__init__(self.message)
+
+
+class PasswordHasher:
+    """
+    Bounded thread pool for bcrypt, so hashing never runs on the event loop.
+
+    ``bcrypt`` releases the GIL while it hashes, so ``max_workers`` threads hash in
+    parallel while the loop keeps serving other requests. At most ``max_queue`` calls
+    wait for a free thread; beyond that ``run`` raises ``PasswordHasherBusyError``
+    instead of letting a login storm queue unbounded work (and memory) behind it.
+
+    Counters and histograms are per process, like ``cache_metrics``.
+    """
+
+    COUNTERS = ("submitted", "completed", "failed", "rejected")
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        if max_workers < 1:
+            raise ValueError("Password hasher needs at least one worker")
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        # Guards the counters below; they are updated from the pool threads too.
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.running = 0
+        self.max_queued = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.wait_seconds = Histogram(HASH_SECONDS_BUCKETS)
+        self.hash_seconds = Histogram(HASH_SECONDS_BUCKETS)
+
+    @property
+    def queued(self) -> int:
+        """Calls waiting for a free thread."""
+        return self.in_flight - self.running
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hasher"
+            )
+        return self._executor
+
+    def _timed(self, submitted_at: float, fn: Callable[..., T], *args: Any) -> T:
+        started_at = time.perf_counter()
+        with self._lock:
+            self.running += 1
+            self.wait_seconds.observe(started_at - submitted_at)
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.hash_seconds.observe(time.perf_counter() - started_at)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` on the pool and wait for it without blocking the loop."""
+        with self._lock:
+            if self.in_flight >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordHasherBusyError()
+            self.in_flight += 1
+            self.submitted += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+        future = self._get_executor().submit(self._timed, time.perf_counter(), fn, *args)
+        # The slot is freed when the job is done, not when the caller stops waiting: a
+        # cancelled caller leaves a running job behind, and only a queued one is dropped.
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if future.cancelled():
+                return
+            if future.exception() is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            data: Dict[str, Any] = {name: getattr(self, name) for name in self.COUNTERS}
+            data.update(
+                workers=self.max_workers,
+                max_queue=self.max_queue,
+                running=self.running,
+                queued=self.queued,
+                max_queued=self.max_queued,
+                wait_seconds=self.wait_seconds.snapshot(),
+                hash_seconds=self.hash_seconds.snapshot(),
+            )
+        return data
+
+    def render_prometheus(self) -> str:
+        """Render the pool metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            for name in self.COUNTERS:
+                metric = f"password_hash_{name}_total"
+                lines += render_metric(metric, "counter", [({}, getattr(self, name))])
+            gauges = {
+                "running": self.running,
+                "queued": self.queued,
+                "max_queued": self.max_queued,
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+            }
+            for name, value in gauges.items():
+                lines += render_metric(f"password_hash_{name}", "gauge", [({}, value)])
+            for name in ("wait_seconds", "hash_seconds"):
+                histogram = getattr(self, name)
+                lines += render_metric(f"password_hash_{name}", "histogram", [({}, histogram)])
+        return "\n".join(lines) + "\n"
+
+    def shutdown(self) -> None:
+        """Stop the threads; a later ``run`` starts a fresh pool."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,19 +1,124 @@
 # Built-in Dependencies
-from datetime import datetime, UTC
-from typing import Any
+from typing import Any, NamedTuple, Pattern
+from uuid import uuid4
+import asyncio
+import hashlib
+import weakref
+import math
+import time
 
 # Third-Party Dependencies
 from redis.asyncio import Redis, ConnectionPool
+from redis.exceptions import NoScriptError
 from fastapi import FastAPI, Request
+from starlette.routing import compile_path
 
 # Local Dependencies
 from src.core.exceptions.cache_exceptions import MissingClientError
+from src.core.common.enums import RateLimitCostBasis
 from src.core.logger import logger_redis, logger_api
 
 # Redis connection pool and client instances
 pool: ConnectionPool | None = None
 client: Redis | None = None
 
+ALGORITHMS = ("fixed_window", "sliding_window", "gcra")
+
+# Sliding window counter. KEYS: current window, previous window.
+# ARGV: limit, period (s), seconds elapsed in the current window, request cost.
+# The previous window's count is weighted by how much of it still overlaps the last
+# `period` seconds. Denied requests are not counted.
+# Returns {allowed, remaining, reset_ms, retry_after_ms}.
+_SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local elapsed = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local weight = (period - elapsed) / period
+local reset_ms = math.ceil((period - elapsed) * 1000)
+if previous * weight + current + cost > limit then
+    local retry = period - elapsed
+    if previous > 0 and current + cost <= limit then
+        retry = (period - elapsed) - (limit - current - cost) * period / previous
+    end
+    return {0, 0, reset_ms, math.ceil(math.max(retry, 0) * 1000)}
+end
+current = redis.call('INCRBY', KEYS[1], cost)
+if current == cost then
+    redis.call('EXPIRE', KEYS[1], period * 2)
+end
+return {1, math.floor(limit - (previous * weight + current)), reset_ms, 0}
+"""
+
+# GCRA (token bucket as a theoretical arrival time). KEYS: TAT key.
+# ARGV: limit, period (ms), now (ms), request cost. Allows bursts of `limit`, refilling
+# one unit every period/limit ms; a request takes `cost` units. Returns {allowed, remaining, reset_ms, retry_after_ms}.
+_GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local interval = period / limit
+local tat = tonumber(redis.call('GET', KEYS[1]) or ARGV[3])
+if tat < now then
+    tat = now
+end
+local new_tat = tat + interval * cost
+local allow_at = new_tat - period
+if now < allow_at then
+    return {0, 0, math.ceil(tat - now), math.ceil(allow_at - now)}
+end
+redis.call('SET', KEYS[1], string.format('%.3f', new_tat), 'PX', math.ceil(new_tat - now))
+return {1, math.floor((period - (new_tat - now)) / interval), math.ceil(new_tat - now), 0}
+"""
+
+# Concurrency lease. KEYS: lease zset (lease id -> expiry ms).
+# ARGV: now (ms), max concurrency, lease TTL (ms), lease id.
+# Leases of crashed workers expire after the TTL. Returns 1 if acquired, else 0.
+_ACQUIRE_LEASE_SCRIPT = """
+local now = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[3]), ARGV[4])
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+_SCRIPTS = {
+    name: (source, hashlib.sha1(source.encode()).hexdigest())
+    for name, source in (
+        ("sliding_window", _SLIDING_WINDOW_SCRIPT),
+        ("gcra", _GCRA_SCRIPT),
+        ("acquire_lease", _ACQUIRE_LEASE_SCRIPT),
+    )
+}
+
+
+class RateLimitResult(NamedTuple):
+    """Outcome of one rate-limit check. Times are in seconds."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float
+    retry_after: float
+
+
+def rate_limit_headers(result: RateLimitResult) -> dict[str, str]:
+    """``X-RateLimit-*`` headers for ``result``, plus ``Retry-After`` when it was denied."""
+    headers = {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining),
+        "X-RateLimit-Reset": str(math.ceil(result.reset_after)),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(max(math.ceil(result.retry_after), 1))
+    return headers
+
 
 def normalize_route_path(route_path: str) -> str:
     """
@@ -63,10 +168,18 @@ def request_route_template(request: Request) -> str:
     while the URL still has ``/api/v1``. Prefixes are recovered from the URL
     by substituting ``path_params`` into that inner template.
 
-    Path parameters stay as ``{param}`` so one endpoint shares a single bucket.
+    Path parameters stay as ``{param}`` so one endpoint shares a single bucket. Routes
+    found in the app's ``RouteIndex`` resolve with one lookup; the URL fallback only
+    runs for routes the index cannot place (unknown, or included under two prefixes).
     """
-    url_path = request.url.path
     route = request.scope.get("route")
+    app = request.scope.get("app")
+    if route is not None and app is not None:
+        indexed = get_route_index(app).template_for(route)
+        if indexed is not None:
+            return indexed
+
+    url_path = request.url.path
     template = getattr(route, "path", None)
     if not isinstance(template, str) or not template:
         return url_path
@@ -106,19 +219,68 @@ def match_longest_prefix(route_template: str, rules: list[dict[str, Any]]) -> di
     return matched
 
 
-def collect_route_paths(routes: list[Any], prefix: str = "") -> list[str]:
-    route_paths: list[str] = []
+class _RuleNode:
+    __slots__ = ("children", "rule")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _RuleNode] = {}
+        self.rule: dict[str, Any] | None = None
+
+
+class RuleTrie:
+    """
+    Rules compiled into a trie over ``_``-separated path segments.
+
+    ``match`` returns what ``match_longest_prefix`` would, walking the route template once
+    instead of testing every rule.
+    """
+
+    def __init__(self, rules: list[dict[str, Any]]) -> None:
+        self._root = _RuleNode()
+        for rule in rules:
+            rule_path = rule.get("path")
+            if not isinstance(rule_path, str):
+                continue
+            node = self._root
+            for segment in rule_path.split("_"):
+                node = node.children.setdefault(segment, _RuleNode())
+            node.rule = rule
+
+    def match(self, route_template: str) -> dict[str, Any] | None:
+        matched: dict[str, Any] | None = None
+        node = self._root
+        for segment in route_template.split("_"):
+            next_node = node.children.get(segment)
+            if next_node is None:
+                break
+            node = next_node
+            if node.rule is not None:
+                matched = node.rule
+        return matched
+
+
+def collect_routes(routes: list[Any], prefix: str = "") -> list[tuple[Any, str]]:
+    """Every route object with its full path, including parent router prefixes."""
+    collected: list[tuple[Any, str]] = []
     for route in routes:
         original_router = getattr(route, "original_router", None)
         if original_router is not None:
-            router_prefix = getattr(original_router, "prefix", None) or ""
+            # The include prefix (parent router + ``include_router(prefix=...)``); routes
+            # of the included router already carry that router's own prefix.
+            include_context = getattr(route, "include_context", None)
+            if include_context is not None:
+                router_prefix = getattr(include_context, "prefix", None) or ""
+            else:
+                router_prefix = getattr(original_router, "prefix", None) or ""
             nested_prefix = _join_route_paths(prefix, router_prefix) if router_prefix else prefix
-            route_paths.extend(collect_route_paths(list(original_router.routes), nested_prefix))
+            collected.extend(collect_routes(list(original_router.routes), nested_prefix))
             continue
 
         route_path = getattr(route, "path", None)
         if route_path is not None:
-            route_paths.append(_join_route_paths(prefix, route_path) if prefix else route_path)
+            collected.append(
+                (route, _join_route_paths(prefix, route_path) if prefix else route_path)
+            )
 
         nested_routes = getattr(route, "routes", None)
         if nested_routes:
@@ -128,9 +290,84 @@ def collect_route_paths(routes: list[Any], prefix: str = "") -> list[str]:
                 nested_prefix = (
                     _join_route_paths(prefix, router_prefix) if prefix else router_prefix
                 )
-            route_paths.extend(collect_route_paths(list(nested_routes), nested_prefix))
+            collected.extend(collect_routes(list(nested_routes), nested_prefix))
 
-    return route_paths
+    return collected
+
+
+def collect_route_paths(routes: list[Any], prefix: str = "") -> list[str]:
+    return [route_path for _route, route_path in collect_routes(routes, prefix)]
+
+
+def _routes_version(app: FastAPI) -> tuple[int, int]:
+    # FastAPI bumps a version on every router (included ones too) when routes change.
+    get_version = getattr(app.router, "_get_routes_version", None)
+    return len(app.routes), get_version() if callable(get_version) else 0
+
+
+class RouteIndex:
+    """
+    Sanitized route paths of an app, precomputed so rule paths validate in O(1).
+
+    ``valid_paths`` holds every sanitized route plus each of its ``_``-boundary prefixes,
+    which is exactly what ``is_valid_path`` accepts. ``templates`` maps route objects to
+    their full template; a route reachable under two prefixes maps to ``None``.
+    ``resolve`` matches a raw request path without running the router.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        self.version = _routes_version(app)
+        self.valid_paths: set[str] = set()
+        self.templates: dict[int, str | None] = {}
+        # Keep the routes alive so their ids stay unique while the index is in use.
+        self._routes: list[Any] = []
+        self._matchers: list[tuple[Pattern[str], set[str], Any, str]] = []
+        for route, route_path in collect_routes(list(app.routes)):
+            sanitized = sanitize_path(route_path)
+            self.valid_paths.add(sanitized)
+            for index, char in enumerate(sanitized):
+                if char == "_":
+                    self.valid_paths.add(sanitized[:index])
+            route_id = id(route)
+            if route_id in self.templates and self.templates[route_id] != route_path:
+                self.templates[route_id] = None
+            else:
+                self.templates[route_id] = route_path
+            self._routes.append(route)
+            methods = getattr(route, "methods", None)
+            if methods:
+                self._matchers.append((compile_path(route_path)[0], methods, route, route_path))
+
+    def is_valid(self, sanitized_path: str) -> bool:
+        return sanitized_path in self.valid_paths
+
+    def template_for(self, route: Any) -> str | None:
+        return self.templates.get(id(route))
+
+    def resolve(self, path: str, method: str) -> tuple[Any, str] | None:
+        """The route (and its template) the router would dispatch ``method path`` to."""
+        for regex, methods, route, template in self._matchers:
+            if method in methods and regex.match(path):
+                return route, template
+        return None
+
+
+_route_indexes: "weakref.WeakKeyDictionary[FastAPI, RouteIndex]" = weakref.WeakKeyDictionary()
+
+
+def refresh_route_index(app: FastAPI) -> RouteIndex:
+    """Rebuild the app's route index (startup, or after mutating routers by hand)."""
+    index = RouteIndex(app)
+    _route_indexes[app] = index
+    return index
+
+
+def get_route_index(app: FastAPI) -> RouteIndex:
+    """Return the app's route index, rebuilding it when its routers have changed."""
+    index = _route_indexes.get(app)
+    if index is None or index.version != _routes_version(app):
+        index = refresh_route_index(app)
+    return index
 
 
 def is_valid_path(path: str, app: FastAPI) -> bool:
@@ -142,21 +379,10 @@ def is_valid_path(path: str, app: FastAPI) -> bool:
     - A sanitized path: "api_v1_system_tasks"
 
     Prefix matches are allowed so one rule can group endpoints under the same path.
+    Lookups go through the app's ``RouteIndex``.
     """
-    all_routes_sanitized = [
-        sanitize_path(route_path) for route_path in collect_route_paths(app.routes)
-    ]
-
-    if path.startswith("/"):
-        path_to_check = sanitize_path(path)
-    else:
-        path_to_check = path
-
-    for sanitized_route in all_routes_sanitized:
-        if path_to_check == sanitized_route or sanitized_route.startswith(path_to_check + "_"):
-            return True
-
-    return False
+    path_to_check = sanitize_path(path) if path.startswith("/") else path
+    return get_route_index(app).is_valid(path_to_check)
 
 
 def caller_identifier(request: Request, trust_proxy_headers: bool) -> str | None:
@@ -182,17 +408,333 @@ def caller_identifier(request: Request, trust_proxy_headers: bool) -> str | None
     return None
 
 
-async def is_rate_limited(
+def _route_query_default(request: Request, name: str) -> Any:
+    route = request.scope.get("route")
+    for param in getattr(getattr(route, "dependant", None), "query_params", ()):
+        if param.name == name:
+            return param.default
+    return None
+
+
+def request_cost(request: Request, rule: dict[str, Any] | None) -> int:
+    """
+    Units of a rule's ``limit`` that ``request`` consumes; at least 1.
+
+    - ``fixed``: the rule's ``cost``.
+    - ``items_per_page``: ``cost`` times the requested page size, or the route's
+      default page size when the query omits it.
+    - ``body_kib``: ``cost`` times the ``Content-Length`` in KiB, rounded up.
+
+    Requests without a matching rule cost 1. Values that cannot be read as a
+    non-negative integer count as a single unit.
+    """
+    if not rule:
+        return 1
+    cost = max(int(rule.get("cost", 1)), 1)
+    basis = rule.get("cost_basis", RateLimitCostBasis.fixed)
+
+    if basis == RateLimitCostBasis.items_per_page:
+        units = request.query_params.get("items_per_page")
+        if units is None:
+            units = _route_query_default(request, "items_per_page")
+    elif basis == RateLimitCostBasis.body_kib:
+        units = request.headers.get("content-length")
+        units = math.ceil(int(units) / 1024) if units and units.isdigit() else None
+    else:
+        return cost
+
+    try:
+        return cost * max(int(units), 1)
+    except (TypeError, ValueError):
+        return cost
+
+
+async def load_rate_limit_scripts() -> None:
+    """Preload the Lua scripts so checks only ever send EVALSHA."""
+    if client is None:
+        return
+    for source, _sha in _SCRIPTS.values():
+        await client.script_load(source)
+
+
+async def _run_script(name: str, keys: list[str], args: list[Any]) -> list[Any]:
+    assert client is not None
+    source, sha = _SCRIPTS[name]
+    try:
+        return await client.evalsha(sha, len(keys), *keys, *args)
+    except NoScriptError:
+        # The server lost its script cache (restart, SCRIPT FLUSH, failover).
+        await client.script_load(source)
+        return await client.evalsha(sha, len(keys), *keys, *args)
+
+
+def _script_result(limit: int, reply: list[Any]) -> RateLimitResult:
+    allowed, remaining, reset_ms, retry_ms = (int(value) for value in reply)
+    return RateLimitResult(
+        allowed=bool(allowed),
+        limit=limit,
+        remaining=max(remaining, 0),
+        reset_after=reset_ms / 1000,
+        retry_after=retry_ms / 1000,
+    )
+
+
+async def _fixed_window(
+    key_base: str, limit: int, period: int, now: float, cost: int
+) -> RateLimitResult:
+    current_timestamp = int(now)
+    window_start = current_timestamp - (current_timestamp % period)
+    pipe = client.pipeline()  # type: ignore[union-attr]
+    pipe.incrby(f"{key_base}:{window_start}", cost)
+    pipe.expire(f"{key_base}:{window_start}", period, nx=True)
+    incr_result, _expire_result = await pipe.execute()
+    current_count = int(incr_result)
+    reset_after = window_start + period - now
+    allowed = current_count <= limit
+    return RateLimitResult(
+        allowed=allowed,
+        limit=limit,
+        remaining=max(limit - current_count, 0),
+        reset_after=reset_after,
+        retry_after=0.0 if allowed else reset_after,
+    )
+
+
+async def _sliding_window(
+    key_base: str, limit: int, period: int, now: float, cost: int
+) -> RateLimitResult:
+    window = math.floor(now / period)
+    reply = await _run_script(
+        "sliding_window",
+        [f"{key_base}:sw:{window}", f"{key_base}:sw:{window - 1}"],
+        [limit, period, now - window * period, cost],
+    )
+    return _script_result(limit, reply)
+
+
+async def _gcra(key_base: str, limit: int, period: int, now: float, cost: int) -> RateLimitResult:
+    if limit <= 0:
+        return RateLimitResult(False, limit, 0, float(period), float(period))
+    reply = await _run_script(
+        "gcra", [f"{key_base}:gcra"], [limit, period * 1000, now * 1000, cost]
+    )
+    return _script_result(limit, reply)
+
+
+_CHECKS = {
+    "fixed_window": _fixed_window,
+    "sliding_window": _sliding_window,
+    "gcra": _gcra,
+}
+
+
+class _LocalBucket:
+    __slots__ = ("key", "period", "window_end", "synced", "pending")
+
+    def __init__(self, key: str, period: int, window_end: float) -> None:
+        self.key = key
+        self.period = period
+        self.window_end = window_end
+        # Last window count read back from Redis (every worker's requests).
+        self.synced = 0
+        # Requests this worker admitted that Redis has not seen yet.
+        self.pending = 0
+
+
+class LocalRateLimiter:
+    """
+    Approximate fixed-window limiting that admits most requests without touching Redis.
+
+    Each worker counts admitted requests per window key in memory and adds them to the
+    shared Redis counter in one pipeline, either every ``RATE_LIMIT_SYNC_INTERVAL``
+    seconds (``sync``) or as soon as ``local_batch`` units are pending for a key. A
+    worker therefore never holds more than ``local_batch`` (plus one request's cost)
+    unsynced units per key, which bounds how far the global limit can be exceeded per
+    worker. Callers that are over the last known count are rejected from memory.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, _LocalBucket] = {}
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def check(
+        self, key_base: str, limit: int, period: int, local_batch: int, now: float, cost: int = 1
+    ) -> RateLimitResult:
+        window_start = int(now) - (int(now) % period)
+        key = f"{key_base}:{window_start}"
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _LocalBucket(key, period, window_start + period)
+        reset_after = bucket.window_end - now
+
+        if bucket.synced + bucket.pending + cost > limit:
+            return RateLimitResult(False, limit, 0, reset_after, reset_after)
+
+        bucket.pending += cost
+        if bucket.pending >= local_batch:
+            await self._flush([bucket])
+
+        used = bucket.synced + bucket.pending
+        allowed = used <= limit
+        return RateLimitResult(
+            allowed=allowed,
+            limit=limit,
+            remaining=max(limit - used, 0),
+            reset_after=reset_after,
+            retry_after=0.0 if allowed else reset_after,
+        )
+
+    async def sync(self, now: float) -> None:
+        """Flush every pending count in one pipeline and forget finished windows."""
+        await self._flush([bucket for bucket in self._buckets.values() if bucket.pending])
+        for key, bucket in list(self._buckets.items()):
+            if bucket.window_end <= now and not bucket.pending:
+                del self._buckets[key]
+
+    async def _flush(self, buckets: list[_LocalBucket]) -> None:
+        if not buckets or client is None:
+            return
+        batch = [(bucket, bucket.pending) for bucket in buckets]
+        pipe = client.pipeline(transaction=False)
+        for bucket, count in batch:
+            # Detach before awaiting so requests admitted meanwhile are not flushed twice.
+            bucket.pending -= count
+            pipe.incrby(bucket.key, count)
+            pipe.expire(bucket.key, bucket.period, nx=True)
+        try:
+            replies = await pipe.execute()
+        except Exception:
+            for bucket, count in batch:
+                bucket.pending += count
+            raise
+        for (bucket, _count), total in zip(batch, replies[::2], strict=True):
+            bucket.synced = max(bucket.synced, int(total))
+
+
+class ConcurrencyLease(NamedTuple):
+    key: str
+    lease_id: str
+
+
+class ConcurrencyLimiter:
+    """
+    Redis semaphore capping simultaneous in-flight requests per key.
+
+    Each holder is a member of a sorted set scored by its lease expiry, so a worker
+    that dies mid-request frees its slot after ``lease_ttl`` seconds. Workers also
+    count their own holders: one that already holds ``max_concurrency`` leases for a
+    key rejects further requests without asking Redis.
+    """
+
+    def __init__(self) -> None:
+        self._held: dict[str, int] = {}
+
+    def held(self, key: str) -> int:
+        return self._held.get(key, 0)
+
+    def _release_local(self, key: str) -> None:
+        held = self._held.get(key, 0) - 1
+        if held > 0:
+            self._held[key] = held
+        else:
+            self._held.pop(key, None)
+
+    async def acquire(
+        self, key: str, max_concurrency: int, lease_ttl: float
+    ) -> ConcurrencyLease | None:
+        if self.held(key) >= max_concurrency:
+            return None
+        # Count the slot before awaiting so concurrent acquirers in this worker see it.
+        self._held[key] = self.held(key) + 1
+        lease_id = uuid4().hex
+        try:
+            acquired = await _run_script(
+                "acquire_lease",
+                [key],
+                [int(time.time() * 1000), max_concurrency, int(lease_ttl * 1000), lease_id],
+            )
+        except Exception:
+            self._release_local(key)
+            raise
+        if not int(acquired):
+            self._release_local(key)
+            return None
+        return ConcurrencyLease(key, lease_id)
+
+    async def release(self, lease: ConcurrencyLease) -> None:
+        self._release_local(lease.key)
+        if client is not None:
+            await client.zrem(lease.key, lease.lease_id)
+
+
+local_rate_limiter = LocalRateLimiter()
+concurrency_limiter = ConcurrencyLimiter()
+sync_task: asyncio.Task | None = None
+
+
+async def _sync_local_counts(interval: float) -> None:
+    """Flush locally admitted requests to Redis every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await local_rate_limiter.sync(time.time())
+        except Exception as e:
+            # Counts stay pending and are retried on the next tick.
+            logger_redis.warning(f"Rate limit local sync failed: {e}")
+
+
+async def start_local_sync(interval: float) -> None:
+    global sync_task
+    if client is None or sync_task is not None:
+        return
+    sync_task = asyncio.create_task(_sync_local_counts(interval))
+
+
+async def stop_local_sync() -> None:
+    global sync_task
+    if sync_task is None:
+        return
+    sync_task.cancel()
+    try:
+        await sync_task
+    except asyncio.CancelledError:
+        pass
+    sync_task = None
+    try:
+        await local_rate_limiter.sync(time.time())
+    except Exception as e:
+        logger_redis.warning(f"Rate limit local sync failed on shutdown: {e}")
+
+
+async def check_rate_limit(
     app: FastAPI,
     user_id: int | str,
     path: str,
     limit: int,
     period: int,
-) -> bool:
+    algorithm: str = "fixed_window",
+    local_batch: int = 0,
+    cost: int = 1,
+) -> RateLimitResult | None:
     """
-    Check if the user with the given ID is rate limited for the specified path.
+    Count one request for ``user_id`` on ``path`` and report the remaining quota.
 
     ``path`` is a sanitized route template or a matching rule path used as the Redis key.
+    ``algorithm`` is one of ``ALGORITHMS``:
+
+    - ``fixed_window``: ``INCR`` + ``EXPIRE NX`` per ``period`` window (allows up to 2x
+      ``limit`` across a window boundary).
+    - ``sliding_window``: weighted current + previous window counters, no boundary burst.
+    - ``gcra``: token bucket that refills one request every ``period / limit`` seconds.
+
+    Each check is a single round trip (a pipeline or one ``EVALSHA``). With
+    ``local_batch > 1`` the check is answered by ``local_rate_limiter`` instead: fixed
+    windows whatever ``algorithm`` is, usually no I/O, and at most ``local_batch``
+    requests per worker over ``limit``. The request consumes ``cost`` units of ``limit``
+    (see ``request_cost``). Returns ``None`` when ``path`` is not a route of ``app``
+    (nothing is counted).
     """
     if client is None:
         logger_redis.error("Redis client is not initialized.")
@@ -200,26 +742,157 @@ async def is_rate_limited(
 
     if period < 1:
         raise ValueError("Rate limit period must be at least 1 second")
-
-    current_timestamp = int(datetime.now(UTC).timestamp())
-    window_start = current_timestamp - (current_timestamp % period)
+    if algorithm not in _CHECKS:
+        raise ValueError(f"Unknown rate limit algorithm '{algorithm}'")
+    if cost < 1:
+        raise ValueError("Rate limit cost must be at least 1")
 
     user_id = str(user_id)
 
     if not is_valid_path(path=path, app=app):
         logger_api.warning(f"Rate limit check for user_id '{user_id}' on invalid route '{path}'")
-        return False
+        return None
 
     sanitized_path = sanitize_path(path) if path.startswith("/") else path
-    key = f"ratelimit:{user_id}:{sanitized_path}:{window_start}"
+    key_base = f"ratelimit:{user_id}:{sanitized_path}"
 
     try:
-        pipe = client.pipeline()
-        pipe.incr(key)
-        pipe.expire(key, period, nx=True)
-        incr_result, _expire_result = await pipe.execute()
-        current_count = int(incr_result)
-        return current_count > limit
+        if local_batch > 1:
+            return await local_rate_limiter.check(
+                key_base, limit, period, local_batch, time.time(), cost
+            )
+        return await _CHECKS[algorithm](key_base, limit, period, time.time(), cost)
     except Exception as e:
         logger_redis.exception(f"Error checking rate limit for user {user_id} on path {path}: {e}")
         raise
+
+
+def _sliding_window_usage(
+    limit: int, period: int, elapsed: float, previous: int, current: int
+) -> RateLimitResult:
+    # Mirrors _SLIDING_WINDOW_SCRIPT without counting a request.
+    estimate = previous * (period - elapsed) / period + current
+    reset_after = period - elapsed
+    allowed = estimate + 1 <= limit
+    retry_after = 0.0
+    if not allowed:
+        retry_after = reset_after
+        if previous > 0 and current + 1 <= limit:
+            retry_after = reset_after - (limit - current - 1) * period / previous
+    return RateLimitResult(
+        allowed, limit, max(math.floor(limit - estimate), 0), reset_after, max(retry_after, 0.0)
+    )
+
+
+def _gcra_usage(limit: int, period: int, now: float, tat: float | None) -> RateLimitResult:
+    # Mirrors _GCRA_SCRIPT without counting a request.
+    if limit <= 0:
+        return RateLimitResult(False, limit, 0, float(period), float(period))
+    interval = period / limit
+    tat = max(tat or now, now)
+    allow_at = tat + interval - period
+    remaining = min(max(math.floor((period - (tat - now)) / interval), 0), limit)
+    return RateLimitResult(now >= allow_at, limit, remaining, tat - now, max(allow_at - now, 0.0))
+
+
+async def get_rate_limit_usage(
+    user_id: int | str,
+    rules: list[dict[str, Any]],
+    algorithm: str = "fixed_window",
+) -> list[RateLimitResult]:
+    """
+    Current quota of ``user_id`` under each rule, without counting a request.
+
+    ``rules`` carry sanitized ``path``, ``limit``, ``period`` and optionally
+    ``local_batch``. Every counter is read with a single ``MGET``. Requests a worker
+    has admitted locally but not synced yet are not included.
+    """
+    if client is None:
+        logger_redis.error("Redis client is not initialized.")
+        raise MissingClientError("Redis client is not initialized.")
+    if algorithm not in _CHECKS:
+        raise ValueError(f"Unknown rate limit algorithm '{algorithm}'")
+
+    now = time.time()
+    keys: list[str] = []
+    plans: list[tuple[str, int, int, float]] = []
+    for rule in rules:
+        key_base = f"ratelimit:{user_id}:{rule['path']}"
+        limit, period = int(rule["limit"]), int(rule["period"])
+        mode = "fixed_window" if rule.get("local_batch", 0) > 1 else algorithm
+        if mode == "fixed_window":
+            window_start = int(now) - (int(now) % period)
+            keys.append(f"{key_base}:{window_start}")
+            plans.append((mode, limit, period, window_start + period - now))
+        elif mode == "sliding_window":
+            window = math.floor(now / period)
+            keys.extend([f"{key_base}:sw:{window}", f"{key_base}:sw:{window - 1}"])
+            plans.append((mode, limit, period, now - window * period))
+        else:
+            keys.append(f"{key_base}:gcra")
+            plans.append((mode, limit, period, now))
+
+    values = iter(await client.mget(keys) if keys else [])
+    usage: list[RateLimitResult] = []
+    for mode, limit, period, offset in plans:
+        if mode == "fixed_window":
+            count = int(next(values) or 0)
+            allowed = count < limit
+            usage.append(
+                RateLimitResult(
+                    allowed, limit, max(limit - count, 0), offset, 0.0 if allowed else offset
+                )
+            )
+        elif mode == "sliding_window":
+            current, previous = int(next(values) or 0), int(next(values) or 0)
+            usage.append(_sliding_window_usage(limit, period, offset, previous, current))
+        else:
+            tat = next(values)
+            usage.append(_gcra_usage(limit, period, now, float(tat) / 1000 if tat else None))
+    return usage
+
+
+async def acquire_concurrency_lease(
+    user_id: int | str, path: str, max_concurrency: int, lease_ttl: float
+) -> ConcurrencyLease | None:
+    """
+    Take one of ``max_concurrency`` in-flight slots of ``user_id`` on ``path``.
+
+    Returns ``None`` when all slots are taken. Release the lease with
+    ``release_concurrency_lease`` when the request finishes; ``lease_ttl`` only
+    reclaims slots of requests that never do.
+    """
+    if client is None:
+        logger_redis.error("Redis client is not initialized.")
+        raise MissingClientError("Redis client is not initialized.")
+
+    sanitized_path = sanitize_path(path) if path.startswith("/") else path
+    key = f"ratelimit:{user_id}:{sanitized_path}:inflight"
+    return await concurrency_limiter.acquire(key, max_concurrency, lease_ttl)
+
+
+async def release_concurrency_lease(lease: ConcurrencyLease) -> None:
+    try:
+        await concurrency_limiter.release(lease)
+    except Exception as e:
+        # The slot frees itself when the lease expires.
+        logger_redis.warning(f"Could not release concurrency lease {lease.key}: {e}")
+
+
+async def is_rate_limited(
+    app: FastAPI,
+    user_id: int | str,
+    path: str,
+    limit: int,
+    period: int,
+    algorithm: str = "fixed_window",
+    local_batch: int = 0,
+    cost: int = 1,
+) -> bool:
+    """
+    Check if the user with the given ID is rate limited for the specified path.
+
+    See ``check_rate_limit`` for ``path``, ``algorithm``, ``local_batch`` and ``cost``.
+    """
+    result = await check_rate_limit(app, user_id, path, limit, period, algorithm, local_batch, cost)
+    return result is not None and not result.allowed
@@ -1,8 +1,15 @@
 # Built-in Dependencies
-from typing import Any, List, Type, Union, Optional
+from typing import Any, Iterator, List, Sequence, Tuple, Type, Union, Optional
+import binascii
+import base64
+import json
 
 # Third-Party Dependencies
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import ClauseElement
 from sqlalchemy.sql.elements import Label
 from sqlalchemy.sql import ColumnElement
 from sqlalchemy.sql.schema import Column
@@ -11,6 +18,7 @@ from pydantic import BaseModel
 
 # Local Dependencies
 from src.core.common.models import Base
+from src.core.exceptions.repository_exceptions import InvalidCursorError
 
 
 def _extract_matching_columns_from_schema(
@@ -132,3 +140,64 @@ def _add_column_with_prefix(column: Column, prefix: Optional[str]) -> Label:
     """
     column_label = f"{prefix}{column.name}" if prefix else column.name
     return column.label(column_label)
+
+
+def _chunked(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    """Consecutive slices of ``items`` with at most ``size`` elements each."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _encode_cursor(keys: List[Tuple[str, str]], values: List[Any]) -> str:
+    """
+    Opaque keyset cursor: the sort ``keys`` it was issued for and the last row's
+    ``values`` for them, as unpadded URL-safe base64 JSON.
+    """
+    payload = json.dumps({"k": keys, "v": values}, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, keys: List[Tuple[str, str]]) -> List[Any]:
+    """
+    Values carried by ``cursor``, still JSON-typed.
+
+    Raises ``InvalidCursorError`` if the cursor is malformed or was issued for other
+    sort ``keys``.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        issued_for = payload["k"]
+        values = payload["v"]
+        if not isinstance(issued_for, list) or not isinstance(values, list):
+            raise TypeError("Cursor keys and values must be lists.")
+        if not all(isinstance(key, list) and len(key) == 2 for key in issued_for):
+            raise TypeError("Cursor keys must be (field, direction) pairs.")
+        matches = [tuple(key) for key in issued_for] == [tuple(key) for key in keys]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError() from e
+
+    if not matches or len(values) != len(keys):
+        raise InvalidCursorError("Pagination cursor does not match the sort order.")
+    return values
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _plan_rows(plan: Any) -> int:
+    """Row estimate of the top node of an ``EXPLAIN (FORMAT JSON)`` result."""
+    if isinstance(plan, (str, bytes)):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -38,6 +38,7 @@ app = Celery(
     broker=str(settings.REDIS_BROKER_URL),
     backend=str(settings.POSTGRES_CELERY_URI),
     include=[
+        "src.apps.system.auth.tasks",
         "src.apps.system.tasks.tasks",
         "src.apps.system.users.tasks",
     ],
@@ -112,6 +113,11 @@ app.conf.beat_schedule = {
         "schedule": 30.0,
         "options": {"queue": "default"},
     },
+    "purge-expired-token-blacklist": {
+        "task": "purge_expired_token_blacklist",
+        "schedule": settings.TOKEN_BLACKLIST_PURGE_INTERVAL,
+        "options": {"queue": "default"},
+    },
 }
 
 
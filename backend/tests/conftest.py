@@ -264,7 +264,7 @@ async def client():
     await run_seed_scripts()
 
     cache.pool = aioredis.ConnectionPool.from_url(
-        app_settings.REDIS_CACHE_URL, encoding="utf8", decode_responses=True
+        app_settings.REDIS_CACHE_URL, encoding="utf8", decode_responses=False
     )
     cache.client = aioredis.Redis.from_pool(cache.pool)  # type: ignore
 